@@ -6,17 +6,25 @@ CSV files, run selected EDA analyses, display results, and export
 them as a PDF.
 """
 
-import uuid
 from types import ModuleType
-from typing import List, cast
+from typing import List, Union, cast
 
-import pandas as pd
 import streamlit as stream  # type: ignore
 
-from eda.analyze import analyzer
-from eda.display import display
+from eda.analysis.group_by import GroupBySpec
+from eda.analysis_base import numeric_labels
+from eda.config import (
+    CHUNK_ROWS,
+    HISTOGRAM_BINS,
+    HISTOGRAM_RESOLUTION,
+    QUANTILE_RANK_ERROR,
+)
+from eda.display import display, display_jobs
+from eda.ingest import ChunkedFrame
+from eda.jobs import Job, attach_estimate, submit
+from eda.loader import UploadSource, release_dataset, upload_key
+from eda.result_store import ResultStore
 from eda.saver import saver
-from eda.types import ResultItem
 
 
 def main(st: ModuleType) -> None:
@@ -27,8 +35,14 @@ def main(st: ModuleType) -> None:
         st: Streamlit module instance used to render the UI.
 
     Side Effects:
-        - Reads uploaded CSV files.
-        - Mutates ``st.session_state`` to store analysis results.
+        - Reads uploaded CSV files, parsing each distinct upload once and
+          only the columns an analysis needs until a full load is required.
+        - Runs analyses on a background worker pool, first showing
+          estimates from a sample in sampling mode.
+        - Refreshes analyses of uploads extending an earlier upload from
+          the appended rows in incremental mode.
+        - Mutates ``st.session_state`` to store pending jobs and results,
+          cancelling and dropping both when the upload is removed.
         - Renders interactive UI components.
     """
 
@@ -46,23 +60,68 @@ def main(st: ModuleType) -> None:
     # Session state initialization (Pylance-safe)
     # -------------------------------------------------
 
-    results = cast(
-        List[ResultItem],
-        st.session_state.setdefault("results", []),
+    if "results" not in st.session_state:
+        st.session_state.results = ResultStore()
+
+    results = cast(ResultStore, st.session_state.results)
+
+    jobs = cast(
+        List[Job],
+        st.session_state.setdefault("jobs", []),
     )
 
     if "open_save" not in st.session_state:
         st.session_state.open_save = False
 
     if uploaded_file is None:
+        for job in jobs:
+            job.cancel()
+
+        jobs.clear()
         results.clear()
+        release_dataset(st)
         st.session_state.open_save = False
         return
 
     # -------------------------------------------------
     # Data loading
     # -------------------------------------------------
-    df = pd.read_csv(uploaded_file)  # type: ignore
+    streaming = st.sidebar.checkbox(
+        "Streaming mode",
+        help="Read the upload in bounded chunks instead of loading it at once.",
+    )
+
+    df: Union[UploadSource, ChunkedFrame]
+
+    if streaming:
+        chunk_rows = st.sidebar.number_input(
+            "Rows per chunk",
+            min_value=1_000,
+            value=CHUNK_ROWS,
+            step=10_000,
+        )
+        df = ChunkedFrame(uploaded_file, chunk_rows=int(chunk_rows))
+    else:
+        df = UploadSource(st, uploaded_file)
+
+    sampling = st.sidebar.checkbox(
+        "Sampling mode",
+        help=(
+            "Show estimates from a random sample within a second, then "
+            "replace them with exact results computed in the background."
+        ),
+    )
+
+    incremental = st.sidebar.checkbox(
+        "Incremental refresh",
+        help=(
+            "Keep partial aggregates of the mean, missing-data, shape, "
+            "unique and value-count analyses, so that a later upload with "
+            "rows appended to this file only processes the new rows."
+        ),
+    )
+
+    dataset_key = upload_key(st, uploaded_file)
 
     # -------------------------------------------------
     # Analysis selection
@@ -78,6 +137,14 @@ def main(st: ModuleType) -> None:
             "missing_data",
             "unique",
             "value_counts",
+            "profile",
+            "approx_unique",
+            "approx_value_counts",
+            "approx_describe",
+            "pearson_correlation",
+            "spearman_correlation",
+            "histogram",
+            "group_by",
         ],
         index=None,
         placeholder="Type to search analysis…",
@@ -85,41 +152,102 @@ def main(st: ModuleType) -> None:
 
     preview_rows = None
     selected_column = None
+    rank_error = None
+    pair_count = None
+    bin_count = None
+    group_spec = None
 
     if analysis == "preview":
         preview_rows = st.sidebar.number_input(
             "Rows to display",
             min_value=1,
-            max_value=len(df),
             value=5,
         )
 
-    elif analysis == "value_counts":
+    elif analysis in ("value_counts", "approx_value_counts"):
         selected_column = st.sidebar.selectbox(
             "Select column",
             options=df.columns,
         )
 
+    elif analysis == "approx_describe":
+        rank_error = st.sidebar.number_input(
+            "Quantile rank error",
+            min_value=0.001,
+            max_value=0.1,
+            value=QUANTILE_RANK_ERROR,
+            step=0.001,
+            format="%.3f",
+        )
+
+    elif analysis in ("pearson_correlation", "spearman_correlation"):
+        pair_count = st.sidebar.number_input(
+            "Strongest pairs to list",
+            min_value=0,
+            value=0,
+            help="Set to 0 for the full correlation matrix.",
+        )
+
+    elif analysis == "histogram":
+        bin_count = st.sidebar.number_input(
+            "Bins per column",
+            min_value=1,
+            max_value=HISTOGRAM_RESOLUTION,
+            value=HISTOGRAM_BINS,
+        )
+
+    elif analysis == "group_by":
+        keys = st.sidebar.multiselect("Group by", options=df.columns)
+        functions = st.sidebar.multiselect(
+            "Aggregations",
+            options=["count", "sum", "mean", "min", "max"],
+            default=["mean"],
+        )
+        numeric_only = bool({"sum", "mean"} & set(functions))
+        values = st.sidebar.multiselect(
+            "Aggregate columns",
+            options=numeric_labels(df.dtypes) if numeric_only else df.columns,
+            help="Only numeric columns can be summed or averaged.",
+        )
+
+        if keys:
+            group_spec = GroupBySpec(
+                keys=tuple(keys),
+                aggregations=tuple((c, f) for c in values for f in functions),
+            )
+        else:
+            st.sidebar.warning("Choose at least one column to group by.")
+
     # -------------------------------------------------
     # Run analysis
     # -------------------------------------------------
-    if st.sidebar.button("Analyze") and analysis:
+    incomplete = analysis == "group_by" and group_spec is None
+
+    if st.sidebar.button("Analyze", disabled=incomplete) and analysis:
         st.session_state.open_save = False
 
-        title, result = analyzer(
+        n = (
+            preview_rows
+            or selected_column
+            or rank_error
+            or pair_count
+            or bin_count
+            or group_spec
+        )
+        job = submit(
             analysis=analysis,
             data=df,
-            n=preview_rows or selected_column,
+            n=n,
+            key=dataset_key,
+            incremental=incremental,
         )
 
-        
-        results.append(
-            {
-                "id": str(uuid.uuid4()),
-                "title": title,
-                "df": result,
-            }
-        )
+        if sampling:
+            attach_estimate(job, data=df, n=n, results=results)
+
+        jobs.append(job)
+
+    display_jobs(st=st, jobs=jobs, results=results)
 
     # -------------------------------------------------
     # Save / Display
@@ -133,6 +261,12 @@ def main(st: ModuleType) -> None:
         ):
             st.session_state.open_save = True
 
+    usage = results.stats()
+    st.sidebar.caption(
+        f"Results: {usage['memory_bytes'] / 1024**2:.1f} MB in memory, "
+        f"{usage['disk_bytes'] / 1024**2:.1f} MB on disk"
+    )
+
     display(st=st, results=results)
     saver(st=st, results=results)
 
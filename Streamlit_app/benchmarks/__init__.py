@@ -0,0 +1,8 @@
+"""
+Performance benchmarks for the EDA package.
+
+Run ``python -m benchmarks.run`` from the application directory to time
+and memory-profile every registered analysis and the PDF export on
+synthetic datasets. Results are written as JSON and can be compared
+against a baseline from an earlier commit to catch regressions.
+"""
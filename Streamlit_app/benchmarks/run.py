@@ -0,0 +1,421 @@
+"""
+Benchmark runner for EDA analyses and the PDF export.
+
+For every synthetic dataset in the requested grid, this module times
+each analysis registered in ``ANALYZE`` on each requested engine, and
+the PDF export of a large result table. Wall and CPU times are taken
+over several repeats after a warm-up run; peak Python allocation is
+measured in a separate run under ``tracemalloc``, so tracing does not
+distort the timings.
+
+Results are written as JSON together with the commit and library
+versions. Given a baseline file from an earlier run, the runner lists
+benchmarks whose median wall time or peak allocation grew by more than
+a threshold and exits with status 1, so regressions can fail a build.
+
+Usage:
+    python -m benchmarks.run --rows 10000 1000000 --output current.json
+    python -m benchmarks.run --baseline main.json --threshold 0.25
+"""
+
+import argparse
+import datetime
+import io
+import itertools
+import json
+import platform
+import statistics
+import subprocess
+import sys
+import time
+import tracemalloc
+import uuid
+from typing import Any, Callable, Dict, List, Optional, Sequence
+
+import numpy as np
+import pandas as pd
+import pyarrow as pa  # type: ignore[import-not-found]
+
+from eda.analysis.group_by import GroupBySpec
+from eda.analyze import ANALYZE
+from eda.config import EXPORT_MAX_ROWS
+from eda.downloader import merge_fragments, render_fragments
+from eda.engines import ENGINES
+
+from .generators import DTYPES, FrameSpec, synthetic_frame
+
+SCHEMA_VERSION = 1
+
+# Baseline medians below these values are too noisy to compare.
+MIN_COMPARED_SECONDS = 0.005
+MIN_COMPARED_BYTES = 1024**2
+
+
+def analysis_parameter(analysis: str, df: pd.DataFrame) -> Any:
+    """
+    Return the ``n`` argument an analysis is benchmarked with.
+
+    Args:
+        analysis: Identifier of the analysis.
+        df: Benchmark dataset.
+
+    Returns:
+        The preview row count, the column counted by value-count
+        analyses, the grouping of the group-by analysis, or ``None``.
+    """
+
+    if analysis == "preview":
+        return 5
+
+    if analysis in ("value_counts", "approx_value_counts"):
+        return df.columns[-1]
+
+    if analysis == "group_by":
+        return GroupBySpec(
+            keys=(df.columns[-1],), aggregations=((df.columns[0], "count"),)
+        )
+
+    return None
+
+
+def measure(fn: Callable[[], Any], repeats: int) -> Dict[str, Any]:
+    """
+    Time a callable and measure its peak Python allocation.
+
+    Args:
+        fn: Benchmarked callable.
+        repeats: Number of timed runs after one warm-up run.
+
+    Returns:
+        Wall time statistics, median CPU time and peak traced bytes.
+    """
+
+    fn()
+
+    walls: List[float] = []
+    cpus: List[float] = []
+
+    for _ in range(repeats):
+        wall, cpu = time.perf_counter(), time.process_time()
+        fn()
+        walls.append(time.perf_counter() - wall)
+        cpus.append(time.process_time() - cpu)
+
+    tracemalloc.start()
+
+    try:
+        fn()
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    return {
+        "wall_s": {
+            "min": min(walls),
+            "median": statistics.median(walls),
+            "max": max(walls),
+        },
+        "cpu_s": statistics.median(cpus),
+        "peak_bytes": peak,
+    }
+
+
+def export_pdf(df: pd.DataFrame) -> None:
+    """
+    Render and merge an uncached, encrypted PDF of two results.
+
+    Args:
+        df: Result table rendered alongside its ``describe`` output.
+    """
+
+    results = [
+        {"id": str(uuid.uuid4()), "title": "data", "df": df},
+        {"id": str(uuid.uuid4()), "title": "describe", "df": df.describe()},
+    ]
+    fragments = render_fragments(results, max_rows=EXPORT_MAX_ROWS)
+    merge_fragments(fragments, io.BytesIO(), password="benchmark", protect=True)
+
+
+def run_case(
+    name: str,
+    engine: Optional[str],
+    spec: FrameSpec,
+    fn: Callable[[], Any],
+    repeats: int,
+) -> Dict[str, Any]:
+    """
+    Benchmark one callable and describe the result as a record.
+
+    Failures are recorded rather than raised, so one failing benchmark
+    does not abort the run.
+
+    Args:
+        name: Benchmark identifier, e.g. ``"analysis/mean"``.
+        engine: Engine the analysis ran on, if any.
+        spec: Dataset parameters.
+        fn: Benchmarked callable.
+        repeats: Number of timed runs.
+
+    Returns:
+        A JSON-serialisable result record.
+    """
+
+    record: Dict[str, Any] = {
+        "benchmark": name,
+        "engine": engine,
+        "dataset": spec.name,
+        "spec": spec.as_dict(),
+        "repeats": repeats,
+    }
+
+    try:
+        record.update(measure(fn, repeats))
+    except Exception as error:
+        record["error"] = f"{type(error).__name__}: {error}"
+
+    return record
+
+
+def run_benchmarks(
+    specs: Sequence[FrameSpec],
+    analyses: Sequence[str],
+    engines: Sequence[str],
+    repeats: int,
+    pdf: bool,
+) -> List[Dict[str, Any]]:
+    """
+    Run every requested benchmark on every dataset.
+
+    Args:
+        specs: Dataset parameters.
+        analyses: Identifiers of the analyses to benchmark.
+        engines: Names of the engines to run the analyses on.
+        repeats: Number of timed runs per benchmark.
+        pdf: Whether to benchmark the PDF export.
+
+    Returns:
+        One result record per benchmark, dataset and engine.
+    """
+
+    records = []
+
+    for spec in specs:
+        df = synthetic_frame(spec)
+
+        for engine_name, analysis in itertools.product(engines, analyses):
+            engine, analysis_cls = ENGINES[engine_name], ANALYZE[analysis]
+            n = analysis_parameter(analysis, df)
+
+            record = run_case(
+                f"analysis/{analysis}",
+                engine_name,
+                spec,
+                lambda: engine.run(analysis_cls, df, n),
+                repeats,
+            )
+            records.append(record)
+            report(record)
+
+        if pdf:
+            record = run_case("export/pdf", None, spec, lambda: export_pdf(df), repeats)
+            records.append(record)
+            report(record)
+
+    return records
+
+
+def report(record: Dict[str, Any]) -> None:
+    """Print a one-line summary of a result record to stderr."""
+
+    label = f"{record['benchmark']:<32} {record['engine'] or '-':<8} "
+    label += f"{record['dataset']:<48}"
+
+    if "error" in record:
+        print(f"{label} ERROR {record['error']}", file=sys.stderr)
+        return
+
+    print(
+        f"{label} {record['wall_s']['median'] * 1000:10.2f} ms "
+        f"{record['peak_bytes'] / 1024**2:9.1f} MB",
+        file=sys.stderr,
+    )
+
+
+def environment() -> Dict[str, Any]:
+    """
+    Describe the code and platform the benchmarks ran on.
+
+    Returns:
+        The commit, timestamp, Python, platform and library versions.
+    """
+
+    try:
+        commit = subprocess.run(
+            ["git", "rev-parse", "HEAD"],
+            capture_output=True,
+            text=True,
+            check=True,
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        commit = None
+
+    return {
+        "schema": SCHEMA_VERSION,
+        "commit": commit,
+        "created": datetime.datetime.now(datetime.timezone.utc).isoformat(),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "packages": {
+            "numpy": np.__version__,
+            "pandas": pd.__version__,
+            "pyarrow": pa.__version__,
+        },
+    }
+
+
+def compare(
+    current: List[Dict[str, Any]],
+    baseline: List[Dict[str, Any]],
+    threshold: float,
+) -> List[str]:
+    """
+    List benchmarks that regressed against a baseline.
+
+    Benchmarks are matched by name, engine and dataset. A benchmark
+    regresses when its median wall time or peak allocation exceeds the
+    baseline's by more than ``threshold``, or when it newly fails.
+
+    Args:
+        current: Result records of this run.
+        baseline: Result records of the baseline run.
+        threshold: Allowed relative growth, e.g. ``0.25`` for 25%.
+
+    Returns:
+        One message per regression.
+    """
+
+    def key(record: Dict[str, Any]) -> tuple:
+        return record["benchmark"], record["engine"], record["dataset"]
+
+    previous = {key(record): record for record in baseline}
+    regressions = []
+
+    for record in current:
+        old = previous.get(key(record))
+
+        if old is None or "error" in old:
+            continue
+
+        name = " ".join(str(part) for part in key(record) if part is not None)
+
+        if "error" in record:
+            regressions.append(f"{name}: now fails with {record['error']}")
+            continue
+
+        wall, old_wall = record["wall_s"]["median"], old["wall_s"]["median"]
+
+        if old_wall >= MIN_COMPARED_SECONDS and wall > old_wall * (1 + threshold):
+            regressions.append(
+                f"{name}: median wall time {old_wall * 1000:.2f} ms -> "
+                f"{wall * 1000:.2f} ms ({wall / old_wall - 1:+.0%})"
+            )
+
+        peak, old_peak = record["peak_bytes"], old["peak_bytes"]
+
+        if old_peak >= MIN_COMPARED_BYTES and peak > old_peak * (1 + threshold):
+            regressions.append(
+                f"{name}: peak allocation {old_peak / 1024**2:.1f} MB -> "
+                f"{peak / 1024**2:.1f} MB ({peak / old_peak - 1:+.0%})"
+            )
+
+    return regressions
+
+
+def parse_args(argv: Optional[Sequence[str]] = None) -> argparse.Namespace:
+    """Parse the command line."""
+
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+
+    parser.add_argument("--rows", type=int, nargs="+", default=[100_000])
+    parser.add_argument("--columns", type=int, nargs="+", default=[10])
+    parser.add_argument(
+        "--dtypes",
+        nargs="+",
+        default=[",".join(DTYPES)],
+        help="Comma-separated column kinds per dataset, from: " + ", ".join(DTYPES),
+    )
+    parser.add_argument("--cardinality", type=int, nargs="+", default=[1_000])
+    parser.add_argument("--null-rate", type=float, nargs="+", default=[0.05])
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument(
+        "--analyses", nargs="+", choices=sorted(ANALYZE), default=list(ANALYZE)
+    )
+    parser.add_argument(
+        "--engines", nargs="+", choices=sorted(ENGINES), default=["pandas"]
+    )
+    parser.add_argument("--repeats", type=int, default=5)
+    parser.add_argument("--no-pdf", action="store_true", help="Skip the PDF export.")
+    parser.add_argument("--output", help="Write results to this JSON file.")
+    parser.add_argument("--baseline", help="Compare against this results file.")
+    parser.add_argument("--threshold", type=float, default=0.25)
+
+    return parser.parse_args(argv)
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    """
+    Run the benchmarks and optionally compare them to a baseline.
+
+    Args:
+        argv: Command-line arguments; defaults to ``sys.argv[1:]``.
+
+    Returns:
+        The process exit status: 1 if any benchmark regressed, else 0.
+    """
+
+    args = parse_args(argv)
+
+    specs = [
+        FrameSpec(
+            rows=rows,
+            columns=columns,
+            dtypes=tuple(dtypes.split(",")),
+            cardinality=cardinality,
+            null_rate=null_rate,
+            seed=args.seed,
+        )
+        for rows, columns, dtypes, cardinality, null_rate in itertools.product(
+            args.rows, args.columns, args.dtypes, args.cardinality, args.null_rate
+        )
+    ]
+    engines = [name for name in args.engines if ENGINES[name].available()]
+
+    document = environment()
+    document["results"] = run_benchmarks(
+        specs, args.analyses, engines, args.repeats, pdf=not args.no_pdf
+    )
+
+    text = json.dumps(document, indent=2)
+
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as output:
+            output.write(text + "\n")
+    else:
+        print(text)
+
+    if not args.baseline:
+        return 0
+
+    with open(args.baseline, encoding="utf-8") as source:
+        baseline = json.load(source)
+
+    regressions = compare(document["results"], baseline["results"], args.threshold)
+
+    for message in regressions:
+        print(f"REGRESSION {message}", file=sys.stderr)
+
+    return 1 if regressions else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
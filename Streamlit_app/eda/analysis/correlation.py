@@ -0,0 +1,631 @@
+"""
+Correlation analyses for EDA.
+
+This module provides Pearson and Spearman correlation matrices of the
+numeric columns. Like ``DataFrame.corr``, each pair of columns is
+correlated over the rows where both are present. The pairwise sums this
+requires are computed as matrix products over blocks of
+``CORRELATION_BLOCK_COLUMNS`` columns and bounded row slices, so every
+product works on cache-sized operands, and the column-block pairs are
+spread over a thread pool, as NumPy releases the GIL in its kernels.
+
+Given a positive ``n``, the analyses return only the ``n`` most strongly
+correlated pairs instead of the full matrix. In-memory frames are then
+reduced block by block, so no ``columns × columns`` array is built.
+"""
+
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from typing import Any, Hashable, Iterator, List, NamedTuple, Optional, Set, Tuple
+
+import numpy as np
+import pandas as pd
+
+from ..analysis_base import AnalysisBase, MergeableAnalysis, numeric_labels
+from ..config import CORRELATION_BLOCK_COLUMNS, CORRELATION_THREADS
+
+# Float values held per operand of one row slice of a block product.
+SLICE_VALUES = 1 << 20
+
+PAIR_COLUMNS = ["Column 1", "Column 2", "Correlation", "Observations"]
+
+EXECUTOR = ThreadPoolExecutor(
+    max_workers=CORRELATION_THREADS, thread_name_prefix="eda-correlation"
+)
+
+
+class BlockMoments(NamedTuple):
+    """
+    Pairwise-complete sums of two column blocks.
+
+    For a left column ``i`` and a right column ``j``, every sum runs over
+    the rows where both are present, of values centred on a per-column
+    shift.
+
+    Attributes:
+        count: Number of rows where both columns are present.
+        sum_left: Sum of the left column.
+        sum_right: Sum of the right column.
+        squares_left: Sum of squares of the left column.
+        squares_right: Sum of squares of the right column.
+        products: Sum of products of both columns.
+    """
+
+    count: np.ndarray
+    sum_left: np.ndarray
+    sum_right: np.ndarray
+    squares_left: np.ndarray
+    squares_right: np.ndarray
+    products: np.ndarray
+
+
+@dataclass
+class CorrelationState:
+    """
+    Partial aggregate for the Pearson correlation analysis.
+
+    The sums of column ``i`` are kept per partner column ``j``, as
+    ``sums[i, j]`` and ``squares[i, j]`` run over the rows where ``j`` is
+    present too.
+
+    Attributes:
+        columns: Column labels in first-seen order.
+        non_numeric: Columns that were non-numeric in at least one chunk.
+        labels: Labels of the numeric columns indexing the arrays.
+        shift: Per-column value the sums are centred on.
+        count: Pairwise count of rows where both columns are present.
+        sums: Pairwise sums of centred values.
+        squares: Pairwise sums of squared centred values.
+        products: Pairwise sums of products of centred values.
+    """
+
+    columns: List[Any] = field(default_factory=list)
+    non_numeric: Set[Any] = field(default_factory=set)
+    labels: List[Any] = field(default_factory=list)
+    shift: np.ndarray = field(default_factory=lambda: np.zeros(0))
+    count: np.ndarray = field(default_factory=lambda: np.zeros((0, 0)))
+    sums: np.ndarray = field(default_factory=lambda: np.zeros((0, 0)))
+    squares: np.ndarray = field(default_factory=lambda: np.zeros((0, 0)))
+    products: np.ndarray = field(default_factory=lambda: np.zeros((0, 0)))
+
+
+def _centred(values: np.ndarray, shift: np.ndarray) -> Tuple[np.ndarray, Any]:
+    """
+    Centre a block and zero its missing values.
+
+    Args:
+        values: Array of shape ``(rows, columns)`` with NaN for nulls.
+        shift: Per-column value subtracted from ``values``.
+
+    Returns:
+        The centred block and a float mask of present values, or
+        ``None`` in place of the mask if no value is missing.
+    """
+
+    missing = np.isnan(values)
+    centred = values - shift
+
+    if not missing.any():
+        return centred, None
+
+    centred[missing] = 0.0
+
+    return centred, (~missing).astype("float64")
+
+
+def block_moments(
+    values: np.ndarray, shift: np.ndarray, left: slice, right: slice
+) -> BlockMoments:
+    """
+    Accumulate the pairwise-complete sums of two column blocks.
+
+    Rows are processed in slices of about ``SLICE_VALUES`` values per
+    block. Every sum is a matrix product of a slice of one block with a
+    slice of the other or its presence mask; slices without missing
+    values reduce to column sums.
+
+    Args:
+        values: Array of shape ``(rows, columns)`` with NaN for nulls.
+        shift: Per-column value the sums are centred on.
+        left: Columns of the left block.
+        right: Columns of the right block.
+
+    Returns:
+        The sums for every left and right column pair.
+    """
+
+    rows = values.shape[0]
+    width = max(left.stop - left.start, right.stop - right.start, 1)
+    step = max(SLICE_VALUES // width, 1)
+    shape = (left.stop - left.start, right.stop - right.start)
+    sums = [np.zeros(shape) for _ in BlockMoments._fields]
+    count, sum_left, sum_right, squares_left, squares_right, products = sums
+
+    for start in range(0, rows, step):
+        x, x_present = _centred(values[start : start + step, left], shift[left])
+        y, y_present = _centred(values[start : start + step, right], shift[right])
+
+        products += x.T @ y
+
+        if x_present is None and y_present is None:
+            count += len(x)
+            sum_left += x.sum(axis=0)[:, None]
+            sum_right += y.sum(axis=0)[None, :]
+            squares_left += (x * x).sum(axis=0)[:, None]
+            squares_right += (y * y).sum(axis=0)[None, :]
+            continue
+
+        if x_present is None:
+            x_present = np.ones_like(x)
+        if y_present is None:
+            y_present = np.ones_like(y)
+
+        count += x_present.T @ y_present
+        sum_left += x.T @ y_present
+        sum_right += x_present.T @ y
+        squares_left += (x * x).T @ y_present
+        squares_right += x_present.T @ (y * y)
+
+    return BlockMoments(*sums)
+
+
+def pearson(moments: BlockMoments) -> np.ndarray:
+    """
+    Derive pairwise-complete Pearson coefficients from accumulated sums.
+
+    Pairs with fewer than two common rows or a constant column yield NaN,
+    as in ``DataFrame.corr``.
+
+    Args:
+        moments: Pairwise sums of centred values.
+
+    Returns:
+        The correlation coefficients, clipped to ``[-1, 1]``.
+    """
+
+    count = moments.count
+
+    with np.errstate(invalid="ignore", divide="ignore"):
+        covariance = moments.products - moments.sum_left * moments.sum_right / count
+        var_left = moments.squares_left - moments.sum_left**2 / count
+        var_right = moments.squares_right - moments.sum_right**2 / count
+
+        # Variances lost to rounding mark constant columns.
+        constant = (var_left <= 1e-12 * moments.squares_left) | (
+            var_right <= 1e-12 * moments.squares_right
+        )
+        r = covariance / np.sqrt(var_left * var_right)
+
+    r[(count < 2) | constant] = np.nan
+
+    return np.clip(r, -1.0, 1.0)
+
+
+def column_blocks(columns: int) -> List[slice]:
+    """Split column positions into blocks of ``CORRELATION_BLOCK_COLUMNS``."""
+
+    step = max(CORRELATION_BLOCK_COLUMNS, 1)
+
+    return [
+        slice(start, min(start + step, columns)) for start in range(0, columns, step)
+    ]
+
+
+def block_correlations(
+    values: np.ndarray,
+) -> Iterator[Tuple[slice, slice, np.ndarray, np.ndarray]]:
+    """
+    Correlate every pair of column blocks on the thread pool.
+
+    Only block pairs on or above the diagonal are computed; the others
+    are their transposes.
+
+    Args:
+        values: Array of shape ``(rows, columns)`` with NaN for nulls.
+
+    Yields:
+        The left and right column blocks, their correlation coefficients
+        and pairwise observation counts.
+    """
+
+    with np.errstate(invalid="ignore"):
+        shift = np.nan_to_num(np.nanmean(values, axis=0)) if len(values) else 0.0
+
+    shift = np.broadcast_to(shift, values.shape[1:])
+    blocks = column_blocks(values.shape[1])
+    pairs = [(a, b) for i, a in enumerate(blocks) for b in blocks[i:]]
+
+    def correlate(pair: Tuple[slice, slice]) -> Tuple[np.ndarray, np.ndarray]:
+        moments = block_moments(values, shift, *pair)
+        return pearson(moments), moments.count
+
+    for (left, right), (r, count) in zip(pairs, EXECUTOR.map(correlate, pairs)):
+        yield left, right, r, count
+
+
+def correlation_matrix(values: np.ndarray, labels: List[Hashable]) -> pd.DataFrame:
+    """
+    Build the full correlation matrix block by block.
+
+    Args:
+        values: Array of shape ``(rows, columns)`` with NaN for nulls.
+        labels: Column labels of ``values``.
+
+    Returns:
+        A square DataFrame indexed by ``labels`` on both axes.
+    """
+
+    matrix = np.empty((len(labels), len(labels)))
+
+    for left, right, r, _ in block_correlations(values):
+        matrix[left, right] = r
+        matrix[right, left] = r.T
+
+    return pd.DataFrame(matrix, index=labels, columns=labels)
+
+
+def _strongest(r: np.ndarray, top: int, upper: bool) -> np.ndarray:
+    """
+    Return the flat positions of the strongest coefficients of a block.
+
+    Args:
+        r: Block of correlation coefficients.
+        top: Maximum number of positions to return.
+        upper: Whether to consider only pairs above the diagonal.
+
+    Returns:
+        The positions, strongest first; NaN coefficients are skipped.
+    """
+
+    strength = np.abs(r)
+
+    if upper:
+        strength = np.where(
+            np.triu(np.ones(r.shape, dtype=bool), k=1), strength, np.nan
+        )
+
+    flat = strength.ravel()
+    candidates = np.flatnonzero(~np.isnan(flat))
+
+    if len(candidates) > top:
+        keep = np.argpartition(-flat[candidates], top - 1)[:top]
+        candidates = candidates[keep]
+
+    return candidates[np.argsort(-flat[candidates], kind="stable")]
+
+
+def top_pairs(
+    blocks: Iterator[Tuple[slice, slice, np.ndarray, np.ndarray]],
+    labels: List[Hashable],
+    top: int,
+) -> pd.DataFrame:
+    """
+    Keep the most strongly correlated column pairs of block results.
+
+    Args:
+        blocks: Column blocks with their coefficients and counts, covering
+            every pair on or above the diagonal.
+        labels: Column labels indexed by the blocks.
+        top: Number of pairs to keep.
+
+    Returns:
+        A DataFrame with ``PAIR_COLUMNS``, ordered by decreasing
+        absolute correlation.
+    """
+
+    pairs: List[pd.DataFrame] = []
+
+    for left, right, r, count in blocks:
+        positions = _strongest(r, top, upper=left == right)
+        rows, columns = np.unravel_index(positions, r.shape)
+
+        pairs.append(
+            pd.DataFrame(
+                {
+                    "left": rows + left.start,
+                    "right": columns + right.start,
+                    "Correlation": r[rows, columns],
+                    "Observations": count[rows, columns].astype("int64"),
+                }
+            )
+        )
+
+    candidates = pd.concat(pairs, ignore_index=True) if pairs else None
+
+    if candidates is None or candidates.empty:
+        return pd.DataFrame(columns=PAIR_COLUMNS)
+
+    strongest = candidates.loc[
+        candidates["Correlation"]
+        .abs()
+        .sort_values(ascending=False, kind="stable")
+        .index
+    ].head(top)
+    names = np.asarray(labels, dtype=object)
+
+    return pd.DataFrame(
+        {
+            "Column 1": names[strongest["left"].to_numpy()],
+            "Column 2": names[strongest["right"].to_numpy()],
+            "Correlation": strongest["Correlation"].to_numpy(),
+            "Observations": strongest["Observations"].to_numpy(),
+        }
+    )
+
+
+def correlate(values: np.ndarray, labels: List[Hashable], n: Any) -> pd.DataFrame:
+    """
+    Correlate the columns of an array into the analysis result.
+
+    Args:
+        values: Array of shape ``(rows, columns)`` with NaN for nulls.
+        labels: Column labels of ``values``.
+        n: Number of strongest pairs to report, or ``None`` or 0 for the
+            full matrix.
+
+    Returns:
+        The correlation matrix, or the strongest pairs.
+    """
+
+    top = pair_limit(n)
+
+    if top is None:
+        return correlation_matrix(values, labels)
+
+    return top_pairs(block_correlations(values), labels, top)
+
+
+def pair_limit(n: Any) -> Optional[int]:
+    """
+    Validate the number of strongest pairs requested.
+
+    Args:
+        n: Analysis parameter.
+
+    Returns:
+        The positive pair count, or ``None`` for the full matrix.
+
+    Raises:
+        ValueError: If ``n`` is negative.
+    """
+
+    if not n:
+        return None
+
+    top = int(n)
+
+    if top < 0:
+        raise ValueError(f"Number of correlated pairs must be positive, got {n}")
+
+    return top
+
+
+def numeric_values(data: pd.DataFrame) -> Tuple[List[Hashable], np.ndarray]:
+    """
+    Return the numeric, non-boolean columns of a frame as a float array.
+
+    Args:
+        data: Input pandas DataFrame.
+
+    Returns:
+        The column labels and an array with NaN for nulls.
+    """
+
+    labels = numeric_labels(data.dtypes)
+    values = data[labels].to_numpy(dtype="float64", na_value=np.nan)
+
+    return labels, values
+
+
+class PearsonCorrelation(MergeableAnalysis):
+    """
+    Analysis implementation that computes Pearson correlations.
+
+    This analysis correlates every pair of numeric columns over their
+    common non-null rows. Partial states carry pairwise sums, so streamed
+    data is correlated in one pass, though in memory quadratic in the
+    number of columns even when only the strongest pairs are reported.
+    """
+
+    @classmethod
+    def compute(cls, data: pd.DataFrame, *args: Any) -> pd.DataFrame:
+        """
+        Correlate the numeric columns of the dataset.
+
+        Args:
+            data: Input pandas DataFrame.
+            *args: Optional number of strongest pairs to report instead
+                of the full matrix.
+
+        Returns:
+            The correlation matrix, or a DataFrame of the strongest pairs.
+        """
+
+        labels, values = numeric_values(data)
+
+        return correlate(values, labels, args[0] if args else None)
+
+    @classmethod
+    def required_columns(cls, dtypes: pd.Series, *args: Any):
+        """Read only the numeric columns, or all if there are none."""
+
+        return numeric_labels(dtypes) or None
+
+    @classmethod
+    def init(cls, *args: Any) -> CorrelationState:
+        """Return the state of an empty partition."""
+
+        return CorrelationState()
+
+    @classmethod
+    def update(
+        cls, state: CorrelationState, chunk: pd.DataFrame, *args: Any
+    ) -> CorrelationState:
+        """Fold the chunk's pairwise sums into the state."""
+
+        labels, values = numeric_values(chunk)
+        known = dict(zip(state.labels, state.shift))
+
+        with np.errstate(invalid="ignore"):
+            means = np.nanmean(values, axis=0) if len(values) else np.zeros(len(labels))
+
+        shift = np.array(
+            [known.get(label, mean) for label, mean in zip(labels, means)],
+            dtype="float64",
+        )
+        shift = np.nan_to_num(shift)
+        partial = CorrelationState(
+            columns=list(chunk.columns),
+            non_numeric=set(chunk.columns.difference(labels)),
+            labels=labels,
+            shift=shift,
+        )
+        partial.count, partial.sums = np.empty((2, len(labels), len(labels)))
+        partial.squares, partial.products = np.empty((2, len(labels), len(labels)))
+
+        blocks = column_blocks(len(labels))
+        pairs = [(a, b) for i, a in enumerate(blocks) for b in blocks[i:]]
+        results = EXECUTOR.map(lambda pair: block_moments(values, shift, *pair), pairs)
+
+        for (left, right), moments in zip(pairs, results):
+            partial.count[left, right] = moments.count
+            partial.count[right, left] = moments.count.T
+            partial.sums[left, right] = moments.sum_left
+            partial.sums[right, left] = moments.sum_right.T
+            partial.squares[left, right] = moments.squares_left
+            partial.squares[right, left] = moments.squares_right.T
+            partial.products[left, right] = moments.products
+            partial.products[right, left] = moments.products.T
+
+        return cls.merge(state, partial)
+
+    @classmethod
+    def merge(
+        cls, left: CorrelationState, right: CorrelationState, *args: Any
+    ) -> CorrelationState:
+        """Add the pairwise sums of two partitions, re-centred alike."""
+
+        labels = left.labels + [c for c in right.labels if c not in left.labels]
+        shifts = dict(zip(right.labels, right.shift))
+        shifts.update(zip(left.labels, left.shift))
+        shift = np.array([shifts[label] for label in labels], dtype="float64")
+
+        merged = _recentre(left, labels, shift)
+        addend = _recentre(right, labels, shift)
+
+        return CorrelationState(
+            columns=left.columns + [c for c in right.columns if c not in left.columns],
+            non_numeric=left.non_numeric | right.non_numeric,
+            labels=labels,
+            shift=shift,
+            count=merged.count + addend.count,
+            sums=merged.sums + addend.sums,
+            squares=merged.squares + addend.squares,
+            products=merged.products + addend.products,
+        )
+
+    @classmethod
+    def finalize(cls, state: CorrelationState, *args: Any) -> pd.DataFrame:
+        """Derive the coefficients of the columns numeric in every chunk."""
+
+        keep = [c for c in state.columns if c not in state.non_numeric]
+        keep = [c for c in keep if c in state.labels]
+        positions = np.array([state.labels.index(c) for c in keep], dtype=np.intp)
+        grid = np.ix_(positions, positions)
+
+        sums, squares = state.sums[grid], state.squares[grid]
+        moments = BlockMoments(
+            count=state.count[grid],
+            sum_left=sums,
+            sum_right=sums.T,
+            squares_left=squares,
+            squares_right=squares.T,
+            products=state.products[grid],
+        )
+        r = pearson(moments)
+        top = pair_limit(args[0] if args else None)
+
+        if top is None:
+            return pd.DataFrame(r, index=keep, columns=keep)
+
+        everything = slice(0, len(keep))
+
+        return top_pairs(iter([(everything, everything, r, moments.count)]), keep, top)
+
+
+def _recentre(
+    state: CorrelationState, labels: List[Any], shift: np.ndarray
+) -> CorrelationState:
+    """
+    Align a state's arrays to new labels and shifts.
+
+    Args:
+        state: Partial state to convert.
+        labels: Superset of ``state.labels``; missing columns get zero sums.
+        shift: New per-column centre of the sums.
+
+    Returns:
+        A state with the same sums, indexed by ``labels`` and centred on
+        ``shift``.
+    """
+
+    size = len(labels)
+    positions = np.array([labels.index(c) for c in state.labels], dtype=np.intp)
+    grid = np.ix_(positions, positions)
+
+    count, sums, squares, products = np.zeros((4, size, size))
+    count[grid], sums[grid] = state.count, state.sums
+    squares[grid], products[grid] = state.squares, state.products
+
+    # Centring on ``shift`` instead of ``state.shift`` adds ``delta`` to
+    # every present value.
+    delta = np.zeros(size)
+    delta[positions] = state.shift - shift[positions]
+    rows, columns = delta[:, None], delta[None, :]
+
+    return CorrelationState(
+        labels=labels,
+        shift=shift,
+        count=count,
+        sums=sums + rows * count,
+        squares=squares + 2 * rows * sums + rows**2 * count,
+        products=products + columns * sums + rows * sums.T + rows * columns * count,
+    )
+
+
+class SpearmanCorrelation(AnalysisBase):
+    """
+    Analysis implementation that computes Spearman rank correlations.
+
+    Each numeric column is ranked once over its non-null values, with
+    ties sharing their average rank, and the ranks are correlated like
+    Pearson's coefficients. Where values are missing, the results can
+    therefore differ slightly from ``DataFrame.corr``, which re-ranks
+    every pair of columns on their common rows. Ranks are global, so
+    streamed data is concatenated before ranking.
+    """
+
+    @classmethod
+    def compute(cls, data: pd.DataFrame, *args: Any) -> pd.DataFrame:
+        """
+        Rank-correlate the numeric columns of the dataset.
+
+        Args:
+            data: Input pandas DataFrame.
+            *args: Optional number of strongest pairs to report instead
+                of the full matrix.
+
+        Returns:
+            The correlation matrix, or a DataFrame of the strongest pairs.
+        """
+
+        labels = numeric_labels(data.dtypes)
+        ranks = data[labels].rank().to_numpy(dtype="float64", na_value=np.nan)
+
+        return correlate(ranks, labels, args[0] if args else None)
+
+    @classmethod
+    def required_columns(cls, dtypes: pd.Series, *args: Any):
+        """Read only the numeric columns, or all if there are none."""
+
+        return numeric_labels(dtypes) or None
@@ -2,22 +2,61 @@
 Data type inspection analysis for EDA.
 
 This module provides an analysis implementation that reports the
-data types of all columns in a pandas DataFrame.
+data types of all columns in a pandas DataFrame, together with their
+memory footprint and, for optimised uploads, the memory saved compared
+with pandas' default dtypes.
 """
 
-from typing import Any
+from typing import Any, Dict, Hashable
 
+import numpy as np
 import pandas as pd
 
-from ..analysis_base import AnalysisBase
+from ..analysis_base import MergeableAnalysis
+from ..optimize import MEMORY_BEFORE_ATTR
 
+DataTypesState = Dict[Hashable, Any]
 
-class DataTypes(AnalysisBase):
+
+def common_dtype(left: Any, right: Any) -> Any:
+    """
+    Return the dtype a column takes when two partitions are concatenated.
+
+    Numeric (non-boolean) dtypes are promoted with NumPy's rules; any
+    other mismatch falls back to ``object`` as pandas does on concat.
+
+    Args:
+        left: dtype of the column in the first partition.
+        right: dtype of the column in the second partition.
+
+    Returns:
+        The common dtype.
+    """
+
+    if left == right:
+        return left
+
+    def is_plain_numeric(dtype: Any) -> bool:
+        return (
+            isinstance(dtype, np.dtype)
+            and pd.api.types.is_numeric_dtype(dtype)
+            and not pd.api.types.is_bool_dtype(dtype)
+        )
+
+    if is_plain_numeric(left) and is_plain_numeric(right):
+        return np.result_type(left, right)
+
+    return np.dtype("object")
+
+
+class DataTypes(MergeableAnalysis):
     """
     Analysis implementation that reports column data types.
 
     This analysis returns a tabular representation of each column
-    and its corresponding data type.
+    and its corresponding data type. The partial state maps each
+    column to the common dtype of the chunks seen so far; memory is
+    only reported for in-memory frames.
     """
 
     @classmethod
@@ -30,11 +69,65 @@ class DataTypes(AnalysisBase):
             *args: Unused; included for interface compatibility.
 
         Returns:
-            A pandas DataFrame with column names and their data types.
+            A pandas DataFrame with column names, their data types and
+            memory usage in bytes, followed by a ``Total`` row. If the
+            frame records its default-dtype memory, the memory before
+            optimisation and the bytes saved are included as well.
         """
 
         series = data.dtypes
         series = series.astype(str)
         df = series.to_frame(name="Value").reset_index()
 
+        memory = data.memory_usage(index=False, deep=True)
+        df["Memory (bytes)"] = memory.to_numpy()
+
+        before = data.attrs.get(MEMORY_BEFORE_ATTR)
+        if before is not None:
+            df["Memory before (bytes)"] = [
+                before.get(column, size) for column, size in memory.items()
+            ]
+            df["Saved (bytes)"] = df["Memory before (bytes)"] - df["Memory (bytes)"]
+
+        total = df.drop(columns=["index", "Value"]).sum()
+        df.loc[len(df)] = {"index": "Total", "Value": "", **total.to_dict()}
+
+        return df
+
+    @classmethod
+    def init(cls, *args: Any) -> DataTypesState:
+        """Return the state of an empty partition."""
+
+        return {}
+
+    @classmethod
+    def update(
+        cls, state: DataTypesState, chunk: pd.DataFrame, *args: Any
+    ) -> DataTypesState:
+        """Promote the recorded dtypes with those of the chunk."""
+
+        return cls.merge(state, dict(chunk.dtypes.items()))
+
+    @classmethod
+    def merge(
+        cls, left: DataTypesState, right: DataTypesState, *args: Any
+    ) -> DataTypesState:
+        """Promote the dtypes of two partitions column by column."""
+
+        merged = dict(left)
+
+        for column, dtype in right.items():
+            merged[column] = (
+                common_dtype(merged[column], dtype) if column in merged else dtype
+            )
+
+        return merged
+
+    @classmethod
+    def finalize(cls, state: DataTypesState, *args: Any):
+        """Format the promoted dtypes like `compute`."""
+
+        series = pd.Series(state, dtype="object").astype(str)
+        df = series.to_frame(name="Value").reset_index()
+
         return df
@@ -1,23 +1,148 @@
 """
 Descriptive statistics analysis implementation.
 
-This module provides an analysis class that computes summary
-statistics for numeric columns in a pandas DataFrame.
+This module provides analysis classes that compute summary
+statistics for numeric columns in a pandas DataFrame, with either
+exact quartiles or quartiles estimated by bounded-memory sketches.
+Streamed data is always summarised in bounded memory; only in-memory
+frames get exact quartiles from the describe analysis.
 """
 
-from typing import Any
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Set
 
+import numpy as np
 import pandas as pd
 
-from ..analysis_base import AnalysisBase
+from ..analysis_base import MergeableAnalysis, numeric_labels
+from ..config import QUANTILE_RANK_ERROR
+from ..ingest import row_blocks
+from ..sketches import KLLSketch, kll_k_for_error
 
+STATISTICS = ["count", "mean", "std", "min", "25%", "50%", "75%", "max"]
+MOMENTS = ["count", "mean", "m2", "min", "max"]
 
-class Describe(AnalysisBase):
+
+@dataclass
+class DescribeState:
+    """
+    Partial aggregate for the describe analysis.
+
+    Attributes:
+        columns: Column labels in first-seen order.
+        non_numeric: Columns that were non-numeric in at least one chunk.
+        moments: Frame indexed by ``MOMENTS`` holding per-column count,
+            mean, sum of squared deviations, minimum and maximum.
+        sketches: KLL quantile sketch per numeric column, sized for the
+            rank error of the analysis.
+    """
+
+    columns: List[Any] = field(default_factory=list)
+    non_numeric: Set[Any] = field(default_factory=set)
+    moments: pd.DataFrame = field(
+        default_factory=lambda: pd.DataFrame(index=MOMENTS, dtype="float64")
+    )
+    sketches: Dict[Any, KLLSketch] = field(default_factory=dict)
+
+
+def combine_moments(left: pd.DataFrame, right: pd.DataFrame) -> pd.DataFrame:
+    """
+    Combine per-column moments of two partitions.
+
+    Uses the pairwise update of Chan et al. so that the mean and the
+    sum of squared deviations stay numerically stable when merged.
+
+    Args:
+        left: Moments frame indexed by ``MOMENTS``.
+        right: Moments frame indexed by ``MOMENTS``.
+
+    Returns:
+        A moments frame covering the union of both column sets.
+    """
+
+    columns = left.columns.append(right.columns.difference(left.columns))
+    empty = pd.Series([0.0, 0.0, 0.0, np.nan, np.nan], index=MOMENTS)
+
+    a = left.reindex(columns=columns).apply(lambda c: c.fillna(empty))
+    b = right.reindex(columns=columns).apply(lambda c: c.fillna(empty))
+
+    n_a, n_b = a.loc["count"], b.loc["count"]
+    n = n_a + n_b
+    delta = b.loc["mean"] - a.loc["mean"]
+    weight = (n_b / n).fillna(0.0)
+
+    combined = pd.DataFrame(index=MOMENTS, columns=columns, dtype="float64")
+    combined.loc["count"] = n
+    combined.loc["mean"] = a.loc["mean"] + delta * weight
+    combined.loc["m2"] = a.loc["m2"] + b.loc["m2"] + delta**2 * n_a * weight
+    combined.loc["min"] = np.fmin(a.loc["min"], b.loc["min"])
+    combined.loc["max"] = np.fmax(a.loc["max"], b.loc["max"])
+
+    return combined
+
+
+def chunk_moments(numeric: pd.DataFrame) -> pd.DataFrame:
+    """
+    Compute per-column moments for a numeric DataFrame chunk.
+
+    Args:
+        numeric: DataFrame containing only numeric columns.
+
+    Returns:
+        A moments frame indexed by ``MOMENTS``.
+    """
+
+    mean = numeric.mean()
+
+    return pd.DataFrame(
+        {
+            "count": numeric.count(),
+            "mean": mean.fillna(0.0),
+            "m2": ((numeric - mean) ** 2).sum(),
+            "min": numeric.min(),
+            "max": numeric.max(),
+        },
+        dtype="float64",
+    ).T.reindex(MOMENTS)
+
+
+def moments_table(moments: pd.DataFrame, columns: List[Any]) -> pd.DataFrame:
+    """
+    Build a describe table from merged moments, leaving quartiles empty.
+
+    Args:
+        moments: Moments frame indexed by ``MOMENTS``.
+        columns: Columns to report, in output order.
+
+    Returns:
+        A DataFrame indexed by ``STATISTICS`` with NaN quartiles.
+    """
+
+    moments = moments.reindex(columns=columns)
+    count = moments.loc["count"]
+
+    stats = pd.DataFrame(index=STATISTICS, columns=columns, dtype="float64")
+    stats.loc["count"] = count
+    stats.loc["mean"] = moments.loc["mean"].where(count > 0)
+    stats.loc["std"] = np.sqrt(moments.loc["m2"] / (count - 1)).where(count > 1)
+    stats.loc["min"] = moments.loc["min"]
+    stats.loc["max"] = moments.loc["max"]
+
+    return stats
+
+
+class Describe(MergeableAnalysis):
     """
     Analysis implementation that generates descriptive statistics.
 
     This analysis computes count, mean, standard deviation,
-    minimum, maximum, and quartiles for numeric columns.
+    minimum, maximum, and quartiles for numeric columns. Partial
+    states merge moments exactly and summarise each numeric column
+    in a KLL sketch, so streamed input is described in memory bounded
+    per column. Quartiles of streamed input are therefore exact only
+    while a column has fewer values than the sketch holds, and
+    otherwise within ``QUANTILE_RANK_ERROR`` in rank; `compute` keeps
+    exact quartiles for in-memory frames.
     """
 
     @classmethod
@@ -30,6 +155,204 @@ class Describe(AnalysisBase):
             *args: Unused; included for interface compatibility.
 
         Returns:
-            A pandas DataFrame containing descriptive statistics.
+            A pandas DataFrame containing descriptive statistics. Datetime
+            columns are left out when numeric columns are present.
+        """
+
+        numeric = data.select_dtypes(include="number")
+
+        return numeric.describe() if numeric.shape[1] else data.describe()
+
+    @classmethod
+    def required_columns(cls, dtypes: pd.Series, *args: Any):
+        """Read only the numeric columns, or all if there are none."""
+
+        return numeric_labels(dtypes) or None
+
+    @classmethod
+    def from_profile(cls, profile: pd.DataFrame, *args: Any):
+        """
+        Read the describe table off the fused profile.
+
+        Returns ``None`` when the dataset has no numeric columns, since
+        `compute` then falls back to a categorical summary.
+        """
+
+        numeric = profile[profile["Numeric"]]
+
+        if numeric.empty:
+            return None
+
+        stats = numeric.set_index("Column")[[s.capitalize() for s in STATISTICS]]
+        stats.index.name = None
+
+        return stats.astype("float64").T.set_axis(STATISTICS)
+
+    @classmethod
+    def compute_plan(cls, plan: Any, *args: Any):
+        """Describe the numeric subset shared with other analyses."""
+
+        numeric = plan.get("numeric")
+
+        return numeric.describe() if numeric.shape[1] else plan.frame.describe()
+
+    @classmethod
+    def estimate(cls, sample: pd.DataFrame, population_rows: int, *args: Any):
+        """
+        Describe the sample, scaling its counts to the population.
+
+        Returns ``None`` when the dataset has no numeric columns, since the
+        distinct counts of the categorical summary do not scale.
+        """
+
+        numeric = sample.select_dtypes(include="number")
+
+        if not numeric.shape[1]:
+            return None
+
+        stats = numeric.describe()
+        scale = population_rows / len(sample) if len(sample) else 0.0
+        stats.loc["count"] = (stats.loc["count"] * scale).round()
+
+        return stats
+
+    @classmethod
+    def rank_error(cls, *args: Any) -> float:
+        """Return the normalised rank error of the sketched quartiles."""
+
+        return QUANTILE_RANK_ERROR
+
+    @classmethod
+    def init(cls, *args: Any) -> DescribeState:
+        """Return the state of an empty partition."""
+
+        return DescribeState()
+
+    @classmethod
+    def update(
+        cls, state: DescribeState, chunk: pd.DataFrame, *args: Any
+    ) -> DescribeState:
+        """Fold the chunk's numeric moments into the state and sketch its values."""
+
+        numeric = chunk.select_dtypes(include="number")
+        k = kll_k_for_error(cls.rank_error(*args))
+
+        for column in numeric.columns:
+            sketch = state.sketches.setdefault(column, KLLSketch(k))
+            sketch.update(numeric[column].to_numpy(dtype="float64", na_value=np.nan))
+
+        state.columns += [c for c in chunk.columns if c not in state.columns]
+        state.non_numeric |= set(chunk.columns.difference(numeric.columns))
+        state.moments = combine_moments(state.moments, chunk_moments(numeric))
+
+        return state
+
+    @classmethod
+    def merge(
+        cls, left: DescribeState, right: DescribeState, *args: Any
+    ) -> DescribeState:
+        """
+        Combine moments and merge the column sketches of two partitions.
+
+        Every sketch of the result is new, so updating it in place leaves
+        the states of both partitions intact.
+        """
+
+        empty = KLLSketch(kll_k_for_error(cls.rank_error(*args)))
+        sketches = {
+            column: left.sketches.get(column, empty).merge(
+                right.sketches.get(column, empty)
+            )
+            for column in dict.fromkeys([*left.sketches, *right.sketches])
+        }
+
+        return DescribeState(
+            columns=left.columns + [c for c in right.columns if c not in left.columns],
+            non_numeric=left.non_numeric | right.non_numeric,
+            moments=combine_moments(left.moments, right.moments),
+            sketches=sketches,
+        )
+
+    @classmethod
+    def finalize(cls, state: DescribeState, *args: Any):
+        """
+        Build the describe table from the accumulated state.
+
+        Only columns that were numeric in every chunk are reported. Unlike
+        `compute`, a dataset without numeric columns yields an empty table
+        instead of the categorical summary.
+        """
+
+        keep = [c for c in state.columns if c not in state.non_numeric]
+        stats = moments_table(state.moments, keep)
+
+        for column in keep:
+            sketch = state.sketches.get(column)
+            if sketch is not None and sketch.n:
+                stats.loc[["25%", "50%", "75%"], column] = sketch.quantiles(
+                    [0.25, 0.5, 0.75]
+                )
+
+        return stats
+
+
+class ApproxDescribe(Describe):
+    """
+    Analysis implementation that generates approximate descriptive statistics.
+
+    Count, mean, standard deviation and extrema are exact; the quartiles
+    come from one KLL sketch per numeric column, so memory per column is
+    bounded by the requested rank error rather than the row count. The
+    streamed aggregation is that of the describe analysis; only the rank
+    error and a final row stating it differ.
+    """
+
+    @classmethod
+    def rank_error(cls, *args: Any) -> float:
+        """Return the requested rank error, defaulting to the configured one."""
+
+        return float(args[0]) if args and args[0] else QUANTILE_RANK_ERROR
+
+    @classmethod
+    def compute(cls, data: pd.DataFrame, *args: Any):
+        """
+        Generate approximate descriptive statistics for the given dataset.
+
+        Args:
+            data: Input pandas DataFrame.
+            *args: Optional arguments where the first value specifies the
+                normalised rank error of the quartiles.
+
+        Returns:
+            A pandas DataFrame containing descriptive statistics, with a
+            final ``rank error`` row stating the quartile accuracy.
         """
-        return data.describe()
+
+        return cls.compute_chunks(row_blocks(data), *args)
+
+    @classmethod
+    def from_profile(cls, profile: pd.DataFrame, *args: Any):
+        """Do not reuse the profile, whose quartiles carry no rank error row."""
+
+        return None
+
+    @classmethod
+    def compute_plan(cls, plan: Any, *args: Any):
+        """Do not reuse the plan; its describe table has exact quartiles."""
+
+        return None
+
+    @classmethod
+    def estimate(cls, sample: pd.DataFrame, population_rows: int, *args: Any):
+        """Do not estimate; the rank error row only holds for the full data."""
+
+        return None
+
+    @classmethod
+    def finalize(cls, state: DescribeState, *args: Any):
+        """Build the describe table with sketched quartiles and their rank error."""
+
+        stats = super().finalize(state, *args)
+        stats.loc["rank error"] = cls.rank_error(*args)
+
+        return stats
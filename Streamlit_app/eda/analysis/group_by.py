@@ -0,0 +1,492 @@
+"""
+Group-by aggregation analysis for EDA.
+
+This module provides an analysis implementation that groups rows by key
+columns and aggregates other columns per group. Its parameter is a
+`GroupBySpec`, a structured, hashable value passed as ``n``.
+
+Streamed data is aggregated as a hash aggregation: every chunk is
+reduced to partial aggregates per group, which are combined with those
+of earlier chunks. Once the number of groups exceeds
+``GROUP_BY_MAX_GROUPS``, partial aggregates are instead hash-partitioned
+by key into ``GROUP_BY_PARTITIONS`` spill files, and each partition is
+combined on its own when the result is built, so memory is bounded by
+the groups of a single partition. On DuckDB the aggregation is pushed
+down, and DuckDB spills on its own.
+"""
+
+import itertools
+import shutil
+import tempfile
+import weakref
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Dict, Hashable, Iterator, List, Optional, Sequence, Tuple
+
+import numpy as np
+import pandas as pd
+import pyarrow as pa  # type: ignore[import-not-found]
+
+from ..analysis_base import MergeableAnalysis, sql_identifier
+from ..config import GROUP_BY_MAX_GROUPS, GROUP_BY_PARTITIONS, RESULT_SPILL_DIR
+
+# Spill files are written and read once, so a fast codec is preferred.
+SPILL_COMPRESSION = "lz4"
+
+# Partial aggregates each aggregation is combined from.
+PARTIALS: Dict[str, Tuple[str, ...]] = {
+    "size": ("size",),
+    "count": ("count",),
+    "sum": ("sum",),
+    "mean": ("sum", "count"),
+    "min": ("min",),
+    "max": ("max",),
+}
+
+# How partial aggregates of the same group are combined.
+COMBINE = {"size": "sum", "count": "sum", "sum": "sum", "min": "min", "max": "max"}
+
+# Aggregations whose values scale with the number of rows.
+ADDITIVE = frozenset({"size", "count", "sum"})
+
+SQL_PARTIALS = {
+    "size": "count(*)",
+    "count": "count({})",
+    "sum": "coalesce(sum({}), 0)",
+    "min": "min({})",
+    "max": "max({})",
+}
+
+
+@dataclass(frozen=True)
+class GroupBySpec:
+    """
+    Parameter of the group-by analysis.
+
+    Being frozen, specifications are hashable and have a stable ``repr``,
+    so results are cached per specification like other parameters.
+
+    Attributes:
+        keys: Columns whose values define the groups.
+        aggregations: ``(column, function)`` pairs to compute per group,
+            with functions from ``"count"``, ``"sum"``, ``"mean"``,
+            ``"min"`` and ``"max"``. The number of rows per group is
+            always reported.
+    """
+
+    keys: Tuple[Hashable, ...]
+    aggregations: Tuple[Tuple[Hashable, str], ...] = ()
+
+    def __post_init__(self) -> None:
+        """
+        Normalise sequences to tuples and validate the specification.
+
+        Raises:
+            ValueError: If no key is given or a function is unknown.
+        """
+
+        object.__setattr__(self, "keys", tuple(self.keys))
+        object.__setattr__(
+            self,
+            "aggregations",
+            tuple((column, function) for column, function in self.aggregations),
+        )
+
+        if not self.keys:
+            raise ValueError("Group-by needs at least one key column")
+
+        for _, function in self.aggregations:
+            if function not in PARTIALS or function == "size":
+                raise ValueError(f"Unknown aggregation function: {function!r}")
+
+    @property
+    def columns(self) -> List[Hashable]:
+        """Return the key and aggregated columns without duplicates."""
+
+        columns = list(self.keys)
+        columns += [c for c, _ in self.aggregations if c not in columns]
+
+        return list(dict.fromkeys(columns))
+
+    def outputs(self) -> List[Tuple[str, Optional[Hashable], str]]:
+        """
+        List the aggregated result columns.
+
+        Returns:
+            The name, source column and function of each result column,
+            starting with the group size.
+        """
+
+        outputs: List[Tuple[str, Optional[Hashable], str]] = [("size", None, "size")]
+
+        for column, function in dict.fromkeys(self.aggregations):
+            outputs.append((f"{function}({column})", column, function))
+
+        return outputs
+
+    def partials(self) -> List[Tuple[str, Optional[Hashable], str]]:
+        """
+        List the partial aggregates the result is combined from.
+
+        Returns:
+            The name, source column and function of each partial aggregate.
+        """
+
+        partials: Dict[str, Tuple[Optional[Hashable], str]] = {}
+
+        for _, column, function in self.outputs():
+            for partial in PARTIALS[function]:
+                name = "size" if partial == "size" else f"{partial}({column})"
+                partials[name] = (column, partial)
+
+        return [(name, column, partial) for name, (column, partial) in partials.items()]
+
+
+def group_spec(n: Any) -> GroupBySpec:
+    """
+    Validate the parameter of the group-by analysis.
+
+    Args:
+        n: Analysis parameter.
+
+    Returns:
+        The group-by specification.
+
+    Raises:
+        TypeError: If ``n`` is not a `GroupBySpec`.
+    """
+
+    if not isinstance(n, GroupBySpec):
+        raise TypeError(f"Group-by needs a GroupBySpec naming its keys, got {n!r}")
+
+    return n
+
+
+def partial_aggregate(data: pd.DataFrame, spec: GroupBySpec) -> pd.DataFrame:
+    """
+    Reduce rows to partial aggregates per group.
+
+    Missing keys form groups of their own.
+
+    Args:
+        data: Rows to aggregate.
+        spec: Group-by specification.
+
+    Returns:
+        One row per group, with the keys and partial aggregates as columns.
+    """
+
+    named = {
+        name: pd.NamedAgg(column=spec.keys[0] if column is None else column, aggfunc=fn)
+        for name, column, fn in spec.partials()
+    }
+    grouped = data.groupby(list(spec.keys), dropna=False, observed=True, sort=False)
+
+    return grouped.agg(**named).reset_index()
+
+
+def combine(partials: Sequence[pd.DataFrame], spec: GroupBySpec) -> pd.DataFrame:
+    """
+    Combine partial aggregates of the same groups.
+
+    Args:
+        partials: Outputs of `partial_aggregate` or of this function.
+        spec: Group-by specification.
+
+    Returns:
+        One row per distinct group, with combined partial aggregates.
+    """
+
+    if len(partials) == 1:
+        return partials[0]
+
+    named = {
+        name: pd.NamedAgg(column=name, aggfunc=COMBINE[partial])
+        for name, _, partial in spec.partials()
+    }
+    data = pd.concat(partials, ignore_index=True)
+    grouped = data.groupby(list(spec.keys), dropna=False, observed=True, sort=False)
+
+    return grouped.agg(**named).reset_index()
+
+
+def finish(partial: pd.DataFrame, spec: GroupBySpec) -> pd.DataFrame:
+    """
+    Derive the result columns from combined partial aggregates.
+
+    Args:
+        partial: Combined partial aggregates, one row per group.
+        spec: Group-by specification.
+
+    Returns:
+        The keys and aggregated columns, sorted by key with missing
+        keys last.
+    """
+
+    result = partial[list(spec.keys)].copy()
+
+    for name, column, function in spec.outputs():
+        if function == "mean":
+            with np.errstate(invalid="ignore", divide="ignore"):
+                total = partial[f"sum({column})"].astype("float64")
+                result[name] = total / partial[f"count({column})"]
+        else:
+            result[name] = partial["size" if function == "size" else name]
+
+    result = result.sort_values(list(spec.keys), na_position="last", kind="stable")
+
+    return result.reset_index(drop=True)
+
+
+def partition_of(partial: pd.DataFrame, keys: Sequence[Hashable], parts: int):
+    """
+    Assign groups to spill partitions by hashing their keys.
+
+    Numeric keys are hashed as floats, so a key parsed as an integer in
+    one chunk and as a float in another lands in the same partition.
+
+    Args:
+        partial: Partial aggregates with the keys as columns.
+        keys: Key columns.
+        parts: Number of partitions.
+
+    Returns:
+        The partition number of each row.
+    """
+
+    frame = partial[list(keys)].copy()
+
+    for key in keys:
+        if pd.api.types.is_numeric_dtype(frame[key]):
+            frame[key] = frame[key].astype("float64")
+
+    hashes = pd.util.hash_pandas_object(frame, index=False).to_numpy()
+
+    return hashes % np.uint64(parts)
+
+
+class GroupSpill:
+    """
+    Partial aggregates spilled to disk, hash-partitioned by key.
+
+    Every group's partial aggregates land in the same partition, so each
+    partition can be combined independently. The directory is removed
+    once the spill is garbage-collected.
+
+    Attributes:
+        path: Directory holding one Arrow IPC file per written piece.
+        parts: Number of partitions.
+    """
+
+    def __init__(
+        self, parts: int = GROUP_BY_PARTITIONS, root: Optional[str] = RESULT_SPILL_DIR
+    ) -> None:
+        self.path = Path(tempfile.mkdtemp(prefix="eda-groups-", dir=root))
+        self.parts = max(parts, 1)
+        self._pieces = itertools.count()
+        weakref.finalize(self, shutil.rmtree, self.path, ignore_errors=True)
+
+    def write(self, partial: pd.DataFrame, keys: Sequence[Hashable]) -> None:
+        """
+        Append partial aggregates to their partitions.
+
+        Args:
+            partial: Partial aggregates with the keys as columns.
+            keys: Key columns.
+        """
+
+        partitions = partition_of(partial, keys, self.parts)
+        options = pa.ipc.IpcWriteOptions(compression=SPILL_COMPRESSION)
+
+        for part, piece in partial.groupby(partitions, sort=False):
+            table = pa.Table.from_pandas(piece, preserve_index=False)
+            path = self.path / f"{part}-{next(self._pieces)}.arrow"
+
+            with pa.OSFile(str(path), "wb") as sink:
+                with pa.ipc.new_file(sink, table.schema, options=options) as out:
+                    out.write_table(table)
+
+    def absorb(self, other: "GroupSpill") -> None:
+        """
+        Move the pieces of a spill with the same partitioning into this one.
+
+        Args:
+            other: Spill whose files are taken over.
+        """
+
+        for path in other.path.glob("*.arrow"):
+            part = path.name.split("-", 1)[0]
+            path.rename(self.path / f"{part}-{next(self._pieces)}.arrow")
+
+    def partitions(self) -> Iterator[List[pd.DataFrame]]:
+        """
+        Read the spilled pieces back one partition at a time.
+
+        Yields:
+            The pieces of each non-empty partition.
+        """
+
+        for part in range(self.parts):
+            pieces = []
+
+            for path in sorted(self.path.glob(f"{part}-*.arrow")):
+                with pa.memory_map(str(path), "r") as source:
+                    pieces.append(pa.ipc.open_file(source).read_all().to_pandas())
+
+            if pieces:
+                yield pieces
+
+
+@dataclass
+class GroupByState:
+    """
+    Partial aggregate for the group-by analysis.
+
+    Attributes:
+        partial: Combined partial aggregates held in memory.
+        spill: Spilled partial aggregates, once there are too many groups.
+    """
+
+    partial: Optional[pd.DataFrame] = None
+    spill: Optional[GroupSpill] = field(default=None, repr=False)
+
+
+class GroupBy(MergeableAnalysis):
+    """
+    Analysis implementation that aggregates columns per group.
+
+    This analysis groups rows by the key columns of a `GroupBySpec`,
+    reports the number of rows per group and computes the requested
+    aggregations, skipping missing values. Rows with missing keys form
+    their own groups. The result has one row per group, sorted by key.
+    """
+
+    @classmethod
+    def compute(cls, data: pd.DataFrame, *args: Any) -> pd.DataFrame:
+        """
+        Aggregate the dataset per group.
+
+        Args:
+            data: Input pandas DataFrame.
+            *args: The `GroupBySpec` to apply.
+
+        Returns:
+            A pandas DataFrame with the keys and aggregated columns.
+
+        Raises:
+            TypeError: If no `GroupBySpec` is given.
+            KeyError: If a key or aggregated column is missing.
+        """
+
+        spec = group_spec(args[0] if args else None)
+
+        return finish(partial_aggregate(data, spec), spec)
+
+    @classmethod
+    def required_columns(cls, dtypes: pd.Series, *args: Any):
+        """Read only the key and aggregated columns."""
+
+        return group_spec(args[0] if args else None).columns
+
+    @classmethod
+    def compute_relation(cls, relation: Any, *args: Any):
+        """Aggregate per group in SQL, letting DuckDB spill large groupings."""
+
+        spec = group_spec(args[0] if args else None)
+        keys = ", ".join(sql_identifier(key) for key in spec.keys)
+        expressions = [keys]
+
+        for name, column, partial in spec.partials():
+            expression = SQL_PARTIALS[partial]
+            if column is not None:
+                expression = expression.format(sql_identifier(column))
+            expressions.append(f"{expression} AS {sql_identifier(name)}")
+
+        partial = relation.aggregate(", ".join(expressions), keys).df()
+
+        return finish(partial, spec)
+
+    @classmethod
+    def estimate(cls, sample: pd.DataFrame, population_rows: int, *args: Any):
+        """Scale the sampled sizes, counts and sums to the population."""
+
+        spec = group_spec(args[0] if args else None)
+        result = cls.compute(sample, spec)
+        scale = population_rows / len(sample) if len(sample) else 0.0
+
+        for name, _, function in spec.outputs():
+            if function == "sum":
+                result[name] = result[name] * scale
+            elif function in ADDITIVE:
+                result[name] = (result[name] * scale).round().astype("int64")
+
+        return result
+
+    @classmethod
+    def init(cls, *args: Any) -> GroupByState:
+        """Return the state of an empty partition."""
+
+        return GroupByState()
+
+    @classmethod
+    def update(
+        cls, state: GroupByState, chunk: pd.DataFrame, *args: Any
+    ) -> GroupByState:
+        """Fold the chunk's partial aggregates into the state."""
+
+        spec = group_spec(args[0] if args else None)
+        partial = GroupByState(partial=partial_aggregate(chunk, spec))
+
+        return cls.merge(state, partial, spec)
+
+    @classmethod
+    def merge(cls, left: GroupByState, right: GroupByState, *args: Any) -> GroupByState:
+        """Combine in memory, or spill once there are too many groups."""
+
+        spec = group_spec(args[0] if args else None)
+        spill = left.spill or right.spill
+
+        if spill is not None:
+            for state in (left, right):
+                if state.spill is not None and state.spill is not spill:
+                    spill.absorb(state.spill)
+                if state.partial is not None:
+                    spill.write(state.partial, spec.keys)
+
+            return GroupByState(spill=spill)
+
+        partials = [s.partial for s in (left, right) if s.partial is not None]
+
+        if not partials:
+            return GroupByState()
+
+        partial = combine(partials, spec)
+
+        if len(partial) <= GROUP_BY_MAX_GROUPS:
+            return GroupByState(partial=partial)
+
+        spill = GroupSpill()
+        spill.write(partial, spec.keys)
+
+        return GroupByState(spill=spill)
+
+    @classmethod
+    def finalize(cls, state: GroupByState, *args: Any) -> pd.DataFrame:
+        """Combine each spilled partition, or the in-memory partials."""
+
+        spec = group_spec(args[0] if args else None)
+
+        if state.spill is not None:
+            partials = [combine(pieces, spec) for pieces in state.spill.partitions()]
+        elif state.partial is not None:
+            partials = [state.partial]
+        else:
+            partials = []
+
+        if not partials:
+            empty = pd.DataFrame(
+                columns=[*spec.keys, *[n for n, _, _ in spec.partials()]]
+            )
+            return finish(empty, spec)
+
+        return finish(pd.concat(partials, ignore_index=True), spec)
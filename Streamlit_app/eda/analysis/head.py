@@ -5,19 +5,23 @@ This module provides an analysis implementation that returns
 the first N rows of a pandas DataFrame.
 """
 
-from typing import Any
+from typing import Any, Iterable, Optional
 
 import pandas as pd
 
-from ..analysis_base import AnalysisBase
+from ..analysis_base import MergeableAnalysis
 
+HeadState = Optional[pd.DataFrame]
 
-class Head(AnalysisBase):
+
+class Head(MergeableAnalysis):
     """
     Analysis implementation that previews dataset rows.
 
     This analysis returns the first N rows of the dataset
-    to provide a quick overview of the data.
+    to provide a quick overview of the data. The partial state
+    holds at most N leading rows. Rows are copied out of the input,
+    so a cached preview does not keep the whole dataset alive.
     """
 
     @classmethod
@@ -31,8 +35,69 @@ class Head(AnalysisBase):
                 the number of rows to return.
 
         Returns:
-            A pandas DataFrame containing the first N rows.
+            A pandas DataFrame containing a copy of the first N rows.
         """
 
         n = args[0] if args else 5
-        return data.head(n)
+        return data.head(n).copy()
+
+    @classmethod
+    def init(cls, *args: Any) -> HeadState:
+        """Return the state of an empty partition."""
+
+        return None
+
+    @classmethod
+    def is_full(cls, state: HeadState, *args: Any) -> bool:
+        """Return whether the state already holds the requested rows."""
+
+        n = args[0] if args else 5
+        return state is not None and n is not None and len(state) >= n
+
+    @classmethod
+    def update(cls, state: HeadState, chunk: pd.DataFrame, *args: Any) -> HeadState:
+        """Append leading rows of the chunk until N rows are held."""
+
+        return cls.merge(state, chunk, *args)
+
+    @classmethod
+    def merge(cls, left: HeadState, right: HeadState, *args: Any) -> HeadState:
+        """Keep the first N rows of two adjacent partitions."""
+
+        n = args[0] if args else 5
+
+        if right is None or cls.is_full(left, *args):
+            return left
+        if left is None:
+            return right.head(n).copy()
+
+        return pd.concat([left, right], ignore_index=True).head(n)
+
+    @classmethod
+    def finalize(cls, state: HeadState, *args: Any) -> pd.DataFrame:
+        """Return the collected rows."""
+
+        return pd.DataFrame() if state is None else state
+
+    @classmethod
+    def compute_chunks(cls, chunks: Iterable[pd.DataFrame], *args: Any) -> pd.DataFrame:
+        """
+        Return the first N rows, reading only as many chunks as needed.
+
+        Args:
+            chunks: Iterable of DataFrame chunks in file order.
+            *args: Optional arguments where the first value specifies
+                the number of rows to return.
+
+        Returns:
+            A pandas DataFrame containing the first N rows.
+        """
+
+        state = cls.init(*args)
+
+        for chunk in chunks:
+            state = cls.update(state, chunk, *args)
+            if cls.is_full(state, *args):
+                break
+
+        return cls.finalize(state, *args)
@@ -0,0 +1,338 @@
+"""
+Histogram analysis for EDA.
+
+This module provides an analysis implementation that bins the values
+of numeric columns in a single pass over the data, in memory bounded
+per column whatever the number of rows. While streaming, each column
+keeps at most ``HISTOGRAM_RESOLUTION`` fine bins whose width is a power
+of two. Values outside the current range widen the bins by whole
+powers of two, merging neighbours, so fine bins of any two partitions
+always nest and can be added. The result is re-binned from the fine
+bins into at most ``n`` bins spanning each column's observed range.
+"""
+
+import math
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional, Set
+
+import numpy as np
+import pandas as pd
+
+from ..analysis_base import MergeableAnalysis, numeric_labels
+from ..config import HISTOGRAM_BINS, HISTOGRAM_RESOLUTION
+
+HISTOGRAM_COLUMNS = ["Column", "Lower", "Upper", "Count"]
+
+
+@dataclass
+class BinnedColumn:
+    """
+    Fine histogram of one column.
+
+    Bin ``k`` covers ``[k * 2**exponent, (k + 1) * 2**exponent)``.
+
+    Attributes:
+        exponent: Base-2 logarithm of the bin width.
+        start: Index of the first bin.
+        counts: Number of values in each consecutive bin.
+        low: Smallest value seen.
+        high: Largest value seen.
+    """
+
+    exponent: int
+    start: int
+    counts: np.ndarray
+    low: float
+    high: float
+
+
+@dataclass
+class HistogramState:
+    """
+    Partial aggregate for the histogram analysis.
+
+    Attributes:
+        columns: Column labels in first-seen order.
+        non_numeric: Columns that were non-numeric in at least one chunk.
+        bins: Fine histograms of the columns holding finite values.
+    """
+
+    columns: List[Any] = field(default_factory=list)
+    non_numeric: Set[Any] = field(default_factory=set)
+    bins: Dict[Any, BinnedColumn] = field(default_factory=dict)
+
+
+def bin_exponent(
+    low: float, high: float, minimum: int, resolution: int = HISTOGRAM_RESOLUTION
+) -> int:
+    """
+    Return the smallest bin width exponent covering a range in few bins.
+
+    Widths are also kept large enough for bin indexes to be exact in
+    floating point.
+
+    Args:
+        low: Smallest value of the range.
+        high: Largest value of the range.
+        minimum: Smallest acceptable exponent.
+        resolution: Maximum number of bins spanning the range.
+
+    Returns:
+        The exponent.
+    """
+
+    exponent = minimum
+    magnitude = max(abs(low), abs(high))
+
+    if magnitude > 0:
+        exponent = max(exponent, math.frexp(magnitude)[1] - 53)
+
+    if high > low:
+        exponent = max(exponent, math.frexp((high - low) / resolution)[1])
+
+    while math.floor(math.ldexp(high, -exponent)) - math.floor(
+        math.ldexp(low, -exponent)
+    ) >= max(resolution, 1):
+        exponent += 1
+
+    return exponent
+
+
+def coarsen(binned: BinnedColumn, exponent: int) -> BinnedColumn:
+    """
+    Merge fine bins into the bins of a larger power-of-two width.
+
+    Args:
+        binned: Fine histogram of a column.
+        exponent: Exponent of the new bin width, at least ``binned.exponent``.
+
+    Returns:
+        The histogram with bins of width ``2**exponent``.
+    """
+
+    shift = exponent - binned.exponent
+
+    if shift == 0:
+        return binned
+
+    indexes = np.arange(binned.start, binned.start + len(binned.counts), dtype=np.int64)
+    indexes >>= min(shift, 62)
+    start = int(indexes[0])
+    counts = np.bincount(indexes - start, weights=binned.counts).astype("int64")
+
+    return BinnedColumn(exponent, start, counts, binned.low, binned.high)
+
+
+def bin_values(values: np.ndarray, exponent: int = -1074) -> BinnedColumn:
+    """
+    Count finite values into fine bins.
+
+    Args:
+        values: Non-empty array of finite values.
+        exponent: Smallest acceptable bin width exponent.
+
+    Returns:
+        The fine histogram of ``values``.
+    """
+
+    low, high = float(values.min()), float(values.max())
+    exponent = bin_exponent(low, high, exponent)
+
+    indexes = np.floor(np.ldexp(values, -exponent)).astype(np.int64)
+    start = math.floor(math.ldexp(low, -exponent))
+    counts = np.bincount(indexes - start).astype("int64")
+
+    return BinnedColumn(exponent, start, counts, low, high)
+
+
+def merge_binned(left: BinnedColumn, right: BinnedColumn) -> BinnedColumn:
+    """
+    Add the fine histograms of a column in two partitions.
+
+    Args:
+        left: Histogram of the first partition.
+        right: Histogram of the second partition.
+
+    Returns:
+        The histogram of both partitions, with bins as wide as needed to
+        stay within ``HISTOGRAM_RESOLUTION``.
+    """
+
+    low, high = min(left.low, right.low), max(left.high, right.high)
+    exponent = bin_exponent(low, high, max(left.exponent, right.exponent))
+    left, right = coarsen(left, exponent), coarsen(right, exponent)
+
+    start = min(left.start, right.start)
+    stop = max(left.start + len(left.counts), right.start + len(right.counts))
+    counts = np.zeros(stop - start, dtype="int64")
+
+    for part in (left, right):
+        counts[
+            part.start - start : part.start - start + len(part.counts)
+        ] += part.counts
+
+    return BinnedColumn(exponent, start, counts, low, high)
+
+
+def rebin(label: Any, binned: BinnedColumn, bins: int) -> pd.DataFrame:
+    """
+    Group consecutive fine bins into at most ``bins`` result bins.
+
+    Args:
+        label: Column label.
+        binned: Fine histogram of the column.
+        bins: Maximum number of result bins.
+
+    Returns:
+        One row per result bin, with ``HISTOGRAM_COLUMNS``. The outer
+        edges are the column's extremes, and the last bin includes its
+        upper edge.
+    """
+
+    group = math.ceil(len(binned.counts) / bins)
+    offsets = np.arange(0, len(binned.counts), group)
+    counts = np.add.reduceat(binned.counts, offsets)
+
+    lower = np.ldexp((binned.start + offsets).astype("float64"), binned.exponent)
+    upper = np.ldexp(
+        (binned.start + offsets + group).astype("float64"), binned.exponent
+    )
+    lower[0], upper[-1] = binned.low, binned.high
+
+    return pd.DataFrame(
+        {
+            "Column": [label] * len(counts),
+            "Lower": lower,
+            "Upper": upper,
+            "Count": counts.astype("int64"),
+        }
+    )
+
+
+def bin_count(n: Any) -> int:
+    """
+    Validate the number of result bins requested.
+
+    Args:
+        n: Analysis parameter, or ``None`` for ``HISTOGRAM_BINS``.
+
+    Returns:
+        The number of bins.
+
+    Raises:
+        ValueError: If ``n`` is not positive.
+    """
+
+    bins = int(n) if n is not None else HISTOGRAM_BINS
+
+    if bins < 1:
+        raise ValueError(f"Number of bins must be positive, got {n}")
+
+    return bins
+
+
+class Histogram(MergeableAnalysis):
+    """
+    Analysis implementation that bins numeric columns.
+
+    This analysis returns the value distribution of every numeric
+    column as a long table of bins, at most ``n`` per column, in the
+    column order of the dataset. Missing and infinite values are not
+    counted, and columns without finite values have no bins. In-memory
+    frames are binned like a single chunk, so every engine produces the
+    same bins.
+    """
+
+    @classmethod
+    def compute(cls, data: pd.DataFrame, *args: Any) -> pd.DataFrame:
+        """
+        Bin the numeric columns of the dataset.
+
+        Args:
+            data: Input pandas DataFrame.
+            *args: Optional maximum number of bins per column, by
+                default ``HISTOGRAM_BINS``.
+
+        Returns:
+            A pandas DataFrame with ``HISTOGRAM_COLUMNS``.
+        """
+
+        return cls.finalize(cls.update(cls.init(), data), *args)
+
+    @classmethod
+    def required_columns(cls, dtypes: pd.Series, *args: Any):
+        """Read only the numeric columns, or all if there are none."""
+
+        return numeric_labels(dtypes) or None
+
+    @classmethod
+    def estimate(cls, sample: pd.DataFrame, population_rows: int, *args: Any):
+        """Scale the sampled bin counts to the population."""
+
+        result = cls.compute(sample, *args)
+        scale = population_rows / len(sample) if len(sample) else 0.0
+        result["Count"] = (result["Count"] * scale).round().astype("int64")
+
+        return result
+
+    @classmethod
+    def init(cls, *args: Any) -> HistogramState:
+        """Return the state of an empty partition."""
+
+        return HistogramState()
+
+    @classmethod
+    def update(
+        cls, state: HistogramState, chunk: pd.DataFrame, *args: Any
+    ) -> HistogramState:
+        """Bin the chunk's finite numeric values into the state."""
+
+        labels = numeric_labels(chunk.dtypes)
+        partial = HistogramState(
+            columns=list(chunk.columns),
+            non_numeric=set(chunk.columns.difference(labels)),
+        )
+
+        for label in labels:
+            values = chunk[label].to_numpy(dtype="float64", na_value=np.nan)
+            values = values[np.isfinite(values)]
+
+            if len(values):
+                known: Optional[BinnedColumn] = state.bins.get(label)
+                exponent = known.exponent if known is not None else -1074
+                partial.bins[label] = bin_values(values, exponent)
+
+        return cls.merge(state, partial)
+
+    @classmethod
+    def merge(
+        cls, left: HistogramState, right: HistogramState, *args: Any
+    ) -> HistogramState:
+        """Add the fine histograms of two partitions column by column."""
+
+        bins = dict(left.bins)
+
+        for label, binned in right.bins.items():
+            bins[label] = merge_binned(bins[label], binned) if label in bins else binned
+
+        return HistogramState(
+            columns=left.columns + [c for c in right.columns if c not in left.columns],
+            non_numeric=left.non_numeric | right.non_numeric,
+            bins=bins,
+        )
+
+    @classmethod
+    def finalize(cls, state: HistogramState, *args: Any) -> pd.DataFrame:
+        """Re-bin the fine histograms of columns numeric in every chunk."""
+
+        bins = bin_count(args[0] if args else None)
+        frames = [
+            rebin(label, state.bins[label], bins)
+            for label in state.columns
+            if label not in state.non_numeric and label in state.bins
+        ]
+
+        if not frames:
+            return pd.DataFrame(columns=HISTOGRAM_COLUMNS)
+
+        return pd.concat(frames, ignore_index=True)
@@ -5,19 +5,46 @@ This module provides an analysis implementation that computes
 mean values for numeric columns in a pandas DataFrame.
 """
 
-from typing import Any
+from dataclasses import dataclass, field
+from typing import Any, List, Set
 
+import numpy as np
 import pandas as pd
 
-from ..analysis_base import AnalysisBase
+from ..analysis_base import (
+    MergeableAnalysis,
+    numeric_labels,
+    sql_identifier,
+    sql_numeric_labels,
+)
+from ..sampling import fpc, z_score
 
 
-class Mean(AnalysisBase):
+@dataclass
+class MeanState:
+    """
+    Partial aggregate for the mean analysis.
+
+    Attributes:
+        columns: Column labels in first-seen order.
+        non_numeric: Columns that were non-numeric in at least one chunk.
+        sums: Per-column sum of numeric values.
+        counts: Per-column count of non-null numeric values.
+    """
+
+    columns: List[Any] = field(default_factory=list)
+    non_numeric: Set[Any] = field(default_factory=set)
+    sums: pd.Series = field(default_factory=lambda: pd.Series(dtype="float64"))
+    counts: pd.Series = field(default_factory=lambda: pd.Series(dtype="int64"))
+
+
+class Mean(MergeableAnalysis):
     """
     Analysis implementation that computes column-wise means.
 
     This analysis calculates the mean for all numeric columns
-    in the dataset.
+    in the dataset. Partial states carry running sums and counts,
+    and a column is only reported if it is numeric in every chunk.
     """
 
     @classmethod
@@ -35,3 +62,104 @@ class Mean(AnalysisBase):
         """
 
         return data.select_dtypes(include="number").mean().to_frame("Mean")
+
+    @classmethod
+    def required_columns(cls, dtypes: pd.Series, *args: Any):
+        """Read only the numeric columns, or all if there are none."""
+
+        return numeric_labels(dtypes) or None
+
+    @classmethod
+    def from_profile(cls, profile: pd.DataFrame, *args: Any):
+        """Read the numeric column means off the fused profile."""
+
+        numeric = profile[profile["Numeric"]]
+
+        return pd.DataFrame(
+            {"Mean": numeric["Mean"].to_numpy()},
+            index=pd.Index(numeric["Column"].to_numpy()),
+        )
+
+    @classmethod
+    def compute_relation(cls, relation: Any, *args: Any):
+        """Sum and count the numeric columns in a single SQL aggregate."""
+
+        numeric = sql_numeric_labels(relation)
+        state = MeanState(
+            columns=list(relation.columns),
+            non_numeric=set(relation.columns) - set(numeric),
+        )
+
+        if numeric:
+            expressions = [
+                f"sum({sql_identifier(c)})::DOUBLE, count({sql_identifier(c)})"
+                for c in numeric
+            ]
+            row = relation.aggregate(", ".join(expressions)).fetchone()
+
+            state.sums = pd.Series(row[0::2], index=numeric, dtype="float64")
+            state.counts = pd.Series(row[1::2], index=numeric, dtype="int64")
+
+        return cls.finalize(state)
+
+    @classmethod
+    def compute_plan(cls, plan: Any, *args: Any):
+        """Average the numeric subset shared with other analyses."""
+
+        return plan.get("numeric").mean().to_frame("Mean")
+
+    @classmethod
+    def estimate(cls, sample: pd.DataFrame, population_rows: int, *args: Any):
+        """Report sample means with normal confidence intervals."""
+
+        numeric = sample.select_dtypes(include="number")
+        means = numeric.mean()
+        error = numeric.std() / np.sqrt(numeric.count())
+        error *= z_score() * fpc(len(sample), population_rows)
+
+        return pd.DataFrame(
+            {"Mean": means, "CI low": means - error, "CI high": means + error}
+        )
+
+    @classmethod
+    def init(cls, *args: Any) -> MeanState:
+        """Return the state of an empty partition."""
+
+        return MeanState()
+
+    @classmethod
+    def update(cls, state: MeanState, chunk: pd.DataFrame, *args: Any) -> MeanState:
+        """Fold the chunk's numeric sums and counts into the state."""
+
+        numeric = chunk.select_dtypes(include="number")
+
+        partial = MeanState(
+            columns=list(chunk.columns),
+            non_numeric=set(chunk.columns.difference(numeric.columns)),
+            sums=numeric.sum(),
+            counts=numeric.count(),
+        )
+
+        return cls.merge(state, partial)
+
+    @classmethod
+    def merge(cls, left: MeanState, right: MeanState, *args: Any) -> MeanState:
+        """Add sums and counts of two partitions."""
+
+        columns = left.columns + [c for c in right.columns if c not in left.columns]
+
+        return MeanState(
+            columns=columns,
+            non_numeric=left.non_numeric | right.non_numeric,
+            sums=left.sums.add(right.sums, fill_value=0),
+            counts=left.counts.add(right.counts, fill_value=0),
+        )
+
+    @classmethod
+    def finalize(cls, state: MeanState, *args: Any):
+        """Divide the accumulated sums by counts."""
+
+        keep = [c for c in state.columns if c not in state.non_numeric]
+        means = state.sums.reindex(keep) / state.counts.reindex(keep)
+
+        return means.astype("float64").to_frame("Mean")
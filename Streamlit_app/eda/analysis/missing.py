@@ -5,19 +5,23 @@ This module provides an analysis implementation that counts
 missing (null) values for each column in a pandas DataFrame.
 """
 
-from typing import Any
+from typing import Any, Optional
 
 import pandas as pd
 
-from ..analysis_base import AnalysisBase
+from ..analysis_base import MergeableAnalysis, sql_identifier
+from ..sampling import wilson_interval
 
+MissingState = Optional[pd.Series]
 
-class Missing(AnalysisBase):
+
+class Missing(MergeableAnalysis):
     """
     Analysis implementation that counts missing values per column.
 
     This analysis computes the total number of null entries
-    for each column in the dataset.
+    for each column in the dataset. The partial state is a Series
+    of per-column null counts, or ``None`` for an empty partition.
     """
 
     @classmethod
@@ -38,3 +42,87 @@ class Missing(AnalysisBase):
         df = series.to_frame(name="Missing").reset_index()
 
         return df
+
+    @classmethod
+    def from_profile(cls, profile: pd.DataFrame, *args: Any):
+        """Read the missing counts off the fused profile."""
+
+        return pd.DataFrame(
+            {
+                "index": profile["Column"].to_numpy(),
+                "Missing": profile["Missing"].to_numpy(),
+            }
+        )
+
+    @classmethod
+    def compute_relation(cls, relation: Any, *args: Any):
+        """Count the nulls of every column in a single SQL aggregate."""
+
+        columns = list(relation.columns)
+        expressions = [f"count(*) - count({sql_identifier(c)})" for c in columns]
+        row = relation.aggregate(", ".join(expressions)).fetchone()
+
+        return cls.finalize(pd.Series(row, index=columns, dtype="int64"))
+
+    @classmethod
+    def compute_plan(cls, plan: Any, *args: Any):
+        """Read the missing counts off the shared null mask."""
+
+        return plan.get("null_counts").to_frame(name="Missing").reset_index()
+
+    @classmethod
+    def estimate(cls, sample: pd.DataFrame, population_rows: int, *args: Any):
+        """Scale sampled null rates to the population with Wilson intervals."""
+
+        rate = sample.isna().mean() if len(sample) else sample.isna().sum() * 0.0
+        low, high = wilson_interval(rate, len(sample), population_rows)
+
+        df = pd.DataFrame(
+            {
+                "Missing": (rate * population_rows).round().astype("int64"),
+                "Missing %": rate * 100,
+                "CI low %": low * 100,
+                "CI high %": high * 100,
+            }
+        )
+
+        return df.reset_index()
+
+    @classmethod
+    def init(cls, *args: Any) -> MissingState:
+        """Return the state of an empty partition."""
+
+        return None
+
+    @classmethod
+    def update(
+        cls, state: MissingState, chunk: pd.DataFrame, *args: Any
+    ) -> MissingState:
+        """Add the chunk's per-column null counts."""
+
+        return cls.merge(state, chunk.isna().sum())
+
+    @classmethod
+    def merge(cls, left: MissingState, right: MissingState, *args: Any) -> MissingState:
+        """Sum per-column null counts, keeping the left column order."""
+
+        if left is None:
+            return right
+        if right is None:
+            return left
+
+        return left.add(right, fill_value=0).reindex(
+            left.index.append(right.index.difference(left.index))
+        )
+
+    @classmethod
+    def finalize(cls, state: MissingState, *args: Any):
+        """Format the accumulated counts like `compute`."""
+
+        if state is None:
+            state = pd.Series(dtype="int64")
+
+        series = state.astype("int64")
+        df = series.to_frame(name="Missing").reset_index()
+
+        return df
@@ -0,0 +1,289 @@
+"""
+Fused column profile analysis for EDA.
+
+This module provides an analysis implementation that computes data
+types, missing and distinct counts, means and descriptive statistics
+for every column in a single pass. Numeric columns are processed in
+blocks with one sort per block, from which counts, distinct values,
+extrema and quartiles are all read off. Distinct values of integer
+columns too large for float64 are counted on their own dtype.
+"""
+
+from typing import Any, Dict, Optional
+
+import numpy as np
+import pandas as pd
+
+from ..analysis_base import MergeableAnalysis
+from .data_types import DataTypes
+from .describe import Describe
+from .missing import Missing
+from .unique import Unique
+
+PROFILE_COLUMNS = [
+    "Column",
+    "Type",
+    "Numeric",
+    "Count",
+    "Missing",
+    "Unique",
+    "Mean",
+    "Std",
+    "Min",
+    "25%",
+    "50%",
+    "75%",
+    "Max",
+]
+NUMERIC_STATISTICS = ["Mean", "Std", "Min", "25%", "50%", "75%", "Max"]
+BLOCK_COLUMNS = 64
+FLOAT_EXACT_INTEGER = 2**53
+
+ProfileState = Dict[str, Any]
+
+
+def numeric_columns(data: pd.DataFrame) -> pd.Index:
+    """
+    Return the labels of columns summarised as numeric.
+
+    This matches ``select_dtypes(include="number")`` as used by the
+    mean and describe analyses, minus timedeltas.
+
+    Args:
+        data: Input pandas DataFrame.
+
+    Returns:
+        The numeric column labels in frame order.
+    """
+
+    return data.select_dtypes(include="number", exclude="timedelta").columns
+
+
+def exceeds_float(column: pd.Series, stats: pd.Series) -> bool:
+    """
+    Whether distinct integers of a column may collide as float64 values.
+
+    Integers beyond ``2**53`` in magnitude are not all representable in
+    float64, so blocks cast to it can undercount their distinct values.
+
+    Args:
+        column: Numeric column of the profiled frame.
+        stats: Profile row of the column, with ``Min`` and ``Max``.
+
+    Returns:
+        ``True`` for integer columns reaching ``2**53`` in magnitude.
+    """
+
+    if column.dtype.kind not in "iu":
+        return False
+
+    return max(abs(stats["Min"]), abs(stats["Max"])) >= FLOAT_EXACT_INTEGER
+
+
+def summarize_block(values: np.ndarray) -> Dict[str, np.ndarray]:
+    """
+    Compute per-column statistics of a 2-D float block with one sort.
+
+    Args:
+        values: Array of shape ``(rows, columns)`` with NaN for nulls.
+
+    Returns:
+        A mapping from statistic name to a per-column array.
+    """
+
+    rows, width = values.shape
+    ordered = np.sort(values, axis=0)
+    count = rows - np.isnan(ordered).sum(axis=0)
+    has_values = count > 0
+
+    with np.errstate(invalid="ignore", divide="ignore"):
+        mean = np.nansum(ordered, axis=0) / count
+        squares = np.nansum((ordered - mean) ** 2, axis=0)
+        std = np.sqrt(squares / (count - 1))
+
+    std[count < 2] = np.nan
+    stats: Dict[str, np.ndarray] = {"Count": count, "Mean": mean, "Std": std}
+
+    columns = np.arange(width)
+    last = np.maximum(count - 1, 0)
+
+    for label, q in (("Min", 0.0), ("25%", 0.25), ("50%", 0.5), ("75%", 0.75)):
+        position = q * last
+        lower = np.floor(position).astype(np.intp)
+        upper = np.ceil(position).astype(np.intp)
+        low = ordered[lower, columns] if rows else np.full(width, np.nan)
+        high = ordered[upper, columns] if rows else np.full(width, np.nan)
+        stats[label] = np.where(
+            has_values, low + (high - low) * (position - lower), np.nan
+        )
+
+    stats["Max"] = np.where(
+        has_values, ordered[last, columns] if rows else np.nan, np.nan
+    )
+
+    if rows > 1:
+        changes = ordered[1:] != ordered[:-1]
+        in_range = np.arange(1, rows)[:, None] < count[None, :]
+        stats["Unique"] = np.where(has_values, 1 + (changes & in_range).sum(axis=0), 0)
+    else:
+        stats["Unique"] = count.copy()
+
+    return stats
+
+
+def profile_frame(data: pd.DataFrame) -> pd.DataFrame:
+    """
+    Build the fused profile table for an in-memory DataFrame.
+
+    Args:
+        data: Input pandas DataFrame.
+
+    Returns:
+        A DataFrame with one row per column and ``PROFILE_COLUMNS``.
+    """
+
+    numeric = numeric_columns(data)
+    summary = pd.DataFrame(index=pd.RangeIndex(data.shape[1]), columns=PROFILE_COLUMNS)
+    summary["Column"] = list(data.columns)
+    summary["Type"] = data.dtypes.astype(str).to_numpy()
+    summary["Numeric"] = data.columns.isin(numeric)
+
+    positions = np.flatnonzero(summary["Numeric"].to_numpy())
+
+    for start in range(0, len(positions), BLOCK_COLUMNS):
+        block = positions[start : start + BLOCK_COLUMNS]
+        values = data.iloc[:, block].to_numpy(dtype="float64", na_value=np.nan)
+
+        for label, column_stats in summarize_block(values).items():
+            summary.loc[block, label] = column_stats
+
+    for position in positions:
+        column = data.iloc[:, position]
+        if exceeds_float(column, summary.loc[position]):
+            summary.loc[position, "Unique"] = int(column.nunique())
+
+    for position in np.flatnonzero(~summary["Numeric"].to_numpy()):
+        column = data.iloc[:, position]
+        summary.loc[position, "Count"] = int(column.count())
+        summary.loc[position, "Unique"] = int(column.nunique())
+
+    return finish_profile(summary, rows=len(data))
+
+
+def finish_profile(summary: pd.DataFrame, rows: int) -> pd.DataFrame:
+    """
+    Derive missing counts and normalise dtypes of a profile table.
+
+    Args:
+        summary: Profile table with ``Count`` filled in for every column.
+        rows: Number of rows in the profiled dataset.
+
+    Returns:
+        The completed profile table.
+    """
+
+    summary["Count"] = summary["Count"].astype("int64")
+    summary["Missing"] = rows - summary["Count"]
+    summary["Unique"] = summary["Unique"].astype("int64")
+    summary["Numeric"] = summary["Numeric"].astype(bool)
+    summary[NUMERIC_STATISTICS] = summary[NUMERIC_STATISTICS].astype("float64")
+
+    return summary
+
+
+class Profile(MergeableAnalysis):
+    """
+    Analysis implementation that profiles every column at once.
+
+    This analysis reports each column's data type, non-null, missing
+    and distinct counts, and for numeric columns the mean, standard
+    deviation, extrema and quartiles. Streamed input gets the quartiles
+    of the describe analysis's sketches. Its output can be converted into
+    the results of the data type, describe, mean, missing and unique
+    analyses through their ``from_profile`` methods.
+    """
+
+    @classmethod
+    def compute(cls, data: pd.DataFrame, *args: Any) -> pd.DataFrame:
+        """
+        Profile all columns of the dataset in a single pass.
+
+        Args:
+            data: Input pandas DataFrame.
+            *args: Unused; included for interface compatibility.
+
+        Returns:
+            A pandas DataFrame with one row per column.
+        """
+
+        return profile_frame(data)
+
+    @classmethod
+    def init(cls, *args: Any) -> ProfileState:
+        """Return the component states of an empty partition."""
+
+        return {
+            "rows": 0,
+            "data_types": DataTypes.init(),
+            "describe": Describe.init(),
+            "unique": Unique.init(),
+            "missing": Missing.init(),
+        }
+
+    @classmethod
+    def update(
+        cls, state: ProfileState, chunk: pd.DataFrame, *args: Any
+    ) -> ProfileState:
+        """Fold the chunk into each component state."""
+
+        return {
+            "rows": state["rows"] + len(chunk),
+            "data_types": DataTypes.update(state["data_types"], chunk),
+            "describe": Describe.update(state["describe"], chunk),
+            "unique": Unique.update(state["unique"], chunk),
+            "missing": Missing.update(state["missing"], chunk),
+        }
+
+    @classmethod
+    def merge(cls, left: ProfileState, right: ProfileState, *args: Any) -> ProfileState:
+        """Merge the component states of two partitions."""
+
+        return {
+            "rows": left["rows"] + right["rows"],
+            "data_types": DataTypes.merge(left["data_types"], right["data_types"]),
+            "describe": Describe.merge(left["describe"], right["describe"]),
+            "unique": Unique.merge(left["unique"], right["unique"]),
+            "missing": Missing.merge(left["missing"], right["missing"]),
+        }
+
+    @classmethod
+    def finalize(cls, state: ProfileState, *args: Any) -> pd.DataFrame:
+        """Assemble the profile table from the component results."""
+
+        dtypes = DataTypes.finalize(state["data_types"]).set_index("index")["Value"]
+        unique = Unique.finalize(state["unique"]).set_index("index")["Value"]
+        missing = Missing.finalize(state["missing"]).set_index("index")["Missing"]
+        stats = Describe.finalize(state["describe"])
+
+        summary = pd.DataFrame(
+            {
+                "Column": dtypes.index,
+                "Type": dtypes.to_numpy(),
+                "Numeric": dtypes.index.isin(stats.columns),
+                "Count": state["rows"] - missing.reindex(dtypes.index).to_numpy(),
+                "Unique": unique.reindex(dtypes.index).to_numpy(),
+            },
+            columns=PROFILE_COLUMNS,
+        )
+
+        described = stats.T.reindex(dtypes.index)
+        described = described.rename(columns=str.capitalize)
+        summary[NUMERIC_STATISTICS] = described[NUMERIC_STATISTICS].to_numpy()
+
+        return finish_profile(summary, rows=state["rows"])
+
+    @classmethod
+    def from_profile(cls, profile: pd.DataFrame, *args: Any) -> Optional[pd.DataFrame]:
+        """Return the profile table itself."""
+
+        return profile
@@ -5,19 +5,22 @@ This module provides an analysis implementation that reports
 the shape (rows, columns) of a pandas DataFrame.
 """
 
-from typing import Any
+from typing import Any, Tuple
 
 import pandas as pd
 
-from ..analysis_base import AnalysisBase
+from ..analysis_base import MergeableAnalysis
 
+ShapeState = Tuple[int, int]
 
-class Shape(AnalysisBase):
+
+class Shape(MergeableAnalysis):
     """
     Analysis implementation that reports dataset dimensions.
 
     This analysis returns the number of rows and columns
-    in the dataset as a human-readable summary.
+    in the dataset as a human-readable summary. The partial state
+    is a ``(rows, columns)`` tuple.
     """
 
     @classmethod
@@ -35,3 +38,44 @@ class Shape(AnalysisBase):
         """
 
         return f"The shape of the DataFrame is {data.shape}"
+
+    @classmethod
+    def compute_relation(cls, relation: Any, *args: Any):
+        """Count the rows in SQL."""
+
+        (rows,) = relation.aggregate("count(*)").fetchone()
+
+        return cls.finalize((int(rows), len(relation.columns)))
+
+    @classmethod
+    def estimate(cls, sample: pd.DataFrame, population_rows: int, *args: Any):
+        """Report the estimated row count of the dataset."""
+
+        shape = (population_rows, sample.shape[1])
+
+        return f"The shape of the DataFrame is approximately {shape}"
+
+    @classmethod
+    def init(cls, *args: Any) -> ShapeState:
+        """Return the shape of an empty partition."""
+
+        return 0, 0
+
+    @classmethod
+    def update(cls, state: ShapeState, chunk: pd.DataFrame, *args: Any) -> ShapeState:
+        """Add the chunk's rows to the running row count."""
+
+        rows, columns = state
+        return rows + len(chunk), max(columns, chunk.shape[1])
+
+    @classmethod
+    def merge(cls, left: ShapeState, right: ShapeState, *args: Any) -> ShapeState:
+        """Sum row counts of two partitions."""
+
+        return left[0] + right[0], max(left[1], right[1])
+
+    @classmethod
+    def finalize(cls, state: ShapeState, *args: Any):
+        """Format the accumulated shape like `compute`."""
+
+        return f"The shape of the DataFrame is {state}"
@@ -1,23 +1,31 @@
 """
 Unique value analysis for EDA.
 
-This module provides an analysis implementation that counts
-the number of distinct values in each column of a pandas DataFrame.
+This module provides analysis implementations that count the number
+of distinct values in each column of a pandas DataFrame, either exactly
+or approximately with fixed memory per column.
 """
 
-from typing import Any
+from typing import Any, Dict, Hashable, Set
 
 import pandas as pd
 
-from ..analysis_base import AnalysisBase
+from ..analysis_base import MergeableAnalysis
+from ..ingest import row_blocks
+from ..sketches import HyperLogLog
 
+UniqueState = Dict[Hashable, Set[Any]]
+ApproxUniqueState = Dict[Hashable, HyperLogLog]
 
-class Unique(AnalysisBase):
+
+class Unique(MergeableAnalysis):
     """
     Analysis implementation that counts unique values per column.
 
     This analysis computes the number of distinct (non-null)
-    values for each column in the dataset.
+    values for each column in the dataset. The partial state maps
+    each column to the set of distinct values seen so far, so its
+    size grows with column cardinality.
     """
 
     @classmethod
@@ -38,3 +46,128 @@ class Unique(AnalysisBase):
         df = series.to_frame(name="Value").reset_index()
 
         return df
+
+    @classmethod
+    def from_profile(cls, profile: pd.DataFrame, *args: Any):
+        """Read the distinct counts off the fused profile."""
+
+        return pd.DataFrame(
+            {
+                "index": profile["Column"].to_numpy(),
+                "Value": profile["Unique"].to_numpy(),
+            }
+        )
+
+    @classmethod
+    def compute_plan(cls, plan: Any, *args: Any):
+        """Count the entries of the shared per-column hash tables."""
+
+        return plan.get("distinct_counts").to_frame(name="Value").reset_index()
+
+    @classmethod
+    def init(cls, *args: Any) -> UniqueState:
+        """Return the state of an empty partition."""
+
+        return {}
+
+    @classmethod
+    def update(cls, state: UniqueState, chunk: pd.DataFrame, *args: Any) -> UniqueState:
+        """Add the chunk's distinct non-null values per column."""
+
+        for column in chunk.columns:
+            state.setdefault(column, set()).update(chunk[column].dropna().unique())
+
+        return state
+
+    @classmethod
+    def merge(cls, left: UniqueState, right: UniqueState, *args: Any) -> UniqueState:
+        """Union the distinct value sets of two partitions."""
+
+        merged = {column: set(values) for column, values in left.items()}
+
+        for column, values in right.items():
+            merged.setdefault(column, set()).update(values)
+
+        return merged
+
+    @classmethod
+    def finalize(cls, state: UniqueState, *args: Any):
+        """Count the distinct values collected for each column."""
+
+        series = pd.Series(
+            {column: len(values) for column, values in state.items()},
+            dtype="int64",
+        )
+        df = series.to_frame(name="Value").reset_index()
+
+        return df
+
+
+class ApproxUnique(MergeableAnalysis):
+    """
+    Analysis implementation that estimates unique values per column.
+
+    This analysis keeps one HyperLogLog sketch per column, so memory
+    stays constant per column regardless of cardinality. Each estimate
+    is reported with its relative standard error.
+    """
+
+    @classmethod
+    def compute(cls, data: pd.DataFrame, *args: Any):
+        """
+        Estimate the number of unique values for each column.
+
+        Args:
+            data: Input pandas DataFrame.
+            *args: Unused; included for interface compatibility.
+
+        Returns:
+            A pandas DataFrame with column names, the estimated count of
+            unique values and its relative standard error.
+        """
+
+        return cls.compute_chunks(row_blocks(data), *args)
+
+    @classmethod
+    def init(cls, *args: Any) -> ApproxUniqueState:
+        """Return the state of an empty partition."""
+
+        return {}
+
+    @classmethod
+    def update(
+        cls, state: ApproxUniqueState, chunk: pd.DataFrame, *args: Any
+    ) -> ApproxUniqueState:
+        """Add the chunk's non-null values to each column sketch."""
+
+        for column in chunk.columns:
+            state.setdefault(column, HyperLogLog()).update(chunk[column])
+
+        return state
+
+    @classmethod
+    def merge(
+        cls, left: ApproxUniqueState, right: ApproxUniqueState, *args: Any
+    ) -> ApproxUniqueState:
+        """Merge the column sketches of two partitions."""
+
+        merged = dict(left)
+
+        for column, sketch in right.items():
+            merged[column] = (
+                merged[column].merge(sketch) if column in merged else sketch
+            )
+
+        return merged
+
+    @classmethod
+    def finalize(cls, state: ApproxUniqueState, *args: Any):
+        """Report the estimate and relative error for each column."""
+
+        return pd.DataFrame(
+            {
+                "index": list(state),
+                "Value": [round(s.estimate()) for s in state.values()],
+                "Relative error": [s.relative_error for s in state.values()],
+            }
+        )
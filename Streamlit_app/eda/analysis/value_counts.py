@@ -1,23 +1,30 @@
 """
 Value frequency analysis for EDA.
 
-This module provides an analysis implementation that computes
-frequency counts for values in a specified column of a pandas DataFrame.
+This module provides analysis implementations that compute frequency
+counts for values in a specified column of a pandas DataFrame, either
+exactly or as an approximate top-k with bounded memory.
 """
 
-from typing import Any
+from typing import Any, Optional
 
+import numpy as np
 import pandas as pd
 
-from ..analysis_base import AnalysisBase
+from ..analysis_base import MergeableAnalysis, sql_identifier
+from ..ingest import row_blocks
+from ..sketches import SpaceSaving
 
+ValueCountsState = Optional[pd.Series]
 
-class ValueCounts(AnalysisBase):
+
+class ValueCounts(MergeableAnalysis):
     """
     Analysis implementation that computes value frequencies.
 
     This analysis calculates how often each distinct value
-    appears in a specified column.
+    appears in a specified column. The partial state is the Series
+    of counts seen so far, or ``None`` for an empty partition.
     """
 
     @classmethod
@@ -43,3 +50,199 @@ class ValueCounts(AnalysisBase):
         df = s.to_frame(name="Count").reset_index()
 
         return df
+
+    @classmethod
+    def required_columns(cls, dtypes: pd.Series, *args: Any):
+        """Read only the selected column."""
+
+        column = args[0] if args else None
+        return None if column is None else [column]
+
+    @classmethod
+    def estimate(cls, sample: pd.DataFrame, population_rows: int, *args: Any):
+        """Scale the sampled counts to the population."""
+
+        df = cls.compute(sample, *args)
+        scale = population_rows / len(sample) if len(sample) else 0.0
+        df["Count"] = (df["Count"] * scale).round().astype("int64")
+
+        return df
+
+    @classmethod
+    def compute_relation(cls, relation: Any, *args: Any):
+        """
+        Count the values of the selected column with a SQL ``GROUP BY``.
+
+        Raises:
+            KeyError: If the specified column does not exist.
+        """
+
+        column = args[0] if args else None
+
+        if column not in relation.columns:
+            raise KeyError(column)
+
+        name = sql_identifier(column)
+        counts = (
+            relation.filter(f"{name} IS NOT NULL")
+            .aggregate(f"{name}, count(*)::BIGINT", name)
+            .fetchdf()
+        )
+        state = pd.Series(
+            counts.iloc[:, 1].to_numpy(), index=pd.Index(counts.iloc[:, 0])
+        )
+
+        return cls.finalize(state, column)
+
+    @classmethod
+    def compute_plan(cls, plan: Any, *args: Any):
+        """
+        Count the codes of the column's shared hash table.
+
+        Columns of extension dtypes are left to `compute`, which reports
+        unobserved categories of categoricals and nullable counts for
+        the other extension dtypes.
+
+        Raises:
+            KeyError: If the specified column does not exist.
+        """
+
+        column = args[0] if args else None
+
+        if not isinstance(plan.frame[column].dtype, np.dtype):
+            return None
+
+        codes, uniques = plan.get("hash_table", column)
+        counts = np.bincount(codes[codes >= 0], minlength=len(uniques))
+        s = pd.Series(counts, index=uniques, name="count").sort_values(ascending=False)
+
+        return s.to_frame(name="Count").reset_index()
+
+    @classmethod
+    def init(cls, *args: Any) -> ValueCountsState:
+        """Return the state of an empty partition."""
+
+        return None
+
+    @classmethod
+    def update(
+        cls, state: ValueCountsState, chunk: pd.DataFrame, *args: Any
+    ) -> ValueCountsState:
+        """
+        Add the chunk's value counts for the selected column.
+
+        Raises:
+            KeyError: If the specified column does not exist.
+        """
+
+        column = args[0] if args else None
+
+        return cls.merge(state, chunk[column].value_counts())
+
+    @classmethod
+    def merge(
+        cls, left: ValueCountsState, right: ValueCountsState, *args: Any
+    ) -> ValueCountsState:
+        """Sum the value counts of two partitions."""
+
+        if left is None:
+            return right
+        if right is None:
+            return left
+
+        return left.add(right, fill_value=0)
+
+    @classmethod
+    def finalize(cls, state: ValueCountsState, *args: Any):
+        """Sort the accumulated counts in descending order like `compute`."""
+
+        column = args[0] if args else None
+
+        if state is None:
+            state = pd.Series(dtype="int64", index=pd.Index([], name=column))
+
+        s = state.astype("int64").sort_values(ascending=False, kind="stable")
+        s = s.rename_axis(column)
+        df = s.to_frame(name="Count").reset_index()
+
+        return df
+
+
+class ApproxValueCounts(MergeableAnalysis):
+    """
+    Analysis implementation that estimates the most frequent values.
+
+    This analysis keeps a Space-Saving summary with a fixed number of
+    counters for the selected column. Reported counts never underestimate
+    the true frequency and overestimate it by at most the listed error.
+    """
+
+    @classmethod
+    def compute(cls, data: pd.DataFrame, *args: Any):
+        """
+        Estimate value counts for the most frequent values of a column.
+
+        Args:
+            data: Input pandas DataFrame.
+            *args: Optional arguments where the first value specifies
+                the column name for which value counts are estimated.
+
+        Returns:
+            A pandas DataFrame with the tracked values, their estimated
+            counts and the maximum overestimate of each count.
+
+        Raises:
+            KeyError: If the specified column does not exist.
+        """
+
+        return cls.compute_chunks(row_blocks(data), *args)
+
+    @classmethod
+    def required_columns(cls, dtypes: pd.Series, *args: Any):
+        """Read only the selected column."""
+
+        column = args[0] if args else None
+        return None if column is None else [column]
+
+    @classmethod
+    def init(cls, *args: Any) -> SpaceSaving:
+        """Return the state of an empty partition."""
+
+        return SpaceSaving()
+
+    @classmethod
+    def update(cls, state: SpaceSaving, chunk: pd.DataFrame, *args: Any) -> SpaceSaving:
+        """
+        Add the chunk's values for the selected column to the summary.
+
+        Raises:
+            KeyError: If the specified column does not exist.
+        """
+
+        column = args[0] if args else None
+        state.update(chunk[column])
+
+        return state
+
+    @classmethod
+    def merge(cls, left: SpaceSaving, right: SpaceSaving, *args: Any) -> SpaceSaving:
+        """Merge the summaries of two partitions."""
+
+        return left.merge(right)
+
+    @classmethod
+    def finalize(cls, state: SpaceSaving, *args: Any):
+        """Report tracked values by descending estimated count."""
+
+        column = args[0] if args else None
+        order = state.counts.sort_values(ascending=False, kind="stable").index
+
+        df = pd.DataFrame(
+            {
+                "Count": state.counts.loc[order].to_numpy(),
+                "Max overcount": state.errors.loc[order].to_numpy(),
+            },
+            index=pd.Index(order, name=column),
+        ).reset_index()
+
+        return df
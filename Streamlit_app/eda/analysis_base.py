@@ -2,15 +2,88 @@
 Abstract base definitions for exploratory data analysis (EDA) components.
 
 This module defines the common interface that all EDA analysis
-implementations must follow.
+implementations must follow, along with a partial-aggregate contract
+for analyses that can be computed from chunked or partitioned data.
 """
 
 from abc import ABC, abstractmethod
-from typing import Any, Union
+from typing import Any, Hashable, Iterable, List, Optional, Union
 
 import pandas as pd
 
 AnalysisResult = Union[pd.DataFrame, str]
+PartialState = Any
+
+# DuckDB type names counted as numeric, matching pandas' numeric,
+# non-boolean dtypes.
+SQL_NUMERIC_TYPES = frozenset(
+    {
+        "TINYINT",
+        "SMALLINT",
+        "INTEGER",
+        "BIGINT",
+        "HUGEINT",
+        "UTINYINT",
+        "USMALLINT",
+        "UINTEGER",
+        "UBIGINT",
+        "UHUGEINT",
+        "FLOAT",
+        "DOUBLE",
+        "DECIMAL",
+    }
+)
+
+
+def numeric_labels(dtypes: pd.Series) -> List[Hashable]:
+    """
+    Return the labels of numeric, non-boolean columns.
+
+    Args:
+        dtypes: Column dtypes, as returned by ``DataFrame.dtypes``.
+
+    Returns:
+        The matching column labels in order.
+    """
+
+    return [
+        column
+        for column, dtype in dtypes.items()
+        if pd.api.types.is_numeric_dtype(dtype)
+        and not pd.api.types.is_bool_dtype(dtype)
+    ]
+
+
+def sql_identifier(label: Hashable) -> str:
+    """
+    Quote a column label for use in a DuckDB expression.
+
+    Args:
+        label: Column label.
+
+    Returns:
+        The label as a double-quoted SQL identifier.
+    """
+
+    return '"' + str(label).replace('"', '""') + '"'
+
+
+def sql_numeric_labels(relation: Any) -> List[str]:
+    """
+    Return the labels of a DuckDB relation's numeric columns.
+
+    Args:
+        relation: DuckDB relation.
+
+    Returns:
+        The matching column labels in order.
+    """
+
+    return [
+        column
+        for column, sql_type in zip(relation.columns, relation.types)
+        if str(sql_type).split("(")[0] in SQL_NUMERIC_TYPES
+    ]
 
 
 class AnalysisBase(ABC):
@@ -19,7 +92,17 @@ class AnalysisBase(ABC):
 
     Subclasses must implement the `compute` method to perform
     a specific analysis on a pandas DataFrame and return a result
-    without mutating the input data.
+    without mutating the input data. Subclasses that can aggregate
+    row batches incrementally should also override `compute_chunks`,
+    and those whose result is a view of the fused column profile
+    should override `from_profile`. Analyses that read only some
+    columns should declare them through `required_columns`, and those
+    expressible as SQL aggregates can override `compute_relation` so
+    that out-of-core engines push the work down to DuckDB. Analyses
+    whose results scale with the row count, or that can bound their
+    sampling error, should override `estimate`, and those derivable from
+    intermediates shared with other analyses should override
+    `compute_plan`.
     """
 
     @classmethod
@@ -37,3 +120,235 @@ class AnalysisBase(ABC):
         """
 
         raise NotImplementedError
+
+    @classmethod
+    def required_columns(
+        cls, dtypes: pd.Series, *args: Any
+    ) -> Optional[List[Hashable]]:
+        """
+        Declare the columns the analysis reads.
+
+        Loaders use this to parse or read only the listed columns. The
+        dtypes may come from a sample of the data, so implementations
+        selecting by dtype must treat them as a superset hint and still
+        filter the loaded frame themselves.
+
+        Args:
+            dtypes: Column dtypes of the dataset, as from ``DataFrame.dtypes``.
+            *args: Optional arguments required by the specific analysis.
+
+        Returns:
+            The required column labels, or ``None`` if every column is needed.
+        """
+
+        return None
+
+    @classmethod
+    def compute_chunks(
+        cls, chunks: Iterable[pd.DataFrame], *args: Any
+    ) -> AnalysisResult:
+        """
+        Compute an analysis result from a stream of DataFrame chunks.
+
+        The default implementation concatenates all chunks and delegates
+        to `compute`, which materialises the full dataset. Subclasses
+        should override it to aggregate chunk by chunk in bounded memory.
+
+        Args:
+            chunks: Iterable of DataFrame chunks sharing the same columns.
+            *args: Optional arguments required by the specific analysis.
+
+        Returns:
+            The analysis result, typically a DataFrame or a string summary.
+        """
+
+        return cls.compute(pd.concat(chunks, ignore_index=True), *args)
+
+    @classmethod
+    def from_profile(
+        cls, profile: pd.DataFrame, *args: Any
+    ) -> Optional[AnalysisResult]:
+        """
+        Derive the analysis result from a fused column profile.
+
+        The default implementation returns ``None``, meaning the result
+        cannot be derived and must be computed from the data.
+
+        Args:
+            profile: Output of the ``profile`` analysis for the same dataset.
+            *args: Optional arguments required by the specific analysis.
+
+        Returns:
+            The analysis result, or ``None`` if it is not derivable.
+        """
+
+        return None
+
+    @classmethod
+    def compute_relation(cls, relation: Any, *args: Any) -> Optional[AnalysisResult]:
+        """
+        Compute the analysis as aggregate queries on a DuckDB relation.
+
+        The relation is already projected onto `required_columns`. The
+        default implementation returns ``None``, meaning the analysis has
+        no SQL form and the engine must stream the rows through pandas.
+
+        Args:
+            relation: DuckDB relation over the dataset.
+            *args: Optional arguments required by the specific analysis.
+
+        Returns:
+            The analysis result, or ``None`` if it cannot be pushed down.
+        """
+
+        return None
+
+    @classmethod
+    def compute_plan(cls, plan: Any, *args: Any) -> Optional[AnalysisResult]:
+        """
+        Compute the analysis from intermediates shared between analyses.
+
+        Intermediates requested from the plan are memoised per dataset
+        version, so analyses requesting the same ones avoid rescanning
+        the data. The default implementation returns ``None``, meaning
+        the analysis is computed from the data by an engine.
+
+        Args:
+            plan: ``eda.plan.Plan`` over the in-memory dataset.
+            *args: Optional arguments required by the specific analysis.
+
+        Returns:
+            The analysis result, or ``None`` if it has no plan form.
+        """
+
+        return None
+
+    @classmethod
+    def estimate(
+        cls, sample: pd.DataFrame, population_rows: int, *args: Any
+    ) -> Optional[AnalysisResult]:
+        """
+        Estimate the analysis result from a random sample of rows.
+
+        The default implementation returns ``None``, as results computed
+        on a sample as is would understate counts, and distinct counts
+        cannot be scaled without bias. Subclasses may scale counts to the
+        population and report confidence intervals.
+
+        Args:
+            sample: Randomly sampled rows of the dataset.
+            population_rows: Number of rows in the dataset, possibly
+                estimated.
+            *args: Optional arguments required by the specific analysis.
+
+        Returns:
+            The estimated analysis result, or ``None`` if the analysis
+            has no estimate.
+        """
+
+        return None
+
+
+class MergeableAnalysis(AnalysisBase):
+    """
+    Abstract base class for analyses computable from partial aggregates.
+
+    Subclasses express their computation as a fold over data partitions:
+    `init` creates an empty state, `update` folds one chunk into a state,
+    `merge` combines the states of two adjacent partitions and `finalize`
+    turns a state into the analysis result. States built from independent
+    chunks or workers can therefore be combined without revisiting rows.
+
+    `compute` is still implemented separately so that in-memory frames
+    keep using the vectorised pandas path.
+    """
+
+    @classmethod
+    @abstractmethod
+    def init(cls, *args: Any) -> PartialState:
+        """
+        Create an empty partial state.
+
+        Args:
+            *args: Optional arguments required by the specific analysis.
+
+        Returns:
+            A state representing an empty partition.
+        """
+
+        raise NotImplementedError
+
+    @classmethod
+    @abstractmethod
+    def update(
+        cls, state: PartialState, chunk: pd.DataFrame, *args: Any
+    ) -> PartialState:
+        """
+        Fold a DataFrame chunk into a partial state.
+
+        Args:
+            state: State accumulated from the preceding rows.
+            chunk: Next DataFrame chunk in row order.
+            *args: Optional arguments required by the specific analysis.
+
+        Returns:
+            The updated state. Implementations may mutate and return
+            ``state`` itself.
+        """
+
+        raise NotImplementedError
+
+    @classmethod
+    @abstractmethod
+    def merge(cls, left: PartialState, right: PartialState, *args: Any) -> PartialState:
+        """
+        Combine the states of two adjacent partitions.
+
+        Args:
+            left: State of the partition that comes first in row order.
+            right: State of the partition that follows ``left``.
+            *args: Optional arguments required by the specific analysis.
+
+        Returns:
+            A state equivalent to folding both partitions in order.
+        """
+
+        raise NotImplementedError
+
+    @classmethod
+    @abstractmethod
+    def finalize(cls, state: PartialState, *args: Any) -> AnalysisResult:
+        """
+        Convert a partial state into the analysis result.
+
+        Args:
+            state: Fully accumulated state.
+            *args: Optional arguments required by the specific analysis.
+
+        Returns:
+            The analysis result, typically a DataFrame or a string summary.
+        """
+
+        raise NotImplementedError
+
+    @classmethod
+    def compute_chunks(
+        cls, chunks: Iterable[pd.DataFrame], *args: Any
+    ) -> AnalysisResult:
+        """
+        Compute an analysis result by folding chunks into a partial state.
+
+        Args:
+            chunks: Iterable of DataFrame chunks sharing the same columns.
+            *args: Optional arguments required by the specific analysis.
+
+        Returns:
+            The analysis result, typically a DataFrame or a string summary.
+        """
+
+        state = cls.init(*args)
+
+        for chunk in chunks:
+            state = cls.update(state, chunk, *args)
+
+        return cls.finalize(state, *args)
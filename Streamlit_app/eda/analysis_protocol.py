@@ -2,22 +2,26 @@
 Protocol defining the interface for exploratory data analysis (EDA) analysis classes.
 
 This module declares a structural typing contract that analysis implementations
-must satisfy in order to be compatible with the EDA framework.
+must satisfy in order to be compatible with the EDA framework, plus an extended
+contract for analyses that can be computed from mergeable partial aggregates.
 """
 
-from typing import Any, Protocol, Union
+from typing import Any, Hashable, Iterable, List, Optional, Protocol, Union
 
 import pandas as pd
 
 AnalysisResult = Union[pd.DataFrame, str]
+PartialState = Any
 
 
 class AnalysisProtocol(Protocol):
     """
     Structural typing protocol for EDA analysis implementations.
 
-    Any class conforming to this protocol must provide a `compute` class
-    method with the specified signature.
+    Any class conforming to this protocol must provide `compute`,
+    `compute_chunks`, `from_profile`, `required_columns`,
+    `compute_relation`, `compute_plan` and `estimate` class methods with
+    the specified signatures.
     """
 
     @classmethod
@@ -33,3 +37,167 @@ class AnalysisProtocol(Protocol):
             The analysis result produced by the implementation.
         """
         ...
+
+    @classmethod
+    def compute_chunks(
+        cls, chunks: Iterable[pd.DataFrame], *args: Any
+    ) -> AnalysisResult:
+        """
+        Compute an analysis result from a stream of DataFrame chunks.
+
+        Args:
+            chunks: Iterable of DataFrame chunks sharing the same columns.
+            *args: Additional arguments required by the concrete analysis.
+
+        Returns:
+            The analysis result produced by the implementation.
+        """
+        ...
+
+    @classmethod
+    def from_profile(
+        cls, profile: pd.DataFrame, *args: Any
+    ) -> Optional[AnalysisResult]:
+        """
+        Derive the analysis result from a fused column profile.
+
+        Args:
+            profile: Output of the ``profile`` analysis for the same dataset.
+            *args: Additional arguments required by the concrete analysis.
+
+        Returns:
+            The analysis result, or ``None`` if it is not derivable.
+        """
+        ...
+
+    @classmethod
+    def required_columns(
+        cls, dtypes: pd.Series, *args: Any
+    ) -> Optional[List[Hashable]]:
+        """
+        Declare the columns the analysis reads.
+
+        Args:
+            dtypes: Column dtypes of the dataset, as from ``DataFrame.dtypes``.
+            *args: Additional arguments required by the concrete analysis.
+
+        Returns:
+            The required column labels, or ``None`` if every column is needed.
+        """
+        ...
+
+    @classmethod
+    def compute_relation(cls, relation: Any, *args: Any) -> Optional[AnalysisResult]:
+        """
+        Compute the analysis as aggregate queries on a DuckDB relation.
+
+        Args:
+            relation: DuckDB relation projected onto the required columns.
+            *args: Additional arguments required by the concrete analysis.
+
+        Returns:
+            The analysis result, or ``None`` if it cannot be pushed down.
+        """
+        ...
+
+    @classmethod
+    def compute_plan(cls, plan: Any, *args: Any) -> Optional[AnalysisResult]:
+        """
+        Compute the analysis from intermediates shared between analyses.
+
+        Args:
+            plan: ``eda.plan.Plan`` over the in-memory dataset.
+            *args: Additional arguments required by the concrete analysis.
+
+        Returns:
+            The analysis result, or ``None`` if it has no plan form.
+        """
+        ...
+
+    @classmethod
+    def estimate(
+        cls, sample: pd.DataFrame, population_rows: int, *args: Any
+    ) -> Optional[AnalysisResult]:
+        """
+        Estimate the analysis result from a random sample of rows.
+
+        Args:
+            sample: Randomly sampled rows of the dataset.
+            population_rows: Number of rows in the dataset, possibly
+                estimated.
+            *args: Additional arguments required by the concrete analysis.
+
+        Returns:
+            The estimated analysis result, or ``None`` if the analysis
+            has no estimate.
+        """
+        ...
+
+
+class MergeableAnalysisProtocol(AnalysisProtocol, Protocol):
+    """
+    Structural typing protocol for analyses built from partial aggregates.
+
+    Conforming classes expose `init`, `update`, `merge` and `finalize`
+    class methods so that results can be accumulated per chunk or per
+    partition and combined afterwards.
+    """
+
+    @classmethod
+    def init(cls, *args: Any) -> PartialState:
+        """
+        Create an empty partial state.
+
+        Args:
+            *args: Additional arguments required by the concrete analysis.
+
+        Returns:
+            A state representing an empty partition.
+        """
+        ...
+
+    @classmethod
+    def update(
+        cls, state: PartialState, chunk: pd.DataFrame, *args: Any
+    ) -> PartialState:
+        """
+        Fold a DataFrame chunk into a partial state.
+
+        Args:
+            state: State accumulated from the preceding rows.
+            chunk: Next DataFrame chunk in row order.
+            *args: Additional arguments required by the concrete analysis.
+
+        Returns:
+            The updated state.
+        """
+        ...
+
+    @classmethod
+    def merge(cls, left: PartialState, right: PartialState, *args: Any) -> PartialState:
+        """
+        Combine the states of two adjacent partitions.
+
+        Args:
+            left: State of the partition that comes first in row order.
+            right: State of the partition that follows ``left``.
+            *args: Additional arguments required by the concrete analysis.
+
+        Returns:
+            A state equivalent to folding both partitions in order.
+        """
+        ...
+
+    @classmethod
+    def finalize(cls, state: PartialState, *args: Any) -> AnalysisResult:
+        """
+        Convert a partial state into the analysis result.
+
+        Args:
+            state: Fully accumulated state.
+            *args: Additional arguments required by the concrete analysis.
+
+        Returns:
+            The analysis result produced by the implementation.
+        """
+        ...
@@ -3,25 +3,52 @@ Analysis dispatcher for exploratory data analysis (EDA).
 
 This module maintains a registry that maps analysis identifiers
 to their corresponding EDA analysis implementations and provides
-a dispatcher function to execute the selected analysis.
+a dispatcher function to execute the selected analysis on either
+an in-memory DataFrame, a lazily loaded upload or a chunked CSV
+stream. The execution engine is chosen per run from the size of the
+data and reads only the columns the analysis declares. Results can be
+memoised in a shared cache keyed by the dataset's content hash, and
+analyses covered by a cached column profile are derived from it
+instead of rescanning the data. Analyses of the same in-memory dataset
+share memoised intermediates, such as its null mask, through a lazy
+`Plan`. In incremental mode, the partial aggregates of analyses in
+``INCREMENTAL`` are kept, so an upload that appends rows to an earlier
+one is refreshed from the appended rows alone. In sampling mode,
+`estimate` produces a quick result from a bounded random sample while
+the exact one runs.
+Every `analyzer` call is measured and its metrics logged.
 
 """
 
-from typing import Any, Dict, Type
+from typing import Any, Callable, Dict, Optional, Tuple, Type, Union
 
 import pandas as pd
 
 from eda.analysis_base import AnalysisBase
 from eda.analysis_protocol import AnalysisProtocol, AnalysisResult
-
+from eda.cache import RESULT_CACHE, make_key
+from eda.config import SAMPLE_ROWS
+from eda.engines import choose_engine
+from eda.incremental import refresh
+from eda.ingest import ChunkedFrame
+from eda.loader import UploadSource
+from eda.metrics import measure
+from eda.plan import plan_for
+from eda.sampling import draw_sample
+from eda.types import AnalysisMetrics
+
+from .analysis.correlation import PearsonCorrelation, SpearmanCorrelation
 from .analysis.data_types import DataTypes
-from .analysis.describe import Describe
+from .analysis.describe import ApproxDescribe, Describe
+from .analysis.group_by import GroupBy
 from .analysis.head import Head
+from .analysis.histogram import Histogram
 from .analysis.mean import Mean
 from .analysis.missing import Missing
+from .analysis.profile import Profile
 from .analysis.shape import Shape
-from .analysis.unique import Unique
-from .analysis.value_counts import ValueCounts
+from .analysis.unique import ApproxUnique, Unique
+from .analysis.value_counts import ApproxValueCounts, ValueCounts
 
 ANALYZE: Dict[str, Type[AnalysisProtocol]] = {
     "preview": Head,
@@ -32,19 +59,108 @@ ANALYZE: Dict[str, Type[AnalysisProtocol]] = {
     "missing_data": Missing,
     "unique": Unique,
     "value_counts": ValueCounts,
+    "profile": Profile,
+    "approx_unique": ApproxUnique,
+    "approx_value_counts": ApproxValueCounts,
+    "approx_describe": ApproxDescribe,
+    "pearson_correlation": PearsonCorrelation,
+    "spearman_correlation": SpearmanCorrelation,
+    "histogram": Histogram,
+    "group_by": GroupBy,
 }
 
+# Analyses refreshed from kept partial aggregates in incremental mode.
+INCREMENTAL = (Mean, Missing, Shape, Unique, ValueCounts)
+
+
+def _run(
+    analysis_cls: Type[AnalysisProtocol],
+    data: Union[pd.DataFrame, ChunkedFrame, UploadSource],
+    n: Any,
+    key: Optional[str],
+    incremental: bool = False,
+) -> Tuple[AnalysisResult, str]:
+    """
+    Produce an analysis result, preferring a cached column profile.
+
+    In incremental mode, analyses in ``INCREMENTAL`` are computed from
+    partial aggregates kept across uploads instead. Results not
+    derivable from a profile are computed from the shared intermediates
+    of a `Plan` when the analysis supports it and ``data`` is a
+    versioned in-memory dataset, and otherwise by the engine
+    ``choose_engine`` selects for ``data``.
+
+    Args:
+        analysis_cls: Registered analysis implementation.
+        data: Input DataFrame, lazily loaded upload or chunked CSV stream.
+        n: Optional parameter passed to the analysis.
+        key: Optional content hash of ``data``.
+        incremental: Whether to use and keep partial aggregates.
+
+    Returns:
+        The result produced by the analysis implementation, and
+        ``"incremental"``, ``"profile"``, ``"plan"`` or the name of the
+        engine that produced it.
+    """
+
+    if incremental and key is not None and analysis_cls in INCREMENTAL:
+        refreshed = refresh(analysis_cls, data, n, key)
+        if refreshed is not None:
+            return refreshed
+
+    if key is not None:
+        profile = RESULT_CACHE.get(make_key(key, "profile", None))
+        if isinstance(profile, pd.DataFrame):
+            derived = analysis_cls.from_profile(profile, n)
+            if derived is not None:
+                return derived, "profile"
+
+    plan = plan_for(data, key)
+
+    if plan is not None:
+        planned = analysis_cls.compute_plan(plan, n)
+        if planned is not None:
+            return planned, "plan"
+
+    engine = choose_engine(data)
+
+    return engine.run(analysis_cls, data, n), engine.name
+
 
 def analyzer(
-    analysis: str, data: pd.DataFrame, n: Any = None
+    analysis: str,
+    data: Union[pd.DataFrame, ChunkedFrame, UploadSource],
+    n: Any = None,
+    key: Optional[str] = None,
+    on_metrics: Optional[Callable[[AnalysisMetrics], None]] = None,
+    incremental: bool = False,
 ) -> tuple[str, AnalysisResult]:
     """
     Dispatch and execute a selected EDA analysis.
 
     Args:
         analysis: Identifier of the analysis to run.
-        data: Input pandas DataFrame on which the analysis is performed.
-        n: Optional parameter required by certain analyses (e.g., row count).
+        data: Input pandas DataFrame on which the analysis is performed,
+            an ``UploadSource`` from which only the columns declared by
+            the analysis are loaded, or a ``ChunkedFrame`` that is streamed
+            through the analysis chunk by chunk, also projected. Analyses
+            deriving from ``MergeableAnalysis`` fold the chunks into
+            partial aggregates. Uploads larger than ``ENGINE_MEMORY_MB``
+            run out of core, with aggregations pushed down to DuckDB
+            when it is installed.
+        n: Optional parameter required by certain analyses (e.g., row count),
+            or a structured specification such as ``GroupBySpec``.
+            Parameters must be hashable with a deterministic ``repr``, as
+            results are cached per parameter.
+        key: Optional content hash of ``data``. When given, results are
+            looked up in and stored to the shared ``RESULT_CACHE``, and
+            derived from a cached ``profile`` result when possible.
+        on_metrics: Optional callback receiving the call's resource
+            metrics when it ends, also when it fails.
+        incremental: Whether to keep the partial aggregates of analyses
+            in ``INCREMENTAL`` for uploads of ``data`` with rows appended,
+            and to refresh them from the appended rows when ``data``
+            extends an earlier upload. Requires ``key``.
 
     Returns:
         A tuple containing:
@@ -61,8 +177,69 @@ def analyzer(
     if not issubclass(analysis_cls, AnalysisBase):
         raise TypeError(f"{analysis_cls.__name__} must inherit from AnalysisBase")
 
-    result_df = analysis_cls.compute(data, n)
+    cache_key = make_key(key, analysis, n) if key is not None else None
+
+    with measure(analysis, data, key, on_metrics) as metrics:
+        result_df = RESULT_CACHE.get(cache_key) if cache_key is not None else None
+
+        if result_df is not None:
+            metrics["source"] = "cache"
+        else:
+            result_df, metrics["source"] = _run(analysis_cls, data, n, key, incremental)
+
+            if cache_key is not None:
+                RESULT_CACHE.put(cache_key, result_df)
 
     title = analysis
 
     return title, result_df
+
+
+def estimate(
+    analysis: str,
+    data: Union[pd.DataFrame, ChunkedFrame, UploadSource],
+    n: Any = None,
+    rows: int = SAMPLE_ROWS,
+) -> Optional[tuple[str, AnalysisResult]]:
+    """
+    Estimate a selected EDA analysis from a random sample of rows.
+
+    Sampling reads at most ``rows`` rows without scanning the dataset,
+    so the estimate takes about the same time for any file size. Results
+    are not cached. Analyses without an ``estimate`` are only estimated
+    when the sample covers the whole dataset.
+
+    Args:
+        analysis: Identifier of the analysis to run.
+        data: Input DataFrame, lazily loaded upload or chunked CSV stream.
+        n: Optional parameter required by certain analyses.
+        rows: Maximum number of rows to sample.
+
+    Returns:
+        A tuple containing:
+        - A title naming the analysis and the sample size, unless the
+          sample covers the whole dataset.
+        - The estimated result.
+        ``None`` if the analysis has no estimate from a partial sample.
+
+    Raises:
+        KeyError: If the analysis identifier is not registered.
+    """
+
+    analysis_cls = ANALYZE[analysis]
+    sample = draw_sample(data, rows)
+
+    if sample.exact:
+        return analysis, analysis_cls.compute(sample.frame, n)
+
+    result = analysis_cls.estimate(sample.frame, sample.population_rows, n)
+
+    if result is None:
+        return None
+
+    title = (
+        f"{analysis} (estimate from {len(sample.frame):,} of "
+        f"~{sample.population_rows:,} rows)"
+    )
+
+    return title, result
@@ -0,0 +1,159 @@
+"""
+In-memory result cache for EDA analyses.
+
+This module provides a thread-safe LRU cache that stores analysis
+results keyed by dataset content hash, analysis name and parameter.
+Entries are evicted least-recently-used first once the estimated
+memory footprint exceeds a configurable budget.
+"""
+
+import sys
+import threading
+from collections import OrderedDict
+from typing import Any, Callable, Generic, Hashable, Optional, Tuple, TypeVar
+
+import numpy as np
+import pandas as pd
+
+from .analysis_base import AnalysisResult
+from .config import RESULT_CACHE_MB
+
+CacheKey = Tuple[str, str, str]
+V = TypeVar("V")
+
+
+def result_nbytes(result: Any) -> int:
+    """
+    Estimate the memory footprint of an analysis result.
+
+    Args:
+        result: A DataFrame, Series or string analysis result, or an
+            array, index or tuple of these cached as an intermediate.
+
+    Returns:
+        The estimated size in bytes.
+    """
+
+    if isinstance(result, pd.DataFrame):
+        return int(result.memory_usage(index=True, deep=True).sum())
+
+    if isinstance(result, (pd.Series, pd.Index)):
+        return int(result.memory_usage(deep=True))
+
+    if isinstance(result, np.ndarray):
+        return int(result.nbytes)
+
+    if isinstance(result, tuple):
+        return sum(map(result_nbytes, result)) + sys.getsizeof(result)
+
+    return sys.getsizeof(result)
+
+
+def make_key(dataset_key: str, analysis: str, n: Hashable) -> CacheKey:
+    """
+    Build a cache key for an analysis call.
+
+    The parameter is keyed by its ``repr`` so that values such as the
+    column ``"1"`` and the row count ``1`` do not collide.
+
+    Args:
+        dataset_key: Content hash of the analysed dataset.
+        analysis: Identifier of the analysis.
+        n: Parameter passed to the analysis.
+
+    Returns:
+        A hashable cache key.
+    """
+
+    return dataset_key, analysis, repr(n)
+
+
+class ResultCache(Generic[V]):
+    """
+    Thread-safe LRU cache of analysis results under a memory budget.
+
+    The cache is generic over the type of its values, which are analysis
+    results unless another size estimate is given.
+
+    Attributes:
+        max_bytes: Maximum total estimated size of cached results.
+        sizeof: Function estimating the size of a cached value in bytes.
+    """
+
+    def __init__(
+        self,
+        max_bytes: int = RESULT_CACHE_MB * 1024**2,
+        sizeof: Callable[[V], int] = result_nbytes,
+    ) -> None:
+        self.max_bytes = max_bytes
+        self.sizeof = sizeof
+        self._entries: "OrderedDict[CacheKey, Tuple[V, int]]" = OrderedDict()
+        self._nbytes = 0
+        self._lock = threading.Lock()
+
+    @property
+    def nbytes(self) -> int:
+        """Total estimated size of cached results in bytes."""
+
+        return self._nbytes
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, key: CacheKey) -> Optional[V]:
+        """
+        Return a cached result and mark it as recently used.
+
+        Args:
+            key: Key built with `make_key`.
+
+        Returns:
+            The cached result, or ``None`` if the key is not cached.
+        """
+
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+
+            self._entries.move_to_end(key)
+            return entry[0]
+
+    def put(self, key: CacheKey, result: V) -> None:
+        """
+        Store a result, evicting least-recently-used entries if needed.
+
+        Results larger than the whole budget are not cached.
+
+        Args:
+            key: Key built with `make_key`.
+            result: Analysis result to cache.
+        """
+
+        size = self.sizeof(result)
+
+        with self._lock:
+            old = self._entries.pop(key, None)
+            if old is not None:
+                self._nbytes -= old[1]
+
+            if size > self.max_bytes:
+                return
+
+            self._entries[key] = (result, size)
+            self._nbytes += size
+
+            while self._nbytes > self.max_bytes:
+                _, (_, evicted) = self._entries.popitem(last=False)
+                self._nbytes -= evicted
+
+    def clear(self) -> None:
+        """Remove all cached results."""
+
+        with self._lock:
+            self._entries.clear()
+            self._nbytes = 0
+
+
+# Process-wide cache shared by all sessions; keys include the content hash.
+RESULT_CACHE: ResultCache[AnalysisResult] = ResultCache()
@@ -0,0 +1,167 @@
+"""
+Runtime configuration for the EDA application.
+
+This module centralises tunable resource limits. Every value can be
+overridden through an environment variable so that deployments can
+adjust memory and throughput trade-offs without code changes.
+"""
+
+import os
+
+
+def _env_int(name: str, default: int) -> int:
+    """
+    Read an integer setting from the environment.
+
+    Args:
+        name: Environment variable name.
+        default: Value used when the variable is unset or empty.
+
+    Returns:
+        The parsed integer value.
+
+    Raises:
+        ValueError: If the variable is set but is not a valid integer.
+    """
+
+    value = os.environ.get(name, "").strip()
+    return int(value) if value else default
+
+
+def _env_float(name: str, default: float) -> float:
+    """
+    Read a floating-point setting from the environment.
+
+    Args:
+        name: Environment variable name.
+        default: Value used when the variable is unset or empty.
+
+    Returns:
+        The parsed float value.
+
+    Raises:
+        ValueError: If the variable is set but is not a valid number.
+    """
+
+    value = os.environ.get(name, "").strip()
+    return float(value) if value else default
+
+
+# Number of CSV rows parsed per chunk in streaming mode.
+CHUNK_ROWS = _env_int("EDA_CHUNK_ROWS", 100_000)
+
+# Memory budget, in megabytes, for cached analysis results.
+RESULT_CACHE_MB = _env_int("EDA_RESULT_CACHE_MB", 512)
+
+# HyperLogLog precision (2**p registers) for approximate distinct counts.
+HLL_PRECISION = _env_int("EDA_HLL_PRECISION", 14)
+
+# Number of counters kept by the approximate top-k value counts.
+TOPK_CAPACITY = _env_int("EDA_TOPK_CAPACITY", 1024)
+
+# Default normalised rank error of approximate quantiles.
+QUANTILE_RANK_ERROR = _env_float("EDA_QUANTILE_RANK_ERROR", 0.01)
+
+# Directory holding the columnar cache of parsed uploads.
+DATASET_CACHE_DIR = os.environ.get(
+    "EDA_DATASET_CACHE_DIR",
+    os.path.join(os.path.dirname(os.path.dirname(__file__)), "data", "cache"),
+)
+
+# Size limit, in megabytes, of the columnar dataset cache on disk.
+DATASET_CACHE_MB = _env_int("EDA_DATASET_CACHE_MB", 4096)
+
+# Rows sampled from an upload to plan load-time dtype optimisation.
+DTYPE_SAMPLE_ROWS = _env_int("EDA_DTYPE_SAMPLE_ROWS", 10_000)
+
+# Text columns whose sampled distinct/non-null ratio is at most this
+# value are loaded as categoricals.
+CATEGORY_MAX_RATIO = _env_float("EDA_CATEGORY_MAX_RATIO", 0.5)
+
+# Number of worker threads running analyses in the background.
+WORKER_THREADS = _env_int("EDA_WORKER_THREADS", os.cpu_count() or 1)
+
+# Interval, in seconds, at which the UI polls running analyses.
+JOB_POLL_SECONDS = _env_float("EDA_JOB_POLL_SECONDS", 0.5)
+
+# Maximum number of rows of a single result written to an exported PDF.
+EXPORT_MAX_ROWS = _env_int("EDA_EXPORT_MAX_ROWS", 5_000)
+
+# Rows per table slice in an exported PDF.
+EXPORT_PAGE_ROWS = _env_int("EDA_EXPORT_PAGE_ROWS", 50)
+
+# Size, in megabytes, above which PDF exports spill from memory to disk.
+EXPORT_SPOOL_MB = _env_int("EDA_EXPORT_SPOOL_MB", 32)
+
+# Worker processes rendering PDF fragments in parallel.
+EXPORT_WORKERS = _env_int("EDA_EXPORT_WORKERS", os.cpu_count() or 1)
+
+# Memory budget, in megabytes, for cached per-result PDF fragments.
+FRAGMENT_CACHE_MB = _env_int("EDA_FRAGMENT_CACHE_MB", 256)
+
+# Rows of a result table sent to the browser per displayed page.
+DISPLAY_PAGE_ROWS = _env_int("EDA_DISPLAY_PAGE_ROWS", 100)
+
+# Per-session memory budget, in megabytes, for stored analysis results.
+RESULT_STORE_MB = _env_int("EDA_RESULT_STORE_MB", 256)
+
+# Directory under which results over the budget are spilled; defaults to
+# the system temporary directory.
+RESULT_SPILL_DIR = os.environ.get("EDA_RESULT_SPILL_DIR") or None
+
+# Execution engine for analyses: "auto", "pandas", "chunked" or "duckdb".
+ENGINE = os.environ.get("EDA_ENGINE", "auto").strip().lower() or "auto"
+
+# Uploads larger than this many megabytes of CSV text are analysed out
+# of core instead of being loaded into memory when the engine is "auto".
+ENGINE_MEMORY_MB = _env_int("EDA_ENGINE_MEMORY_MB", 1024)
+
+# Rows drawn from an upload to estimate results in sampling mode.
+SAMPLE_ROWS = _env_int("EDA_SAMPLE_ROWS", 10_000)
+
+# Confidence level of the intervals reported for sampled estimates.
+SAMPLE_CONFIDENCE = _env_float("EDA_SAMPLE_CONFIDENCE", 0.95)
+
+# How analyses measure peak memory: "rss" cheaply samples the resident
+# set size, which understates allocations served from memory the process
+# already holds, "tracemalloc" traces allocations exactly but can slow
+# analyses allocating many Python objects several times over, and "off"
+# disables it.
+MEMORY_PROFILER = os.environ.get("EDA_MEMORY_PROFILER", "rss").strip().lower()
+
+# Interval, in seconds, at which the resident set size is sampled.
+MEMORY_SAMPLE_SECONDS = _env_float("EDA_MEMORY_SAMPLE_SECONDS", 0.01)
+
+# File receiving one JSON line of metrics per analysis call, in addition
+# to the "eda.metrics" logger; unset to log only.
+METRICS_LOG = os.environ.get("EDA_METRICS_LOG") or None
+
+# Columns per block of the blocked correlation kernels; a block pair's
+# working set should fit in the CPU cache.
+CORRELATION_BLOCK_COLUMNS = _env_int("EDA_CORRELATION_BLOCK_COLUMNS", 128)
+
+# Threads computing correlation blocks in parallel.
+CORRELATION_THREADS = _env_int("EDA_CORRELATION_THREADS", os.cpu_count() or 1)
+
+# Default maximum number of bins per column of the histogram analysis.
+HISTOGRAM_BINS = _env_int("EDA_HISTOGRAM_BINS", 20)
+
+# Fine bins kept per column while streaming the histogram analysis; the
+# reported bins are groups of these.
+HISTOGRAM_RESOLUTION = _env_int("EDA_HISTOGRAM_RESOLUTION", 1024)
+
+# Groups the group-by analysis combines in memory while streaming; past
+# this, partial aggregates are spilled to disk.
+GROUP_BY_MAX_GROUPS = _env_int("EDA_GROUP_BY_MAX_GROUPS", 1_000_000)
+
+# Hash partitions of spilled group-by aggregates, each combined in memory
+# on its own.
+GROUP_BY_PARTITIONS = _env_int("EDA_GROUP_BY_PARTITIONS", 16)
+
+# Memory budget, in megabytes, for intermediates shared between analyses
+# of the same dataset, such as null masks and per-column hash tables.
+PLAN_CACHE_MB = _env_int("EDA_PLAN_CACHE_MB", 512)
+
+# Memory budget, in megabytes, for the partial aggregates kept so that an
+# upload extending an earlier one is refreshed from its appended rows.
+INCREMENTAL_CACHE_MB = _env_int("EDA_INCREMENTAL_CACHE_MB", 256)
@@ -0,0 +1,204 @@
+"""
+Columnar on-disk cache of parsed uploads.
+
+This module persists parsed DataFrames as uncompressed Arrow IPC
+(Feather v2) files keyed by the upload's content hash. Later loads
+memory-map the file instead of re-tokenising the CSV text, and can read
+a subset of columns. Files are evicted least-recently-used first once
+the cache directory exceeds its size limit.
+"""
+
+import json
+import logging
+import os
+import tempfile
+from pathlib import Path
+from typing import List, Optional, Sequence
+
+import pandas as pd
+import pyarrow as pa  # type: ignore[import-not-found]
+import pyarrow.feather as feather  # type: ignore[import-not-found]
+
+from .config import DATASET_CACHE_DIR, DATASET_CACHE_MB
+
+logger = logging.getLogger(__name__)
+
+SUFFIX = ".arrow"
+
+# Version of the parsed representation, bumped when load-time dtypes
+# change so that frames cached by older versions are not read back.
+# Their files still match ``SUFFIX`` and age out of the cache.
+FORMAT_VERSION = 2
+ATTRS_METADATA_KEY = b"eda.attrs"
+
+
+class DatasetCache:
+    """
+    Size-bounded directory of Arrow files keyed by content hash.
+
+    Attributes:
+        root: Directory holding the cached files.
+        max_bytes: Maximum total size of cached files.
+    """
+
+    def __init__(
+        self,
+        root: str = DATASET_CACHE_DIR,
+        max_bytes: int = DATASET_CACHE_MB * 1024**2,
+    ) -> None:
+        self.root = Path(root)
+        self.max_bytes = max_bytes
+
+    def path(self, key: str) -> Path:
+        """
+        Return the file path used for a content hash.
+
+        Args:
+            key: Content hash of the upload.
+
+        Returns:
+            The path of the cached Arrow file.
+        """
+
+        return self.root / f"{key}.v{FORMAT_VERSION}{SUFFIX}"
+
+    def __contains__(self, key: str) -> bool:
+        return self.path(key).exists()
+
+    def dtypes(self, key: str) -> Optional[pd.Series]:
+        """
+        Return the column dtypes of a cached frame without reading data.
+
+        Args:
+            key: Content hash of the upload.
+
+        Returns:
+            The pandas dtypes of the cached frame, or ``None`` if it is
+            not cached or cannot be read.
+        """
+
+        try:
+            with pa.memory_map(str(self.path(key))) as source:
+                schema = pa.ipc.open_file(source).schema
+        except (OSError, pa.ArrowException):
+            return None
+
+        return schema.empty_table().to_pandas().dtypes
+
+    def read(
+        self, key: str, columns: Optional[Sequence[str]] = None
+    ) -> Optional[pd.DataFrame]:
+        """
+        Load a cached frame through a memory map.
+
+        Args:
+            key: Content hash of the upload.
+            columns: Optional subset of columns to read.
+
+        Returns:
+            The cached DataFrame, or ``None`` if it is not cached or
+            cannot be read.
+        """
+
+        path = self.path(key)
+
+        try:
+            table = feather.read_table(
+                str(path),
+                columns=list(columns) if columns is not None else None,
+                memory_map=True,
+            )
+            os.utime(path)
+        except FileNotFoundError:
+            return None
+        except (OSError, pa.ArrowException) as exc:
+            logger.warning("Discarding unreadable dataset cache %s: %s", path, exc)
+            path.unlink(missing_ok=True)
+            return None
+
+        df = table.to_pandas(split_blocks=True)
+        attrs = (table.schema.metadata or {}).get(ATTRS_METADATA_KEY)
+
+        if attrs is not None:
+            df.attrs.update(json.loads(attrs))
+
+        return df
+
+    def write(self, key: str, df: pd.DataFrame) -> bool:
+        """
+        Persist a parsed frame and enforce the size limit.
+
+        The file is written to a temporary name and atomically renamed,
+        so concurrent sessions never observe a partial file. ``df.attrs``
+        is stored as JSON schema metadata. Frames that Arrow cannot
+        represent are skipped.
+
+        Args:
+            key: Content hash of the upload.
+            df: Parsed DataFrame with a default index.
+
+        Returns:
+            Whether the frame was cached.
+        """
+
+        self.root.mkdir(parents=True, exist_ok=True)
+        fd, tmp = tempfile.mkstemp(dir=self.root, suffix=".tmp")
+        os.close(fd)
+
+        try:
+            table = pa.Table.from_pandas(df, preserve_index=False)
+            if df.attrs:
+                table = table.replace_schema_metadata(
+                    {
+                        **(table.schema.metadata or {}),
+                        ATTRS_METADATA_KEY: json.dumps(df.attrs).encode(),
+                    }
+                )
+            feather.write_feather(table, tmp, compression="uncompressed")
+            os.replace(tmp, self.path(key))
+        except (OSError, TypeError, ValueError, pa.ArrowException) as exc:
+            logger.warning("Could not cache dataset %s: %s", key, exc)
+            Path(tmp).unlink(missing_ok=True)
+            return False
+
+        self.evict(keep=key)
+
+        return True
+
+    def evict(self, keep: Optional[str] = None) -> List[Path]:
+        """
+        Remove least-recently-used files until the size limit is met.
+
+        Args:
+            keep: Optional content hash that must not be evicted.
+
+        Returns:
+            The paths that were removed.
+        """
+
+        files = []
+        for path in self.root.glob(f"*{SUFFIX}"):
+            try:
+                stat = path.stat()
+            except FileNotFoundError:
+                continue
+            files.append((stat.st_mtime, stat.st_size, path))
+
+        total = sum(size for _, size, _ in files)
+        removed: List[Path] = []
+
+        for _, size, path in sorted(files):
+            if total <= self.max_bytes:
+                break
+            if keep is not None and path == self.path(keep):
+                continue
+
+            path.unlink(missing_ok=True)
+            total -= size
+            removed.append(path)
+
+        return removed
+
+
+# Process-wide cache shared by all sessions.
+DATASET_CACHE = DatasetCache()
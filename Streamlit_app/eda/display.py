@@ -1,24 +1,129 @@
 """
 Streamlit UI utilities for rendering and managing EDA results.
 
-This module provides helper functions to display analysis outputs
-and allow users to remove individual results from the UI.
+This module provides helper functions to display analysis outputs,
+allow users to remove individual results from the UI, and track
+analyses still running in the background. Result tables are shown one
+page of rows at a time, and collapsed results are not sent to the
+browser at all. Each result is captioned with the time and memory its
+analysis took.
 """
 
+import math
 from types import ModuleType
-from typing import Sequence
+from typing import List
 
+from eda.config import DISPLAY_PAGE_ROWS, JOB_POLL_SECONDS
+from eda.jobs import Job, collect
+from eda.metrics import summary
+from eda.result_store import ResultStore
 from eda.types import ResultItem
 
 
-def display(st: ModuleType, results: Sequence[ResultItem]) -> None:
+def display_jobs(st: ModuleType, jobs: List[Job], results: ResultStore) -> None:
+    """
+    Render running analyses with progress and cancel controls.
+
+    The panel refreshes itself every ``JOB_POLL_SECONDS`` while jobs are
+    pending, and reruns the app once any of them finishes so that new
+    results are displayed.
+
+    Args:
+        st: The Streamlit module instance used to render UI components.
+        jobs: Pending background jobs, usually ``st.session_state.jobs``.
+        results: Result store finished analyses are appended to.
+
+    Side Effects:
+        - Moves finished jobs from ``jobs`` into ``results``.
+        - Requests cancellation of jobs whose Cancel button is pressed.
+        - Triggers a Streamlit rerun when a job finishes.
+    """
+
+    if not jobs:
+        return
+
+    @st.fragment(run_every=JOB_POLL_SECONDS)
+    def panel() -> None:
+
+        if collect(jobs, results):
+            st.rerun()
+
+        for job in jobs:
+
+            left, right = st.columns([0.85, 0.15])
+
+            with left:
+
+                if job.cancelled:
+                    st.caption(f"{job.analysis}: cancelling…")
+                elif job.progress is None:
+                    st.caption(f"{job.analysis}: running…")
+                else:
+                    st.progress(job.progress, text=job.analysis)
+
+            with right:
+
+                if st.button("Cancel", key=f"cancel-{job.id}", disabled=job.cancelled):
+                    job.cancel()
+
+    panel()
+
+
+def display_window(
+    st: ModuleType, item: ResultItem, page_rows: int = DISPLAY_PAGE_ROWS
+) -> None:
+    """
+    Render one page of a result table with server-side paging.
+
+    Only the rows of the selected page are serialised. Called through
+    ``st.fragment``, changing the page reruns just this result.
+
+    Args:
+        st: The Streamlit module instance used to render UI components.
+        item: Result to render.
+        page_rows: Number of rows per page.
+    """
+
+    df = item["df"]
+
+    if isinstance(df, str):
+        st.write(df)
+        return
+
+    pages = max(math.ceil(len(df) / page_rows), 1)
+    page = 1
+
+    if pages > 1:
+        page = int(
+            st.number_input(
+                f"Page (of {pages:,})",
+                min_value=1,
+                max_value=pages,
+                value=1,
+                key=f"page_{item['id']}",
+            )
+        )
+
+    start = (page - 1) * page_rows
+    window = df.iloc[start : start + page_rows]
+
+    st.dataframe(window)
+
+    if pages > 1:
+        st.caption(f"Rows {start + 1:,}–{start + len(window):,} of {len(df):,}")
+
+
+def display(st: ModuleType, results: ResultStore) -> None:
     """
     Render EDA analysis results and allow interactive removal.
 
+    The most recent result is expanded by default. Collapsed results
+    render only their title, so a rerun neither re-serialises them nor
+    reloads them from disk.
+
     Args:
         st: The Streamlit module instance used to render UI components.
-        results: A list of result dictionaries containing display metadata
-            and analysis outputs.
+        results: The session's result store.
 
     Side Effects:
         - Mutates ``st.session_state.results`` when an entry is deleted.
@@ -26,7 +131,11 @@ def display(st: ModuleType, results: Sequence[ResultItem]) -> None:
     """
     ...
 
-    for i, item in enumerate(results):
+    window = st.fragment(display_window)
+
+    infos = list(results)
+
+    for i, info in enumerate(infos):
 
         with st.container():
 
@@ -34,14 +143,24 @@ def display(st: ModuleType, results: Sequence[ResultItem]) -> None:
 
             with left:
 
-                st.subheader(item["title"])
+                st.subheader(info["title"])
+
+                if info["metrics"] is not None:
+                    st.caption(summary(info["metrics"]))
+
+                expanded = st.toggle(
+                    "Show",
+                    value=i == len(infos) - 1,
+                    key=f"show_{info['id']}",
+                )
 
-                st.write(item["df"])
+                if expanded:
+                    window(st, results.get(info["id"]))
 
             with right:
 
-                if st.button("Delete", key=item["id"]):
+                if st.button("Delete", key=info["id"]):
 
-                    st.session_state.results.pop(i)
+                    results.remove(info["id"])
 
                     st.rerun()
@@ -3,13 +3,26 @@ PDF export and download utilities for EDA analysis results.
 
 This module provides functionality to generate a password-protected
 PDF document from selected EDA results and trigger its download
-via the Streamlit interface.
+via the Streamlit interface. Tables are rendered in page-sized slices
+under a row budget and the document is written to a spooled temporary
+file, so export memory does not grow with the size of the results.
+
+Each result is rendered to its own unencrypted PDF fragment, cached by
+result id and rendered in parallel worker processes when several are
+missing. Exports merge the fragments and apply encryption once, so
+re-exporting a known selection skips table layout entirely.
 """
 
+# fmt: off
 import io
+import multiprocessing
+import tempfile
+from concurrent.futures import ProcessPoolExecutor
 from types import ModuleType
-from typing import Any, Dict, List
+from typing import IO, Any, Dict, Iterator, List, Optional, Tuple, Union
 
+import pandas as pd
+import pymupdf  # type: ignore[import-untyped]
 from reportlab.lib import colors  # type: ignore[import-not-found]
 from reportlab.lib.pagesizes import A4  # type: ignore[import-not-found]
 from reportlab.lib.pdfencrypt import \
@@ -19,31 +32,96 @@ from reportlab.lib.styles import \
 from reportlab.platypus import (Flowable, Paragraph, SimpleDocTemplate, Spacer,
                                 Table, TableStyle)
 
+from .cache import ResultCache
+from .config import (EXPORT_MAX_ROWS, EXPORT_PAGE_ROWS, EXPORT_SPOOL_MB,
+                     EXPORT_WORKERS, FRAGMENT_CACHE_MB)
 
-def generate_pdf(
+# fmt: on
+
+# Rendered PDF fragments by result id and row budget, sized by length.
+FRAGMENT_CACHE: ResultCache[bytes] = ResultCache(
+    max_bytes=FRAGMENT_CACHE_MB * 1024**2, sizeof=len
+)
+
+_POOL: Optional[ProcessPoolExecutor] = None
+
+TABLE_STYLE = TableStyle(
+    [
+        ("BACKGROUND", (0, 0), (-1, 0), colors.lightgrey),
+        ("GRID", (0, 0), (-1, -1), 0.5, colors.grey),
+        ("FONTNAME", (0, 0), (-1, 0), "Helvetica-Bold"),
+        ("ALIGN", (1, 1), (-1, -1), "RIGHT"),
+    ]
+)
+
+
+def table_flowables(
+    df: pd.DataFrame,
+    styles: Any,
+    max_rows: int = EXPORT_MAX_ROWS,
+    page_rows: int = EXPORT_PAGE_ROWS,
+    total_rows: Optional[int] = None,
+) -> Iterator[Flowable]:
+    """
+    Render a DataFrame as a sequence of page-sized tables.
+
+    Rows are converted to text one slice at a time, and only the first
+    ``max_rows`` rows are rendered; a note states how many were omitted.
+    Each slice is a separate table with its own header row, so layout
+    cost grows linearly with the rows rendered.
+
+    Args:
+        df: Result table to render.
+        styles: ReportLab stylesheet used for the truncation note.
+        max_rows: Maximum number of rows to render.
+        page_rows: Number of rows per table slice.
+        total_rows: Row count of the full result when ``df`` has already
+            been truncated; defaults to ``len(df)``.
+
+    Yields:
+        ReportLab flowables for the table, in order.
+    """
+
+    header = [str(column) for column in df.columns]
+    shown = df.iloc[:max_rows]
+    total = len(df) if total_rows is None else total_rows
+
+    if total > max_rows:
+        yield Paragraph(
+            f"Showing the first {max_rows:,} of {total:,} rows.",
+            styles["Italic"],
+        )
+        yield Spacer(1, 6)
+
+    for start in range(0, max(len(shown), 1), page_rows):
+        rows = shown.iloc[start : start + page_rows].astype(str).values.tolist()
+
+        table = Table([header] + rows, repeatRows=1)
+        table.setStyle(TABLE_STYLE)
+
+        yield table
+
+
+def write_pdf(
     results: List[Dict[str, Any]],
+    output: IO[bytes],
     password: str,
     protect: bool,
-    st: ModuleType,
+    max_rows: int = EXPORT_MAX_ROWS,
 ) -> None:
     """
-    Generate a PDF from selected EDA results and trigger its download.
+    Write selected EDA results as a single PDF document.
 
     Args:
-        results: A list of result dictionaries. Each dictionary must contain:
-            - ``"title"``: Title of the analysis.
-            - ``"df"``: Analysis output as a pandas DataFrame or string.
+        results: A list of result dictionaries with ``"title"`` and ``"df"``.
+            Entries may carry ``"total_rows"`` when ``"df"`` is truncated.
+        output: Binary file object the document is written to as it is
+            serialised, without building it in memory first.
         password: Password used to encrypt the PDF when protection is enabled.
         protect: Whether to enable PDF password protection.
-        st: Streamlit module instance used to trigger the download.
-
-    Side Effects:
-        - Creates an in-memory PDF file.
-        - Initiates a file download via Streamlit.
+        max_rows: Maximum number of rows rendered per result table.
     """
 
-    buffer = io.BytesIO()
-
     encryption = None
     if protect:
         encryption = StandardEncryption(
@@ -55,7 +133,7 @@ def generate_pdf(
             canAnnotate=0,
         )
 
-    doc = SimpleDocTemplate(buffer, pagesize=A4, encrypt=encryption)
+    doc = SimpleDocTemplate(output, pagesize=A4, encrypt=encryption)
     styles = getSampleStyleSheet()
 
     story: List[Flowable] = []
@@ -71,29 +149,221 @@ def generate_pdf(
             story.append(Spacer(1, 20))
             continue
 
-        data = [df.columns.tolist()] + df.astype(str).values.tolist()
-
-        table = Table(data, repeatRows=1)
-        table.setStyle(
-            TableStyle(
-                [
-                    ("BACKGROUND", (0, 0), (-1, 0), colors.lightgrey),
-                    ("GRID", (0, 0), (-1, -1), 0.5, colors.grey),
-                    ("FONTNAME", (0, 0), (-1, 0), "Helvetica-Bold"),
-                    ("ALIGN", (1, 1), (-1, -1), "RIGHT"),
-                ]
+        story.extend(
+            table_flowables(
+                df, styles, max_rows=max_rows, total_rows=item.get("total_rows")
             )
         )
-
-        story.append(table)
         story.append(Spacer(1, 20))
 
     doc.build(story)
-    buffer.seek(0)
+
+
+def render_fragment(
+    title: str,
+    df: Union[pd.DataFrame, str],
+    total_rows: Optional[int],
+    max_rows: int,
+) -> bytes:
+    """
+    Render one result as an unencrypted PDF fragment.
+
+    This runs in worker processes, so it takes only picklable arguments.
+
+    Args:
+        title: Title of the analysis.
+        df: Result table, truncated to ``max_rows`` rows, or a string.
+        total_rows: Row count of the full result table, if any.
+        max_rows: Maximum number of rows rendered.
+
+    Returns:
+        The PDF document bytes.
+    """
+
+    buffer = io.BytesIO()
+    item = {"title": title, "df": df, "total_rows": total_rows}
+    write_pdf([item], buffer, password="", protect=False, max_rows=max_rows)
+
+    return buffer.getvalue()
+
+
+def _pool() -> ProcessPoolExecutor:
+    """Return the shared fragment rendering pool, starting it on first use."""
+
+    global _POOL
+
+    if _POOL is None:
+        _POOL = ProcessPoolExecutor(
+            max_workers=EXPORT_WORKERS,
+            mp_context=multiprocessing.get_context("spawn"),
+        )
+
+    return _POOL
+
+
+def render_fragments(results: List[Dict[str, Any]], max_rows: int) -> List[bytes]:
+    """
+    Return the PDF fragment of every result, rendering missing ones.
+
+    Fragments are cached by result id and row budget. Missing fragments
+    are rendered in parallel worker processes when there is more than
+    one; only the rows within the budget are sent to the workers.
+
+    Args:
+        results: A list of result dictionaries with ``"id"``, ``"title"``
+            and ``"df"``.
+        max_rows: Maximum number of rows rendered per result table.
+
+    Returns:
+        One fragment per result, in order.
+
+    Side Effects:
+        Stores newly rendered fragments in ``FRAGMENT_CACHE``.
+    """
+
+    keys = [("pdf", str(item["id"]), repr(max_rows)) for item in results]
+    fragments = [FRAGMENT_CACHE.get(key) for key in keys]
+
+    missing: List[Tuple[int, Tuple[Any, ...]]] = []
+
+    for i, item in enumerate(results):
+        if fragments[i] is not None:
+            continue
+
+        df = item["df"]
+        total_rows = None if isinstance(df, str) else len(df)
+        shown = df if isinstance(df, str) else df.iloc[:max_rows]
+        missing.append((i, (item["title"], shown, total_rows, max_rows)))
+
+    if len(missing) > 1 and EXPORT_WORKERS > 1:
+        futures = [(i, _pool().submit(render_fragment, *args)) for i, args in missing]
+        rendered = [(i, future.result()) for i, future in futures]
+    else:
+        rendered = [(i, render_fragment(*args)) for i, args in missing]
+
+    for i, fragment in rendered:
+        fragments[i] = fragment
+        FRAGMENT_CACHE.put(keys[i], fragment)
+
+    return [fragment for fragment in fragments if fragment is not None]
+
+
+class _OutputStream:
+    """
+    Write-only view of a binary file object without a ``name``.
+
+    PyMuPDF's ``Document.save`` treats objects with a ``name`` attribute,
+    such as spooled temporary files, as file paths; through this view it
+    writes to the object itself.
+    """
+
+    def __init__(self, output: IO[bytes]) -> None:
+        self._output = output
+
+    def write(self, data: bytes) -> int:
+        return self._output.write(data)
+
+    def seek(self, offset: int, whence: int = io.SEEK_SET) -> int:
+        return self._output.seek(offset, whence)
+
+    def tell(self) -> int:
+        return self._output.tell()
+
+    def truncate(self) -> int:
+        return self._output.truncate()
+
+
+def merge_fragments(
+    fragments: List[bytes],
+    output: IO[bytes],
+    password: str,
+    protect: bool,
+) -> None:
+    """
+    Concatenate PDF fragments into one document, encrypting it once.
+
+    Args:
+        fragments: PDF documents to concatenate, in order.
+        output: Binary file object the document is written to as it is
+            serialised, without building it in memory first.
+        password: Password used to encrypt the PDF when protection is enabled.
+        protect: Whether to enable PDF password protection; the document
+            may then only be printed, matching the single-pass export.
+    """
+
+    merged = pymupdf.open()
+
+    for fragment in fragments:
+        with pymupdf.open(stream=fragment, filetype="pdf") as part:
+            merged.insert_pdf(part)
+
+    options: Dict[str, Any] = {}
+
+    if protect:
+        options.update(
+            encryption=pymupdf.PDF_ENCRYPT_AES_256,
+            owner_pw=password,
+            user_pw=password,
+            permissions=pymupdf.PDF_PERM_PRINT,
+        )
+
+    merged.save(_OutputStream(output), **options)
+    merged.close()
+
+
+def read_spool(spool: IO[bytes]) -> bytes:
+    """Return the full contents of a spooled export file."""
+
+    spool.seek(0)
+    return spool.read()
+
+
+def generate_pdf(
+    results: List[Dict[str, Any]],
+    password: str,
+    protect: bool,
+    st: ModuleType,
+    max_rows: Optional[int] = None,
+) -> None:
+    """
+    Generate a PDF from selected EDA results and trigger its download.
+
+    Args:
+        results: A list of result dictionaries. Each dictionary must contain:
+            - ``"id"``: Unique identifier, used to cache the result's
+              rendered fragment.
+            - ``"title"``: Title of the analysis.
+            - ``"df"``: Analysis output as a pandas DataFrame or string.
+        password: Password used to encrypt the PDF when protection is enabled.
+        protect: Whether to enable PDF password protection.
+        st: Streamlit module instance used to trigger the download.
+        max_rows: Maximum number of rows rendered per result table;
+            defaults to ``EXPORT_MAX_ROWS``.
+
+    Side Effects:
+        - Renders missing per-result fragments, in parallel processes when
+          several are missing, and caches them in ``FRAGMENT_CACHE``.
+        - Writes the PDF to a temporary file that spills to disk above
+          ``EXPORT_SPOOL_MB`` megabytes.
+        - Initiates a file download via Streamlit; the file is read only
+          when the download is requested.
+    """
+
+    spool = tempfile.SpooledTemporaryFile(max_size=EXPORT_SPOOL_MB * 1024 * 1024)
+
+    fragments = render_fragments(
+        results, max_rows=EXPORT_MAX_ROWS if max_rows is None else max_rows
+    )
+    merge_fragments(
+        fragments,
+        spool,  # type: ignore[arg-type]
+        password=password,
+        protect=protect,
+    )
 
     st.download_button(
         "Download PDF",
-        data=buffer,
+        data=lambda: read_spool(spool),  # type: ignore[arg-type]
         file_name="analysis_results.pdf",
         mime="application/pdf",
     )
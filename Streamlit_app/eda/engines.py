@@ -0,0 +1,242 @@
+"""
+Execution engines for EDA analyses.
+
+This module decouples the registered analyses from the way their input
+is read. An engine takes an analysis class and a dataset, and runs the
+analysis on in-memory pandas frames, on chunked pandas streams, or as
+SQL aggregates on an embedded DuckDB relation. Every engine pushes the
+analysis's declared column projection down to the reader, and the
+DuckDB engine also pushes down the aggregations of analyses that define
+`compute_relation`, so large uploads are summarised without being
+materialised in pandas.
+
+The engine is chosen per run from the size of the upload, or forced
+with ``EDA_ENGINE``. DuckDB is an optional dependency; without it,
+uploads too large for memory are streamed through pandas in chunks.
+"""
+
+import importlib.util
+import logging
+from abc import ABC, abstractmethod
+from typing import Any, Dict, Type, Union
+
+import pandas as pd
+import pyarrow as pa  # type: ignore[import-not-found]
+
+from .analysis_base import sql_identifier
+from .analysis_protocol import AnalysisProtocol, AnalysisResult
+from .config import ENGINE, ENGINE_MEMORY_MB
+from .dataset_cache import DATASET_CACHE
+from .ingest import ChunkedFrame, reopen, row_blocks
+from .loader import UploadSource
+
+logger = logging.getLogger(__name__)
+
+Dataset = Union[pd.DataFrame, ChunkedFrame, UploadSource]
+
+
+class Engine(ABC):
+    """
+    Base class for analysis execution engines.
+
+    Engines are stateless; they are used through classmethods and
+    registered in ``ENGINES``.
+
+    Attributes:
+        name: Identifier of the engine, as accepted by ``EDA_ENGINE``.
+    """
+
+    name: str
+
+    @classmethod
+    def available(cls) -> bool:
+        """Return whether the engine's dependencies are installed."""
+
+        return True
+
+    @classmethod
+    @abstractmethod
+    def run(
+        cls, analysis_cls: Type[AnalysisProtocol], data: Dataset, n: Any
+    ) -> AnalysisResult:
+        """
+        Run an analysis on a dataset.
+
+        Args:
+            analysis_cls: Registered analysis implementation.
+            data: Input DataFrame, lazily loaded upload or chunked CSV stream.
+            n: Optional parameter passed to the analysis.
+
+        Returns:
+            The result produced by the analysis implementation.
+        """
+
+        raise NotImplementedError
+
+
+class PandasEngine(Engine):
+    """
+    Run analyses on in-memory pandas frames.
+
+    Uploads are materialised with only the columns the analysis declares;
+    streams are concatenated.
+    """
+
+    name = "pandas"
+
+    @classmethod
+    def run(
+        cls, analysis_cls: Type[AnalysisProtocol], data: Dataset, n: Any
+    ) -> AnalysisResult:
+        """Load the required columns and call `compute`."""
+
+        if isinstance(data, UploadSource):
+            data = data.frame(analysis_cls.required_columns(data.dtypes, n))
+        elif isinstance(data, ChunkedFrame):
+            columns = analysis_cls.required_columns(data.dtypes, n)
+            data = pd.concat(data.project(columns), ignore_index=True)
+
+        return analysis_cls.compute(data, n)
+
+
+class ChunkedEngine(Engine):
+    """
+    Stream analyses through pandas in bounded row chunks.
+
+    Uploads and streams are parsed chunk by chunk with only the columns
+    the analysis declares, so memory stays bounded by a few chunks for
+    analyses that fold partial aggregates.
+    """
+
+    name = "chunked"
+
+    @classmethod
+    def run(
+        cls, analysis_cls: Type[AnalysisProtocol], data: Dataset, n: Any
+    ) -> AnalysisResult:
+        """Project the stream and call `compute_chunks`."""
+
+        if isinstance(data, pd.DataFrame):
+            return analysis_cls.compute_chunks(row_blocks(data), n)
+
+        columns = analysis_cls.required_columns(data.dtypes, n)
+        stream = data.chunks() if isinstance(data, UploadSource) else data
+
+        return analysis_cls.compute_chunks(stream.project(columns), n)
+
+
+class DuckDBEngine(Engine):
+    """
+    Push projections and aggregations down to an embedded DuckDB.
+
+    Cached uploads are scanned from their memory-mapped Arrow file, and
+    other uploads and streams from their CSV text, each on a private
+    in-memory connection. Analyses without a SQL form fall back to the
+    chunked engine, or to pandas for in-memory frames.
+    """
+
+    name = "duckdb"
+
+    @classmethod
+    def available(cls) -> bool:
+        """Return whether DuckDB is installed."""
+
+        return importlib.util.find_spec("duckdb") is not None
+
+    @classmethod
+    def relation(cls, connection: Any, data: Dataset) -> Any:
+        """
+        Return a DuckDB relation over a dataset without materialising it.
+
+        Args:
+            connection: DuckDB connection owning the relation.
+            data: Input DataFrame, lazily loaded upload or chunked CSV stream.
+
+        Returns:
+            A relation over all columns of ``data``.
+        """
+
+        if isinstance(data, pd.DataFrame):
+            return connection.from_df(data)
+
+        if isinstance(data, ChunkedFrame):
+            return connection.read_csv(reopen(data.source))
+
+        path = DATASET_CACHE.path(data.key)
+
+        try:
+            with pa.memory_map(str(path), "r") as source:
+                table = pa.ipc.open_file(source).read_all()
+        except (OSError, pa.ArrowException):
+            return connection.read_csv(reopen(data.uploaded_file))
+
+        return connection.from_arrow(table)
+
+    @classmethod
+    def run(
+        cls, analysis_cls: Type[AnalysisProtocol], data: Dataset, n: Any
+    ) -> AnalysisResult:
+        """Call `compute_relation`, falling back when it returns ``None``."""
+
+        import duckdb  # type: ignore[import-not-found]
+
+        fallback = PandasEngine if isinstance(data, pd.DataFrame) else ChunkedEngine
+        columns = analysis_cls.required_columns(data.dtypes, n)
+
+        with duckdb.connect() as connection:
+            relation = cls.relation(connection, data)
+
+            present = [c for c in columns or [] if c in relation.columns]
+
+            if present:
+                relation = relation.project(", ".join(map(sql_identifier, present)))
+
+            result = analysis_cls.compute_relation(relation, n)
+
+        if result is None:
+            return fallback.run(analysis_cls, data, n)
+
+        return result
+
+
+ENGINES: Dict[str, Type[Engine]] = {
+    "pandas": PandasEngine,
+    "chunked": ChunkedEngine,
+    "duckdb": DuckDBEngine,
+}
+
+
+def choose_engine(data: Dataset) -> Type[Engine]:
+    """
+    Select the engine for a dataset.
+
+    An available engine named by ``EDA_ENGINE`` always wins. Otherwise
+    streams run chunked, in-memory frames and uploads that are loaded or
+    no larger than ``ENGINE_MEMORY_MB`` run in pandas, and larger uploads
+    run in DuckDB, or chunked when DuckDB is not installed.
+
+    Args:
+        data: Input DataFrame, lazily loaded upload or chunked CSV stream.
+
+    Returns:
+        The engine class to run the analysis with.
+    """
+
+    if ENGINE != "auto":
+        forced = ENGINES.get(ENGINE)
+
+        if forced is not None and forced.available():
+            return forced
+
+        logger.warning("Engine %r is unavailable; choosing automatically", ENGINE)
+
+    if isinstance(data, ChunkedFrame):
+        return ChunkedEngine
+
+    if isinstance(data, pd.DataFrame) or data.loaded:
+        return PandasEngine
+
+    if data.nbytes <= ENGINE_MEMORY_MB * 1024**2:
+        return PandasEngine
+
+    return DuckDBEngine if DuckDBEngine.available() else ChunkedEngine
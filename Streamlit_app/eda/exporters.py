@@ -0,0 +1,448 @@
+"""
+Tabular export formats for EDA analysis results.
+
+This module maintains a registry of exporters that serialise selected
+results as Parquet, gzip-compressed CSV, XLSX or HTML. Exporters write
+each result frame in row batches straight to a spooled temporary file,
+so large results download quickly without an intermediate copy. The
+PDF report in ``downloader`` remains the human-readable option.
+
+Formats that hold one table per file write a single file for a single
+result and a ZIP archive with one member per result otherwise.
+"""
+
+import gzip
+import html
+import importlib.util
+import io
+import re
+import tempfile
+import zipfile
+from abc import ABC, abstractmethod
+from types import ModuleType
+from typing import IO, Any, Dict, Iterator, List, Type
+
+import pandas as pd
+import pyarrow as pa  # type: ignore[import-untyped]
+import pyarrow.parquet as pq  # type: ignore[import-untyped]
+
+from .config import CHUNK_ROWS, EXPORT_SPOOL_MB
+from .downloader import read_spool
+
+# Worksheet row limit of the XLSX format, including the header row.
+XLSX_MAX_ROWS = 1_048_576
+
+
+def as_frame(result: Any) -> pd.DataFrame:
+    """
+    Return a result as a DataFrame, wrapping text results in one cell.
+
+    Args:
+        result: Analysis output as a DataFrame or string.
+
+    Returns:
+        A DataFrame holding the result.
+    """
+
+    if isinstance(result, str):
+        return pd.DataFrame({"Result": [result]})
+
+    return result
+
+
+def keeps_index(df: pd.DataFrame) -> bool:
+    """
+    Return whether a result's index carries labels worth exporting.
+
+    Integer indexes are positional for every analysis, while label
+    indexes (e.g., describe statistics) are part of the result.
+
+    Args:
+        df: Result table.
+
+    Returns:
+        ``True`` if the index should be written as a column.
+    """
+
+    return not pd.api.types.is_integer_dtype(df.index)
+
+
+def batches(df: pd.DataFrame, rows: int = CHUNK_ROWS) -> Iterator[pd.DataFrame]:
+    """
+    Yield a result table in row batches, with the index as a column.
+
+    Args:
+        df: Result table.
+        rows: Maximum number of rows per batch.
+
+    Yields:
+        Consecutive row slices with a default integer index.
+    """
+
+    index = keeps_index(df)
+
+    for start in range(0, max(len(df), 1), rows):
+        batch = df.iloc[start : start + rows]
+        yield batch.reset_index() if index else batch.reset_index(drop=True)
+
+
+def member_name(position: int, title: str, extension: str) -> str:
+    """
+    Build a file name for one result inside an archive or workbook.
+
+    Args:
+        position: One-based position of the result in the selection.
+        title: Title of the result.
+        extension: File extension without the leading dot.
+
+    Returns:
+        A file-system safe, unique name.
+    """
+
+    slug = re.sub(r"[^A-Za-z0-9_-]+", "_", title).strip("_") or "result"
+
+    return (
+        f"{position:02d}_{slug}.{extension}" if extension else f"{position:02d}_{slug}"
+    )
+
+
+class Exporter(ABC):
+    """
+    Base class for result exporters.
+
+    Exporters are stateless; they are used through classmethods and
+    registered in ``EXPORTERS``.
+
+    Attributes:
+        label: Human-readable format name shown in the save dialog.
+        extension: File extension of a single exported file.
+        mime: MIME type of a single exported file.
+    """
+
+    label: str
+    extension: str
+    mime: str
+
+    @classmethod
+    def available(cls) -> bool:
+        """Return whether the exporter's dependencies are installed."""
+
+        return True
+
+    @classmethod
+    def file_name(cls, results: List[Dict[str, Any]]) -> str:
+        """Return the download file name for the given selection."""
+
+        return f"analysis_results.{cls.extension}"
+
+    @classmethod
+    def mime_type(cls, results: List[Dict[str, Any]]) -> str:
+        """Return the download MIME type for the given selection."""
+
+        return cls.mime
+
+    @classmethod
+    @abstractmethod
+    def write(cls, results: List[Dict[str, Any]], output: IO[bytes]) -> None:
+        """
+        Serialise the selected results.
+
+        Args:
+            results: A list of result dictionaries with ``"title"`` and
+                ``"df"``.
+            output: Binary file object receiving the export.
+        """
+
+        raise NotImplementedError
+
+
+class TableExporter(Exporter):
+    """
+    Base class for formats holding a single table per file.
+
+    Subclasses implement `write_table`; several results are bundled as
+    an uncompressed ZIP archive, since each member is compressed already.
+    """
+
+    @classmethod
+    def file_name(cls, results: List[Dict[str, Any]]) -> str:
+        """Return a single file name, or a ZIP name for several results."""
+
+        if len(results) == 1:
+            return f"{member_name(1, results[0]['title'], '')}.{cls.extension}"
+
+        return "analysis_results.zip"
+
+    @classmethod
+    def mime_type(cls, results: List[Dict[str, Any]]) -> str:
+        """Return the file MIME type, or the ZIP type for several results."""
+
+        return cls.mime if len(results) == 1 else "application/zip"
+
+    @classmethod
+    @abstractmethod
+    def write_table(cls, df: pd.DataFrame, output: IO[bytes]) -> None:
+        """
+        Serialise one result table.
+
+        Args:
+            df: Result table.
+            output: Binary file object receiving the table.
+        """
+
+        raise NotImplementedError
+
+    @classmethod
+    def write(cls, results: List[Dict[str, Any]], output: IO[bytes]) -> None:
+        """Write one file, or a ZIP archive with one member per result."""
+
+        if len(results) == 1:
+            cls.write_table(as_frame(results[0]["df"]), output)
+            return
+
+        with zipfile.ZipFile(output, "w", zipfile.ZIP_STORED) as archive:
+            for position, item in enumerate(results, start=1):
+                name = member_name(position, item["title"], cls.extension)
+
+                with archive.open(name, "w", force_zip64=True) as member:
+                    cls.write_table(as_frame(item["df"]), member)  # type: ignore
+
+
+class ParquetExporter(TableExporter):
+    """Export results as Parquet files, one row group per batch."""
+
+    label = "Parquet"
+    extension = "parquet"
+    mime = "application/vnd.apache.parquet"
+
+    @classmethod
+    def write_table(cls, df: pd.DataFrame, output: IO[bytes]) -> None:
+        """
+        Write a result table as Parquet.
+
+        Object columns are stored as strings so that every batch shares
+        the schema of the first one.
+
+        Args:
+            df: Result table.
+            output: Binary file object receiving the table.
+        """
+
+        writer = None
+
+        for batch in batches(df):
+            for column in batch.columns[batch.dtypes == object]:
+                batch[column] = batch[column].astype("string")
+
+            table = pa.Table.from_pandas(
+                batch,
+                schema=writer.schema if writer is not None else None,
+                preserve_index=False,
+            )
+
+            if writer is None:
+                writer = pq.ParquetWriter(pa.PythonFile(output), table.schema)
+
+            writer.write_table(table)
+
+        if writer is not None:
+            writer.close()
+
+
+class CsvGzExporter(TableExporter):
+    """Export results as gzip-compressed CSV files."""
+
+    label = "CSV (gzip)"
+    extension = "csv.gz"
+    mime = "application/gzip"
+
+    @classmethod
+    def write_table(cls, df: pd.DataFrame, output: IO[bytes]) -> None:
+        """
+        Write a result table as gzip-compressed CSV.
+
+        Args:
+            df: Result table.
+            output: Binary file object receiving the table.
+        """
+
+        with gzip.GzipFile(fileobj=output, mode="wb", compresslevel=6) as archive:
+            with io.TextIOWrapper(archive, encoding="utf-8", newline="") as text:
+                for i, batch in enumerate(batches(df)):
+                    batch.to_csv(text, index=False, header=i == 0)
+
+
+class XlsxExporter(Exporter):
+    """
+    Export results as an Excel workbook with one worksheet per result.
+
+    Rows are written in order in XlsxWriter's constant-memory mode, so
+    only one row is held in memory at a time. Results longer than a
+    worksheet are truncated.
+    """
+
+    label = "Excel (XLSX)"
+    extension = "xlsx"
+    mime = "application/vnd.openxmlformats-officedocument.spreadsheetml.sheet"
+
+    @classmethod
+    def available(cls) -> bool:
+        """Return whether XlsxWriter is installed."""
+
+        return importlib.util.find_spec("xlsxwriter") is not None
+
+    @staticmethod
+    def _cell(value: Any) -> Any:
+        """Convert a value to a type XlsxWriter writes natively."""
+
+        if isinstance(value, (bool, int, float, str)):
+            return value
+
+        return str(value)
+
+    @classmethod
+    def _rows(cls, batch: pd.DataFrame) -> List[List[Any]]:
+        """
+        Convert a batch to rows of native Python values.
+
+        Numeric and boolean columns are converted in bulk; other columns
+        are converted per value, and missing values become empty cells.
+
+        Args:
+            batch: Row slice of a result table.
+
+        Returns:
+            One list of cell values per row.
+        """
+
+        present = batch.notna().to_numpy()
+        converted = batch.astype(object)
+
+        for position, dtype in enumerate(batch.dtypes):
+            if not pd.api.types.is_numeric_dtype(dtype):
+                column = converted.iloc[:, position]
+                converted.isetitem(position, column.map(cls._cell))
+
+        return converted.where(present, None).values.tolist()
+
+    @classmethod
+    def write(cls, results: List[Dict[str, Any]], output: IO[bytes]) -> None:
+        """Write each result to its own worksheet."""
+
+        import xlsxwriter  # type: ignore[import-untyped]
+
+        workbook = xlsxwriter.Workbook(
+            output, {"constant_memory": True, "nan_inf_to_errors": True}
+        )
+
+        for position, item in enumerate(results, start=1):
+            df = as_frame(item["df"]).iloc[: XLSX_MAX_ROWS - 1]
+            sheet = workbook.add_worksheet(
+                member_name(position, item["title"], "")[:31]
+            )
+            row = 0
+
+            for batch in batches(df):
+                if row == 0:
+                    sheet.write_row(0, 0, [str(column) for column in batch.columns])
+                    row = 1
+
+                for values in cls._rows(batch):
+                    sheet.write_row(row, 0, values)
+                    row += 1
+
+        workbook.close()
+
+
+class HtmlExporter(Exporter):
+    """Export results as a standalone HTML page with one table per result."""
+
+    label = "HTML"
+    extension = "html"
+    mime = "text/html"
+
+    @classmethod
+    def write(cls, results: List[Dict[str, Any]], output: IO[bytes]) -> None:
+        """Write every result as a heading followed by its table."""
+
+        text = io.TextIOWrapper(output, encoding="utf-8")
+
+        text.write(
+            "<!DOCTYPE html>\n<html><head><meta charset='utf-8'>"
+            "<title>Analysis results</title><style>"
+            "table{border-collapse:collapse}"
+            "td,th{border:1px solid #999;padding:2px 6px}"
+            "td{text-align:right}"
+            "</style></head><body>\n"
+        )
+
+        for item in results:
+            text.write(f"<h2>{html.escape(item['title'])}</h2>\n")
+
+            if isinstance(item["df"], str):
+                text.write(f"<p>{html.escape(item['df'])}</p>\n")
+                continue
+
+            text.write("<table>\n")
+
+            for i, batch in enumerate(batches(item["df"])):
+                if i == 0:
+                    cells = "".join(
+                        f"<th>{html.escape(str(c))}</th>" for c in batch.columns
+                    )
+                    text.write(f"<tr>{cells}</tr>\n")
+
+                for values in batch.astype(str).itertuples(index=False):
+                    cells = "".join(f"<td>{html.escape(v)}</td>" for v in values)
+                    text.write(f"<tr>{cells}</tr>\n")
+
+            text.write("</table>\n")
+
+        text.write("</body></html>\n")
+
+        text.flush()
+        text.detach()
+
+
+EXPORTERS: Dict[str, Type[Exporter]] = {
+    "parquet": ParquetExporter,
+    "csv_gz": CsvGzExporter,
+    "xlsx": XlsxExporter,
+    "html": HtmlExporter,
+}
+
+
+def export_results(
+    results: List[Dict[str, Any]],
+    exporter: str,
+    st: ModuleType,
+) -> None:
+    """
+    Export selected EDA results and trigger their download.
+
+    Args:
+        results: A list of result dictionaries with ``"title"`` and ``"df"``.
+        exporter: Identifier of a registered exporter.
+        st: Streamlit module instance used to trigger the download.
+
+    Raises:
+        KeyError: If the exporter identifier is not registered.
+
+    Side Effects:
+        - Writes the export to a temporary file that spills to disk above
+          ``EXPORT_SPOOL_MB`` megabytes.
+        - Initiates a file download via Streamlit; the file is read only
+          when the download is requested.
+    """
+
+    exporter_cls = EXPORTERS[exporter]
+    spool = tempfile.SpooledTemporaryFile(max_size=EXPORT_SPOOL_MB * 1024 * 1024)
+
+    exporter_cls.write(results, spool)  # type: ignore[arg-type]
+
+    st.download_button(
+        f"Download {exporter_cls.label}",
+        data=lambda: read_spool(spool),  # type: ignore[arg-type]
+        file_name=exporter_cls.file_name(results),
+        mime=exporter_cls.mime_type(results),
+    )
@@ -0,0 +1,321 @@
+"""
+Incremental refresh of EDA analyses for uploads with appended rows.
+
+A new upload is often a later export of a file analysed before, with
+rows appended at the end. The partial aggregates of analyses deriving
+from `MergeableAnalysis` can then be refreshed by folding in only the
+appended rows instead of rescanning the whole file. This module keeps
+these partial aggregates in a shared, memory-budgeted cache under each
+version's content hash. It recognises an upload whose leading bytes
+form an earlier version by hashing its prefixes, and parses only the
+bytes after the longest such prefix.
+
+A prefix only counts when it ends at a line break, so the last row of
+the earlier version is complete. Hashing the prefix still reads its
+bytes, but that costs far less than parsing and aggregating them.
+"""
+
+import io
+import itertools
+import sys
+import threading
+from collections import OrderedDict
+from dataclasses import fields, is_dataclass
+from typing import Any, Dict, List, Optional, Tuple, Type, Union
+
+import pandas as pd
+
+from .analysis_base import AnalysisResult, MergeableAnalysis, PartialState
+from .cache import ResultCache, make_key, result_nbytes
+from .config import INCREMENTAL_CACHE_MB
+from .engines import choose_engine
+from .ingest import ChunkedFrame, prefix_hashes
+from .loader import UploadSource
+from .optimize import read_optimized
+
+# Elements measured when estimating the size of a set or list.
+SIZE_SAMPLE = 64
+
+# Dataset versions remembered as candidate prefixes of new uploads.
+MAX_VERSIONS = 64
+
+
+def state_nbytes(state: Any) -> int:
+    """
+    Estimate the memory footprint of a partial aggregate.
+
+    Args:
+        state: Partial state of a mergeable analysis, or a DataFrame of
+            appended rows.
+
+    Returns:
+        The estimated size in bytes. Sets and lists are extrapolated from
+        a sample of their elements.
+    """
+
+    if is_dataclass(state) and not isinstance(state, type):
+        return sys.getsizeof(state) + sum(
+            state_nbytes(getattr(state, f.name)) for f in fields(state)
+        )
+
+    if isinstance(state, dict):
+        return sys.getsizeof(state) + sum(
+            state_nbytes(label) + state_nbytes(value) for label, value in state.items()
+        )
+
+    if isinstance(state, (set, frozenset, list)):
+        sample = list(itertools.islice(state, SIZE_SAMPLE))
+        item = sum(map(sys.getsizeof, sample)) / len(sample) if sample else 0
+
+        return sys.getsizeof(state) + int(item * len(state))
+
+    return result_nbytes(state)
+
+
+# Process-wide partial aggregates and appended rows; keys include the
+# content hash.
+STATE_CACHE: ResultCache[Any] = ResultCache(
+    INCREMENTAL_CACHE_MB * 1024**2, sizeof=state_nbytes
+)
+
+_lock = threading.Lock()
+
+# Byte length of the versions partial aggregates were stored for.
+_versions: "OrderedDict[str, int]" = OrderedDict()
+
+# Per version, whether each earlier version compared to it is a prefix.
+_prefixes: "OrderedDict[str, Dict[str, bool]]" = OrderedDict()
+
+
+def _remember(entries: "OrderedDict[str, Any]", key: str, value: Any) -> None:
+    """Record an entry as most recent, forgetting the oldest past the limit."""
+
+    entries[key] = value
+    entries.move_to_end(key)
+
+    while len(entries) > MAX_VERSIONS:
+        entries.popitem(last=False)
+
+
+def csv_source(data: Union[pd.DataFrame, ChunkedFrame, UploadSource]) -> Optional[Any]:
+    """
+    Return the file object holding the CSV text of an input.
+
+    Args:
+        data: Input DataFrame, lazily loaded upload or chunked CSV stream.
+
+    Returns:
+        A seekable binary file-like object, or ``None`` for in-memory
+        frames and streams over file paths.
+    """
+
+    if isinstance(data, UploadSource):
+        source = data.uploaded_file
+    elif isinstance(data, ChunkedFrame):
+        source = data.source
+    else:
+        return None
+
+    return source if hasattr(source, "seek") and hasattr(source, "read") else None
+
+
+def _size(source: Any) -> int:
+    """Return the byte size of a seekable source and rewind it."""
+
+    size = source.seek(0, io.SEEK_END)
+    source.seek(0)
+
+    return size
+
+
+def _ends_row(source: Any, size: int) -> bool:
+    """Whether a line break ends the prefix or starts the bytes after it."""
+
+    source.seek(max(size - 1, 0))
+    boundary = source.read(2)
+    source.seek(0)
+
+    return b"\n" in boundary
+
+
+def earlier_versions(key: str, source: Any) -> List[Tuple[str, int]]:
+    """
+    Find the known dataset versions that an upload appends rows to.
+
+    Each version is compared to a given upload once; prefixes of new
+    candidates are hashed in a single pass over the upload.
+
+    Args:
+        key: Content hash of the upload.
+        source: Seekable binary file-like object holding the upload.
+
+    Returns:
+        The content hash and byte length of each earlier version whose
+        bytes start the upload and end at a line break, longest first.
+    """
+
+    size = _size(source)
+
+    with _lock:
+        compared = dict(_prefixes.get(key, {}))
+        versions = dict(_versions)
+
+    candidates = {
+        version: length
+        for version, length in versions.items()
+        if length < size and version not in compared
+    }
+
+    if candidates:
+        hashes = prefix_hashes(source, candidates.values())
+
+        for version, length in candidates.items():
+            compared[version] = hashes.get(length) == version and _ends_row(
+                source, length
+            )
+
+        with _lock:
+            _remember(_prefixes, key, compared)
+
+    matches = [
+        (version, versions[version])
+        for version, is_prefix in compared.items()
+        if is_prefix and version in versions
+    ]
+
+    return sorted(matches, key=lambda match: match[1], reverse=True)
+
+
+def appended_rows(
+    data: Union[ChunkedFrame, UploadSource],
+    source: Any,
+    key: str,
+    version: str,
+    offset: int,
+) -> pd.DataFrame:
+    """
+    Parse the rows an upload appends to an earlier version.
+
+    The bytes after the earlier version are parsed under the upload's
+    header, like the rest of ``data``, and memoised for the other
+    analyses refreshed from the same version.
+
+    Args:
+        data: Upload or chunked CSV stream over ``source``.
+        source: Seekable binary file-like object holding the upload.
+        key: Content hash of the upload.
+        version: Content hash of the earlier version.
+        offset: Byte length of the earlier version.
+
+    Returns:
+        The appended rows.
+    """
+
+    cache_key = make_key(key, "incremental:rows", version)
+    rows = STATE_CACHE.get(cache_key)
+
+    if rows is None:
+        source.seek(0)
+        header = source.readline()
+        source.seek(offset)
+        tail = io.BytesIO(header + source.read())
+        source.seek(0)
+
+        if isinstance(data, ChunkedFrame):
+            rows = pd.read_csv(tail, **data.read_kwargs)  # type: ignore
+        else:
+            rows = read_optimized(tail)
+
+        STATE_CACHE.put(cache_key, rows)
+
+    return rows
+
+
+def _fold(
+    analysis_cls: Type[MergeableAnalysis],
+    data: Union[ChunkedFrame, UploadSource],
+    n: Any,
+) -> Tuple[PartialState, str]:
+    """
+    Aggregate a whole dataset into a partial state.
+
+    Uploads the pandas engine would analyse in memory are folded as one
+    chunk; larger ones are streamed.
+
+    Args:
+        analysis_cls: Mergeable analysis implementation.
+        data: Upload or chunked CSV stream.
+        n: Optional parameter passed to the analysis.
+
+    Returns:
+        The partial state, and the name of the engine it matches.
+    """
+
+    columns = analysis_cls.required_columns(data.dtypes, n)
+    state = analysis_cls.init(n)
+
+    if isinstance(data, UploadSource) and choose_engine(data).name == "pandas":
+        return analysis_cls.update(state, data.frame(columns), n), "pandas"
+
+    chunks = data.chunks() if isinstance(data, UploadSource) else data
+
+    for chunk in chunks.project(columns):
+        state = analysis_cls.update(state, chunk, n)
+
+    return state, "chunked"
+
+
+def refresh(
+    analysis_cls: Type[MergeableAnalysis],
+    data: Union[pd.DataFrame, ChunkedFrame, UploadSource],
+    n: Any,
+    key: str,
+) -> Optional[Tuple[AnalysisResult, str]]:
+    """
+    Compute an analysis from partial aggregates kept across uploads.
+
+    The partial state of an upload that extends an earlier version is
+    merged from that version's state and the appended rows. Otherwise it
+    is aggregated from the whole upload. Either way it is stored for
+    uploads that later extend this one.
+
+    Args:
+        analysis_cls: Mergeable analysis implementation.
+        data: Input DataFrame, lazily loaded upload or chunked CSV stream.
+        n: Optional parameter passed to the analysis.
+        key: Content hash of ``data``.
+
+    Returns:
+        The result and ``"incremental"``, or the name of the engine it
+        matches when the whole upload was aggregated, or ``None`` if
+        ``data`` is not backed by an uploaded file.
+    """
+
+    source = csv_source(data)
+
+    if source is None:
+        return None
+
+    name = f"incremental:{analysis_cls.__name__}"
+    cache_key = make_key(key, name, n)
+    state = STATE_CACHE.get(cache_key)
+    origin = "incremental"
+
+    if state is None:
+        for version, offset in earlier_versions(key, source):
+            earlier = STATE_CACHE.get(make_key(version, name, n))
+
+            if earlier is not None:
+                rows = appended_rows(data, source, key, version, offset)
+                appended = analysis_cls.update(analysis_cls.init(n), rows, n)
+                state = analysis_cls.merge(earlier, appended, n)
+                break
+        else:
+            state, origin = _fold(analysis_cls, data, n)
+
+        STATE_CACHE.put(cache_key, state)
+
+        with _lock:
+            _remember(_versions, key, _size(source))
+
+    return analysis_cls.finalize(state, n), origin
@@ -0,0 +1,278 @@
+"""
+CSV ingestion utilities for EDA.
+
+This module provides a chunked, re-iterable view over an uploaded CSV
+file so that analyses can consume the data in bounded row batches
+instead of materialising the whole frame in memory, and a content hash
+used to identify uploads across reruns and sessions. Hashes of an
+upload's prefixes identify the earlier uploads it appends to. Readers can be
+detached onto independent file handles so that several worker threads
+can scan the same upload concurrently.
+"""
+
+import copy
+import hashlib
+import io
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Hashable,
+    Iterable,
+    Iterator,
+    Optional,
+    Sequence,
+)
+
+import pandas as pd
+
+from .config import CHUNK_ROWS, DTYPE_SAMPLE_ROWS
+
+HASH_BLOCK_BYTES = 1024 * 1024
+
+
+def row_blocks(data: pd.DataFrame, rows: int = CHUNK_ROWS) -> Iterator[pd.DataFrame]:
+    """
+    Split an in-memory DataFrame into consecutive row blocks.
+
+    This lets chunk-oriented analyses run on a loaded frame with the
+    same bounded working set as in streaming mode.
+
+    Args:
+        data: Input pandas DataFrame.
+        rows: Maximum number of rows per block.
+
+    Yields:
+        Row slices of ``data`` in order.
+    """
+
+    for start in range(0, len(data), rows):
+        yield data.iloc[start : start + rows]
+
+
+def content_hash(source: Any) -> str:
+    """
+    Compute a content hash of a seekable binary file-like object.
+
+    The source is read in fixed-size blocks and rewound afterwards, so
+    hashing does not copy the whole upload.
+
+    Args:
+        source: Seekable binary file-like object.
+
+    Returns:
+        The hexadecimal BLAKE2b digest of the contents.
+    """
+
+    digest = hashlib.blake2b(digest_size=20)
+
+    source.seek(0)
+    for block in iter(lambda: source.read(HASH_BLOCK_BYTES), b""):
+        digest.update(block)
+    source.seek(0)
+
+    return digest.hexdigest()
+
+
+def prefix_hashes(source: Any, sizes: Iterable[int]) -> Dict[int, str]:
+    """
+    Compute the content hashes of several prefixes of a source in one pass.
+
+    Each prefix hashes to the `content_hash` of a file holding just its
+    bytes, so an upload that extends an earlier one can be recognised by
+    the earlier upload's hash. Only the bytes up to the longest prefix
+    are read, and the source is rewound afterwards.
+
+    Args:
+        source: Seekable binary file-like object.
+        sizes: Prefix lengths in bytes.
+
+    Returns:
+        The hexadecimal digest of each prefix length not exceeding the
+        source's size.
+    """
+
+    digest = hashlib.blake2b(digest_size=20)
+    hashes: Dict[int, str] = {}
+    position = 0
+
+    source.seek(0)
+    for size in sorted(set(sizes)):
+        while position < size:
+            block = source.read(min(HASH_BLOCK_BYTES, size - position))
+            if not block:
+                break
+            digest.update(block)
+            position += len(block)
+
+        if position < size:
+            break
+
+        hashes[size] = digest.copy().hexdigest()
+    source.seek(0)
+
+    return hashes
+
+
+def reopen(source: Any) -> Any:
+    """
+    Return an independent handle on a CSV source.
+
+    In-memory uploads are wrapped in a new ``BytesIO`` over the same
+    bytes, so the copy has its own read position without duplicating the
+    data. Paths are returned unchanged.
+
+    Args:
+        source: File path or seekable file-like object holding CSV text.
+
+    Returns:
+        A source that can be read without moving the original's position.
+    """
+
+    if hasattr(source, "getvalue"):
+        return io.BytesIO(source.getvalue())
+
+    return source
+
+
+def _source_size(source: Any) -> Optional[int]:
+    """Return the byte size of a seekable source, or ``None`` if unknown."""
+
+    if not hasattr(source, "seek"):
+        return None
+
+    position = source.tell()
+    size = source.seek(0, io.SEEK_END)
+    source.seek(position)
+
+    return size
+
+
+class ChunkedFrame:
+    """
+    Re-iterable, chunked view over a CSV source.
+
+    Each iteration rewinds the source and yields consecutive
+    ``pd.DataFrame`` chunks of at most ``chunk_rows`` rows, so peak
+    memory is bounded by a few chunks rather than the full dataset.
+
+    Attributes:
+        source: File path or seekable file-like object holding CSV text.
+        chunk_rows: Maximum number of rows per yielded chunk.
+        on_chunk: Optional callback invoked after each chunk with the
+            fraction of the source consumed so far, or ``None`` when the
+            source size is unknown. Exceptions it raises abort iteration.
+        read_kwargs: Extra keyword arguments forwarded to ``pd.read_csv``.
+    """
+
+    def __init__(
+        self,
+        source: Any,
+        chunk_rows: int = CHUNK_ROWS,
+        on_chunk: Optional[Callable[[Optional[float]], None]] = None,
+        **read_kwargs: Any,
+    ) -> None:
+        if chunk_rows < 1:
+            raise ValueError("chunk_rows must be a positive integer")
+
+        self.source = source
+        self.chunk_rows = chunk_rows
+        self.on_chunk = on_chunk
+        self.read_kwargs = read_kwargs
+
+    def _rewind(self) -> None:
+        """Seek file-like sources back to the start before reading."""
+
+        if hasattr(self.source, "seek"):
+            self.source.seek(0)
+
+    @property
+    def columns(self) -> pd.Index:
+        """
+        Return the column labels without parsing any data rows.
+
+        Returns:
+            A pandas Index with the CSV header.
+        """
+
+        self._rewind()
+        header = pd.read_csv(self.source, nrows=0, **self.read_kwargs)  # type: ignore
+
+        return header.columns
+
+    @property
+    def dtypes(self) -> pd.Series:
+        """
+        Return column dtypes inferred from the leading rows.
+
+        Returns:
+            The dtypes of a sample of at most ``DTYPE_SAMPLE_ROWS`` rows.
+        """
+
+        self._rewind()
+        sample = pd.read_csv(  # type: ignore
+            self.source, nrows=DTYPE_SAMPLE_ROWS, **self.read_kwargs
+        )
+
+        return sample.dtypes
+
+    def project(self, columns: Optional[Sequence[Hashable]]) -> "ChunkedFrame":
+        """
+        Return a view that parses only the given columns.
+
+        Args:
+            columns: Column labels to keep, or ``None`` for all columns.
+
+        Returns:
+            A ``ChunkedFrame`` over the same source.
+        """
+
+        if columns is None:
+            return self
+
+        projected = copy.copy(self)
+        projected.read_kwargs = {**self.read_kwargs, "usecols": list(columns)}
+
+        return projected
+
+    def detach(
+        self, on_chunk: Optional[Callable[[Optional[float]], None]] = None
+    ) -> "ChunkedFrame":
+        """
+        Return a view over an independent handle on the same source.
+
+        Args:
+            on_chunk: Progress callback for the new view.
+
+        Returns:
+            A ``ChunkedFrame`` that can be iterated from another thread.
+        """
+
+        detached = copy.copy(self)
+        detached.source = reopen(self.source)
+        detached.on_chunk = on_chunk
+
+        return detached
+
+    def __iter__(self) -> Iterator[pd.DataFrame]:
+        """
+        Yield the CSV contents as consecutive DataFrame chunks.
+
+        Yields:
+            DataFrames of at most ``chunk_rows`` rows, in file order.
+        """
+
+        self._rewind()
+        size = _source_size(self.source) if self.on_chunk is not None else None
+
+        with pd.read_csv(  # type: ignore
+            self.source,
+            chunksize=self.chunk_rows,
+            **self.read_kwargs,
+        ) as reader:
+            for chunk in reader:
+                yield chunk
+
+                if self.on_chunk is not None:
+                    fraction = min(self.source.tell() / size, 1.0) if size else None
+                    self.on_chunk(fraction)
@@ -0,0 +1,239 @@
+"""
+Background execution of EDA analyses.
+
+This module runs analyses on a shared thread pool so that long
+computations do not block the Streamlit script thread, and several
+analyses can run concurrently. pandas and NumPy release the GIL in their
+heavy kernels, so threads spread work across cores without copying
+frames between processes.
+
+Streamed analyses report progress after every chunk and can be
+cancelled between chunks. Analyses on in-memory frames report no
+progress and, once started, run to completion, but a cancelled job's
+result is discarded.
+
+In sampling mode a job is shown first as an estimate from a random
+sample, which its exact result replaces once it finishes.
+"""
+
+import logging
+import threading
+import uuid
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass, field
+from typing import Any, List, Optional, Union
+
+import pandas as pd
+
+from .analysis_base import AnalysisResult
+from .analyze import analyzer, estimate
+from .config import SAMPLE_ROWS, WORKER_THREADS
+from .ingest import ChunkedFrame
+from .loader import UploadSource
+from .result_store import ResultStore
+from .types import AnalysisMetrics
+
+logger = logging.getLogger(__name__)
+
+EXECUTOR = ThreadPoolExecutor(max_workers=WORKER_THREADS, thread_name_prefix="eda")
+
+
+class JobCancelled(Exception):
+    """Raised inside a worker to abort a cancelled analysis."""
+
+
+@dataclass
+class Job:
+    """
+    Handle on an analysis submitted to the worker pool.
+
+    Attributes:
+        id: Unique identifier, reused for the result item.
+        analysis: Identifier of the running analysis.
+        future: Future resolving to the ``(title, result)`` pair.
+        progress: Fraction of the input processed, or ``None`` when the
+            analysis cannot report progress.
+        cancel_event: Set when cancellation has been requested.
+        estimate_id: Id of the sampled estimate the result replaces, if any.
+        metrics: Resource usage of the analysis, set when it ends.
+    """
+
+    id: str
+    analysis: str
+    future: "Future[tuple[str, AnalysisResult]]" = field(repr=False)
+    progress: Optional[float] = None
+    cancel_event: threading.Event = field(default_factory=threading.Event)
+    estimate_id: Optional[str] = None
+    metrics: Optional[AnalysisMetrics] = None
+
+    @property
+    def cancelled(self) -> bool:
+        """Whether cancellation has been requested."""
+
+        return self.cancel_event.is_set()
+
+    def cancel(self) -> None:
+        """Request cancellation, dropping the job if it has not started."""
+
+        self.cancel_event.set()
+        self.future.cancel()
+
+    def report(self, fraction: Optional[float]) -> None:
+        """
+        Record progress and abort if cancellation was requested.
+
+        Args:
+            fraction: Fraction of the input processed, if known.
+
+        Raises:
+            JobCancelled: If the job has been cancelled.
+        """
+
+        if self.cancelled:
+            raise JobCancelled(self.id)
+
+        self.progress = fraction
+
+
+def submit(
+    analysis: str,
+    data: Union[pd.DataFrame, ChunkedFrame, UploadSource],
+    n: Any = None,
+    key: Optional[str] = None,
+    executor: ThreadPoolExecutor = EXECUTOR,
+    incremental: bool = False,
+) -> Job:
+    """
+    Run an analysis in the background.
+
+    Streams and lazily loaded uploads are detached onto independent file
+    handles first, so concurrent jobs never share a read position.
+
+    Args:
+        analysis: Identifier of the analysis to run.
+        data: Input passed to ``analyzer``.
+        n: Optional analysis parameter.
+        key: Optional content hash of ``data``.
+        executor: Pool on which to run the analysis.
+        incremental: Whether to refresh from partial aggregates kept
+            across uploads, see ``analyzer``.
+
+    Returns:
+        A ``Job`` tracking the submitted analysis.
+    """
+
+    job_id = str(uuid.uuid4())
+    job = Job(id=job_id, analysis=analysis, future=Future())
+
+    if isinstance(data, ChunkedFrame):
+        data = data.detach(on_chunk=job.report)
+        job.progress = 0.0
+    elif isinstance(data, UploadSource):
+        data = data.detach()
+
+    job.future = executor.submit(
+        analyzer,
+        analysis,
+        data,
+        n,
+        key,
+        lambda metrics: setattr(job, "metrics", metrics),
+        incremental,
+    )
+
+    return job
+
+
+def attach_estimate(
+    job: Job,
+    data: Union[pd.DataFrame, ChunkedFrame, UploadSource],
+    n: Any,
+    results: ResultStore,
+    rows: int = SAMPLE_ROWS,
+) -> None:
+    """
+    Show a sampled estimate of a job's result until the job finishes.
+
+    Nothing is added when the job has already finished, e.g. because its
+    result was cached, or when the analysis has no estimate. Failing
+    estimates are logged and skipped.
+
+    Args:
+        job: Job computing the exact result.
+        data: Input the job was submitted with.
+        n: Optional analysis parameter.
+        results: Result store the estimate is appended to.
+        rows: Maximum number of rows to sample.
+
+    Side Effects:
+        Appends the estimate to ``results`` and records its id on ``job``.
+    """
+
+    if job.future.done():
+        return
+
+    try:
+        estimated = estimate(job.analysis, data, n, rows)
+    except Exception as error:
+        logger.warning("Could not estimate %s: %s", job.analysis, error)
+        return
+
+    if estimated is None:
+        return
+
+    title, result = estimated
+
+    job.estimate_id = str(uuid.uuid4())
+    results.append({"id": job.estimate_id, "title": title, "df": result})
+
+
+def collect(jobs: List[Job], results: ResultStore) -> bool:
+    """
+    Move finished jobs from ``jobs`` into ``results``.
+
+    Failed analyses are recorded as a result holding the error message;
+    cancelled ones are dropped. The job's sampled estimate is removed in
+    every case, and a successful result takes its place.
+
+    Args:
+        jobs: Submitted jobs, in submission order.
+        results: Result store to append finished analyses to.
+
+    Returns:
+        ``True`` if any job was removed from ``jobs``.
+
+    Side Effects:
+        Mutates both ``jobs`` and ``results`` in place.
+    """
+
+    finished = [job for job in jobs if job.future.done()]
+
+    for job in finished:
+        jobs.remove(job)
+
+        if job.estimate_id is not None:
+            results.remove(job.estimate_id)
+
+        if job.cancelled:
+            continue
+
+        error = job.future.exception()
+
+        if error is not None:
+            results.append(
+                {
+                    "id": job.id,
+                    "title": f"{job.analysis} (failed)",
+                    "df": f"{type(error).__name__}: {error}",
+                },
+                metrics=job.metrics,
+            )
+            continue
+
+        title, result = job.future.result()
+
+        results.append(
+            {"id": job.id, "title": title, "df": result}, metrics=job.metrics
+        )
+
+    return bool(finished)
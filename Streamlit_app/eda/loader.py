@@ -0,0 +1,329 @@
+"""
+Upload loading helpers for the Streamlit EDA application.
+
+This module identifies uploads by content hash and keeps the parsed
+DataFrame in ``st.session_state`` so that a CSV is parsed once per
+distinct upload rather than on every Streamlit rerun. Parsed frames are
+also persisted in the columnar dataset cache, so repeat uploads of the
+same file in any session skip CSV parsing altogether. Uploads are parsed
+with compact, inferred dtypes, and analyses that need only some columns
+can load just those through ``UploadSource``. Full frames are leased
+from the process-wide dataset registry, so sessions working on the same
+upload share one read-only copy.
+"""
+
+import copy
+from types import ModuleType
+from typing import Any, Hashable, Optional, Sequence, Tuple, TypedDict
+
+import pandas as pd
+
+from .config import CHUNK_ROWS, DTYPE_SAMPLE_ROWS
+from .dataset_cache import DATASET_CACHE
+from .ingest import ChunkedFrame, content_hash, reopen
+from .optimize import read_optimized
+from .registry import DATASETS, DatasetLease
+
+
+class LoadedDataset(TypedDict):
+    """
+    Session-level record of the current upload.
+
+    Attributes:
+        file_id: Streamlit identifier of the uploaded file.
+        key: Content hash of the upload.
+        df: Read-only view of the parsed DataFrame, or ``None`` if not
+            parsed yet.
+        dtypes: Column dtypes, or ``None`` if not inspected yet.
+        lease: Registry lease backing ``df``, or ``None``.
+    """
+
+    file_id: Optional[str]
+    key: str
+    df: Optional[pd.DataFrame]
+    dtypes: Optional[pd.Series]
+    lease: Optional[DatasetLease]
+
+
+def _current(st: ModuleType, uploaded_file: Any) -> LoadedDataset:
+    """
+    Return the session record for an upload, hashing it only when new.
+
+    Args:
+        st: Streamlit module instance holding the session state.
+        uploaded_file: File object returned by ``st.file_uploader``.
+
+    Returns:
+        The session record for ``uploaded_file``.
+
+    Side Effects:
+        Releases the registry lease of a replaced upload.
+    """
+
+    file_id = getattr(uploaded_file, "file_id", None)
+    entry: Optional[LoadedDataset] = st.session_state.get("dataset")
+
+    if entry is not None and file_id is not None and entry["file_id"] == file_id:
+        return entry
+
+    key = content_hash(uploaded_file)
+
+    if entry is not None and entry["key"] == key:
+        entry["file_id"] = file_id
+        return entry
+
+    if entry is not None and entry["lease"] is not None:
+        entry["lease"].release()
+
+    entry = {"file_id": file_id, "key": key, "df": None, "dtypes": None, "lease": None}
+    st.session_state["dataset"] = entry
+
+    return entry
+
+
+def release_dataset(st: ModuleType) -> None:
+    """
+    Forget the session's upload once the file has been removed.
+
+    Args:
+        st: Streamlit module instance holding the session state.
+
+    Side Effects:
+        Releases the registry lease of the upload, so its shared frame is
+        dropped when no other session uses it, and removes
+        ``st.session_state["dataset"]``.
+    """
+
+    entry: Optional[LoadedDataset] = st.session_state.pop("dataset", None)
+
+    if entry is not None and entry["lease"] is not None:
+        entry["lease"].release()
+
+
+def upload_key(st: ModuleType, uploaded_file: Any) -> str:
+    """
+    Return the content hash of an upload without parsing it.
+
+    Args:
+        st: Streamlit module instance holding the session state.
+        uploaded_file: File object returned by ``st.file_uploader``.
+
+    Returns:
+        The content hash identifying the upload.
+    """
+
+    return _current(st, uploaded_file)["key"]
+
+
+def load_dataset(st: ModuleType, uploaded_file: Any) -> Tuple[str, pd.DataFrame]:
+    """
+    Parse an upload once and reuse the frame on later reruns.
+
+    Args:
+        st: Streamlit module instance holding the session state.
+        uploaded_file: File object returned by ``st.file_uploader``.
+
+    Returns:
+        A tuple of the upload's content hash and the parsed DataFrame.
+
+    Side Effects:
+        - Leases the parsed frame from the dataset registry and stores the
+          view in ``st.session_state["dataset"]``.
+        - Writes newly parsed uploads to the columnar dataset cache.
+    """
+
+    entry = _current(st, uploaded_file)
+
+    return entry["key"], _load(entry, uploaded_file)
+
+
+def _parse(key: str, uploaded_file: Any) -> pd.DataFrame:
+    """
+    Read an upload from the columnar cache, or parse and cache it.
+
+    Args:
+        key: Content hash of the upload.
+        uploaded_file: File object holding the upload's CSV text.
+
+    Returns:
+        The parsed DataFrame.
+    """
+
+    df = DATASET_CACHE.read(key)
+
+    if df is None:
+        df = read_optimized(uploaded_file)
+        DATASET_CACHE.write(key, df)
+
+    return df
+
+
+def _load(entry: LoadedDataset, uploaded_file: Any) -> pd.DataFrame:
+    """
+    Return the full frame of a session record, leasing it if needed.
+
+    Args:
+        entry: Session record of the upload.
+        uploaded_file: File object holding the upload's CSV text.
+
+    Returns:
+        A read-only view of the parsed DataFrame, also stored in ``entry``.
+    """
+
+    if entry["df"] is None:
+        lease = DATASETS.acquire(
+            entry["key"], lambda: _parse(entry["key"], uploaded_file)
+        )
+        entry["lease"], entry["df"] = lease, lease.frame
+
+    return entry["df"]
+
+
+def _dtypes(entry: LoadedDataset, uploaded_file: Any) -> pd.Series:
+    """
+    Return the column dtypes of an upload without parsing all of it.
+
+    Dtypes come from the loaded frame or the columnar cache when
+    available, and otherwise from a sample of the leading rows.
+
+    Args:
+        entry: Session record of the upload.
+        uploaded_file: File object holding the upload's CSV text.
+
+    Returns:
+        The column dtypes, in file order.
+    """
+
+    if entry["df"] is not None:
+        return entry["df"].dtypes
+
+    if entry["dtypes"] is None:
+        entry["dtypes"] = DATASET_CACHE.dtypes(entry["key"])
+
+    if entry["dtypes"] is None:
+        uploaded_file.seek(0)
+        sample = pd.read_csv(uploaded_file, nrows=DTYPE_SAMPLE_ROWS)  # type: ignore
+        entry["dtypes"] = sample.dtypes
+
+    return entry["dtypes"]
+
+
+def _load_columns(
+    entry: LoadedDataset,
+    uploaded_file: Any,
+    columns: Optional[Sequence[Hashable]],
+) -> pd.DataFrame:
+    """
+    Load the given columns of an upload as cheaply as possible.
+
+    A frame already loaded in the session or shared by another session is
+    reused as is. Otherwise the columns are read from the columnar cache,
+    or parsed from the CSV with ``usecols``. Projections are not stored in
+    the session.
+
+    Args:
+        entry: Session record of the upload.
+        uploaded_file: File object holding the upload's CSV text.
+        columns: Column labels to load, or ``None`` for the full frame.
+
+    Returns:
+        A DataFrame containing at least the requested columns.
+    """
+
+    if columns is None or entry["df"] is not None or entry["key"] in DATASETS:
+        return _load(entry, uploaded_file)
+
+    df = DATASET_CACHE.read(entry["key"], columns=[str(c) for c in columns])
+
+    if df is None:
+        df = read_optimized(uploaded_file, usecols=list(columns))
+
+    return df
+
+
+class UploadSource:
+    """
+    Lazily loaded upload that materialises only the columns requested.
+
+    The source holds the upload's session record rather than the
+    Streamlit module, so it can be used from worker threads.
+
+    Attributes:
+        uploaded_file: File object returned by ``st.file_uploader``.
+        entry: Session record of the upload.
+        key: Content hash of the upload.
+    """
+
+    def __init__(self, st: ModuleType, uploaded_file: Any) -> None:
+        self.uploaded_file = uploaded_file
+        self.entry = _current(st, uploaded_file)
+        self.key = self.entry["key"]
+
+    @property
+    def dtypes(self) -> pd.Series:
+        """Column dtypes, possibly inferred from a sample."""
+
+        return _dtypes(self.entry, self.uploaded_file)
+
+    @property
+    def columns(self) -> pd.Index:
+        """Column labels in file order."""
+
+        return self.dtypes.index
+
+    @property
+    def loaded(self) -> bool:
+        """Whether the full frame is in memory in this or another session."""
+
+        return self.entry["df"] is not None or self.key in DATASETS
+
+    @property
+    def nbytes(self) -> int:
+        """Size of the uploaded CSV text in bytes."""
+
+        size = getattr(self.uploaded_file, "size", None)
+
+        if size is None:
+            size = len(self.uploaded_file.getbuffer())
+
+        return int(size)
+
+    def chunks(self, chunk_rows: int = CHUNK_ROWS) -> ChunkedFrame:
+        """
+        Return a chunked view over the upload's CSV text.
+
+        Args:
+            chunk_rows: Maximum number of rows per chunk.
+
+        Returns:
+            A ``ChunkedFrame`` reading this source's file handle.
+        """
+
+        return ChunkedFrame(self.uploaded_file, chunk_rows=chunk_rows)
+
+    def frame(self, columns: Optional[Sequence[Hashable]] = None) -> pd.DataFrame:
+        """
+        Materialise the upload, or a projection of it.
+
+        Args:
+            columns: Column labels to load, or ``None`` for all columns.
+
+        Returns:
+            A DataFrame containing at least the requested columns.
+        """
+
+        return _load_columns(self.entry, self.uploaded_file, columns)
+
+    def detach(self) -> "UploadSource":
+        """
+        Return a source over an independent handle on the same upload.
+
+        Returns:
+            An ``UploadSource`` sharing this one's session record that can
+            be read from another thread.
+        """
+
+        detached = copy.copy(self)
+        detached.uploaded_file = reopen(self.uploaded_file)
+
+        return detached
@@ -0,0 +1,299 @@
+"""
+Per-call resource instrumentation of EDA analyses.
+
+This module measures wall time, CPU time, peak allocation and input
+shape of every analysis call. Measurements are attached to the stored
+result for display and emitted as one JSON object per call on the
+``eda.metrics`` logger, and optionally appended to the JSON-lines file
+named by ``EDA_METRICS_LOG``, so the analyses and datasets that
+dominate server load can be identified.
+
+CPU time is that of the calling worker thread and excludes threads
+started by native libraries. Peak memory is the growth of the sampled
+resident set size by default, which costs almost nothing, or of the
+allocations traced by ``tracemalloc`` when ``EDA_MEMORY_PROFILER``
+selects ``"tracemalloc"``, which is exact for Python and NumPy but does
+not see Arrow or DuckDB memory and slows analyses down. Memory is
+measured per process, so while several analyses overlap, each reports
+an upper bound on its own peak.
+"""
+
+import itertools
+import json
+import logging
+import os
+import threading
+import time
+import tracemalloc
+from contextlib import contextmanager
+from typing import Any, Callable, Dict, Iterator, Optional, Tuple
+
+import pandas as pd
+
+from .config import MEMORY_PROFILER, MEMORY_SAMPLE_SECONDS, METRICS_LOG
+from .ingest import ChunkedFrame
+from .loader import UploadSource
+from .types import AnalysisMetrics
+
+logger = logging.getLogger(__name__)
+
+PAGE_SIZE = os.sysconf("SC_PAGE_SIZE") if hasattr(os, "sysconf") else 4096
+
+if METRICS_LOG is not None:
+    _handler = logging.FileHandler(METRICS_LOG, encoding="utf-8")
+    _handler.setFormatter(logging.Formatter("%(message)s"))
+    logger.addHandler(_handler)
+    logger.setLevel(logging.INFO)
+
+
+def resident_bytes() -> Optional[int]:
+    """Return the process's resident set size, or ``None`` if unavailable."""
+
+    try:
+        with open("/proc/self/statm", "rb") as statm:
+            return int(statm.read().split()[1]) * PAGE_SIZE
+    except (OSError, ValueError, IndexError):
+        return None
+
+
+class MemoryProfiler:
+    """
+    Measures the peak memory growth of concurrently running calls.
+
+    In ``"tracemalloc"`` mode Python and NumPy allocations are traced
+    exactly, which slows down analyses that allocate many Python
+    objects. In ``"rss"`` mode a background thread samples the resident
+    set size instead, which costs almost nothing but misses spikes
+    shorter than the sampling interval and allocations reusing memory
+    the process already holds, and only works where ``/proc`` is
+    available. Tracing or sampling runs only while calls are measured.
+
+    Attributes:
+        mode: ``"rss"``, ``"tracemalloc"`` or ``"off"``.
+        interval: Sampling interval in seconds in ``"rss"`` mode.
+    """
+
+    def __init__(
+        self,
+        mode: str = MEMORY_PROFILER,
+        interval: float = MEMORY_SAMPLE_SECONDS,
+    ) -> None:
+        self.mode = mode
+        self.interval = interval
+        self._peaks: Dict[int, int] = {}
+        self._tokens = itertools.count()
+        self._owned = False
+        self._sampler: Optional[threading.Thread] = None
+        self._lock = threading.Lock()
+
+    def _current(self) -> Optional[int]:
+        """Return the memory currently in use as seen by the mode."""
+
+        if self.mode == "tracemalloc":
+            return tracemalloc.get_traced_memory()[0]
+
+        return resident_bytes()
+
+    def _sample(self) -> None:
+        """Record the resident set size until no call is measured."""
+
+        while True:
+            current = resident_bytes() or 0
+
+            with self._lock:
+                if not self._peaks:
+                    self._sampler = None
+                    return
+
+                for token, peak in self._peaks.items():
+                    self._peaks[token] = max(peak, current)
+
+            time.sleep(self.interval)
+
+    def enter(self) -> Optional[Tuple[int, int]]:
+        """
+        Begin measuring a call.
+
+        Returns:
+            A token for `exit` holding the memory in use at the start of
+            the call, or ``None`` if memory cannot be measured.
+        """
+
+        if self.mode not in ("rss", "tracemalloc"):
+            return None
+
+        with self._lock:
+            if self.mode == "tracemalloc" and not self._peaks:
+                self._owned = not tracemalloc.is_tracing()
+
+                if self._owned:
+                    tracemalloc.start()
+
+                tracemalloc.reset_peak()
+
+            baseline = self._current()
+
+            if baseline is None:
+                return None
+
+            token = next(self._tokens)
+            self._peaks[token] = baseline
+
+            if self.mode == "rss" and self._sampler is None:
+                self._sampler = threading.Thread(
+                    target=self._sample, name="eda-memory", daemon=True
+                )
+                self._sampler.start()
+
+        return token, baseline
+
+    def exit(self, token: Optional[Tuple[int, int]]) -> Optional[int]:
+        """
+        Finish measuring a call.
+
+        Args:
+            token: Value returned by the matching `enter`.
+
+        Returns:
+            The peak memory above the start of the call in bytes, or
+            ``None`` if it was not measured.
+        """
+
+        if token is None:
+            return None
+
+        key, baseline = token
+
+        with self._lock:
+            if self.mode == "tracemalloc":
+                peak = tracemalloc.get_traced_memory()[1]
+            else:
+                peak = max(self._peaks[key], resident_bytes() or 0)
+
+            del self._peaks[key]
+
+            if self.mode == "tracemalloc" and not self._peaks and self._owned:
+                tracemalloc.stop()
+
+        return max(peak - baseline, 0)
+
+
+PROFILER = MemoryProfiler()
+
+
+def input_shape(data: Any) -> Tuple[Optional[int], Optional[int]]:
+    """
+    Return the row and column counts of an input known without a scan.
+
+    Args:
+        data: Input DataFrame, lazily loaded upload or chunked CSV stream.
+
+    Returns:
+        The row count, or ``None`` for streams and unloaded uploads, and
+        the column count.
+    """
+
+    if isinstance(data, pd.DataFrame):
+        return data.shape
+
+    if isinstance(data, UploadSource):
+        df = data.entry["df"]
+        rows = len(df) if df is not None else None
+
+        return rows, len(data.columns)
+
+    if isinstance(data, ChunkedFrame):
+        return None, len(data.columns)
+
+    return None, None
+
+
+@contextmanager
+def measure(
+    analysis: str,
+    data: Any,
+    dataset: Optional[str] = None,
+    on_end: Optional[Callable[[AnalysisMetrics], None]] = None,
+) -> Iterator[AnalysisMetrics]:
+    """
+    Measure an analysis call and log the metrics when it ends.
+
+    The yielded record is filled in when the block exits; the caller may
+    set ``"source"`` inside the block. Errors are recorded and re-raised.
+
+    Args:
+        analysis: Identifier of the analysis.
+        data: Input of the analysis.
+        dataset: Content hash of the input, if known.
+        on_end: Optional callback receiving the completed record.
+
+    Yields:
+        The metrics record of the call.
+
+    Side Effects:
+        Emits the record as JSON on the ``eda.metrics`` logger.
+    """
+
+    metrics: AnalysisMetrics = {
+        "analysis": analysis,
+        "dataset": dataset,
+        "source": None,
+        "rows": None,
+        "columns": None,
+        "wall_s": 0.0,
+        "cpu_s": 0.0,
+        "peak_bytes": None,
+        "error": None,
+    }
+
+    token = PROFILER.enter()
+    wall, cpu = time.perf_counter(), time.thread_time()
+
+    try:
+        yield metrics
+    except Exception as error:
+        metrics["error"] = f"{type(error).__name__}: {error}"
+        raise
+    finally:
+        metrics["wall_s"] = time.perf_counter() - wall
+        metrics["cpu_s"] = time.thread_time() - cpu
+        metrics["peak_bytes"] = PROFILER.exit(token)
+
+        try:
+            metrics["rows"], metrics["columns"] = input_shape(data)
+        except (OSError, ValueError) as error:
+            logger.debug("Could not read the shape of %s input: %s", analysis, error)
+
+        logger.info("%s", json.dumps(metrics, default=str))
+
+        if on_end is not None:
+            on_end(metrics)
+
+
+def summary(metrics: AnalysisMetrics) -> str:
+    """
+    Format metrics as a one-line caption.
+
+    Args:
+        metrics: Metrics record of an analysis call.
+
+    Returns:
+        Wall and CPU time, peak allocation, input shape and source.
+    """
+
+    parts = [
+        f"{metrics['wall_s'] * 1000:,.1f} ms",
+        f"CPU {metrics['cpu_s'] * 1000:,.1f} ms",
+    ]
+
+    if metrics["peak_bytes"] is not None:
+        parts.append(f"peak {metrics['peak_bytes'] / 1024**2:,.1f} MB")
+
+    if metrics["columns"] is not None:
+        rows = "?" if metrics["rows"] is None else f"{metrics['rows']:,}"
+        parts.append(f"{rows} × {metrics['columns']:,}")
+
+    if metrics["source"] is not None:
+        parts.append(metrics["source"])
+
+    return " · ".join(parts)
@@ -0,0 +1,141 @@
+"""
+Load-time dtype optimisation for EDA.
+
+This module plans compact column representations from a sample of an
+upload and applies them while parsing:
+
+- Low-cardinality text columns are parsed directly as categoricals.
+- Date-like text columns are parsed once with an inferred format.
+- Integer columns are downcast to the smallest type holding their range.
+  Float columns stay ``float64``, since pandas reduces ``float32``
+  columns in ``float32`` and would round their means and deviations.
+
+The per-column memory footprint with pandas' default dtypes is recorded
+in ``df.attrs`` so the data type analysis can report the savings.
+"""
+
+from dataclasses import dataclass, field
+from typing import Any, Dict, List
+
+import numpy as np
+import pandas as pd
+from pandas.tseries.api import guess_datetime_format
+
+from .config import CATEGORY_MAX_RATIO, DTYPE_SAMPLE_ROWS
+
+MEMORY_BEFORE_ATTR = "memory_before"
+
+
+@dataclass
+class LoadPlan:
+    """
+    Column conversions applied while parsing an upload.
+
+    Attributes:
+        categories: Columns parsed as ``category``.
+        dates: Mapping of date columns to their ``strptime`` format.
+    """
+
+    categories: List[str] = field(default_factory=list)
+    dates: Dict[str, str] = field(default_factory=dict)
+
+
+def infer_plan(sample: pd.DataFrame) -> LoadPlan:
+    """
+    Infer categorical and date columns from a sample parsed with defaults.
+
+    A text column is a date column if a single format, guessed from its
+    first value, parses every sampled value. Otherwise it is categorical
+    if its distinct/non-null ratio is at most ``CATEGORY_MAX_RATIO``.
+
+    Args:
+        sample: Leading rows of the upload parsed with default dtypes.
+
+    Returns:
+        The inferred load plan.
+    """
+
+    plan = LoadPlan()
+
+    for column in sample.select_dtypes(include="object").columns:
+        values = sample[column].dropna()
+        if values.empty or not all(isinstance(v, str) for v in values):
+            continue
+
+        date_format = guess_datetime_format(values.iloc[0])
+        if date_format is not None:
+            parsed = pd.to_datetime(values, format=date_format, errors="coerce")
+            if parsed.notna().all():
+                plan.dates[column] = date_format
+                continue
+
+        if values.nunique() <= CATEGORY_MAX_RATIO * len(values):
+            plan.categories.append(column)
+
+    return plan
+
+
+def downcast(series: pd.Series) -> pd.Series:
+    """
+    Return a losslessly downcast copy of a numeric Series.
+
+    Args:
+        series: Input Series.
+
+    Returns:
+        The Series with the smallest integer type holding its range, or
+        unchanged if it is not an integer Series.
+    """
+
+    dtype = series.dtype
+
+    if pd.api.types.is_integer_dtype(dtype) and isinstance(dtype, np.dtype):
+        return pd.to_numeric(series, downcast="integer")
+
+    return series
+
+
+def read_optimized(source: Any, **read_kwargs: Any) -> pd.DataFrame:
+    """
+    Parse a CSV source with compact dtypes.
+
+    Memory before optimisation is measured exactly for downcast numeric
+    columns and extrapolated from the sample for columns converted at
+    parse time.
+
+    Args:
+        source: Seekable file-like object holding CSV text.
+        **read_kwargs: Extra keyword arguments forwarded to ``pd.read_csv``.
+
+    Returns:
+        The parsed DataFrame, with the per-column default-dtype memory in
+        ``df.attrs[MEMORY_BEFORE_ATTR]``.
+    """
+
+    source.seek(0)
+    sample = pd.read_csv(source, nrows=DTYPE_SAMPLE_ROWS, **read_kwargs)  # type: ignore
+    plan = infer_plan(sample)
+    sample_bytes = sample.memory_usage(index=False, deep=True)
+
+    source.seek(0)
+    df = pd.read_csv(  # type: ignore
+        source,
+        dtype={column: "category" for column in plan.categories},
+        parse_dates=list(plan.dates),
+        date_format=plan.dates,
+        **read_kwargs,
+    )
+
+    before: Dict[str, int] = {}
+    scale = len(df) / max(len(sample), 1)
+
+    for column in df.columns:
+        if column in plan.categories or column in plan.dates:
+            before[column] = int(sample_bytes[column] * scale)
+        else:
+            before[column] = int(df[column].memory_usage(index=False, deep=True))
+            df[column] = downcast(df[column])
+
+    df.attrs[MEMORY_BEFORE_ATTR] = before
+
+    return df
@@ -0,0 +1,162 @@
+"""
+Lazy plan of intermediates shared between EDA analyses.
+
+Several analyses start from the same derived data: the mean and
+describe analyses from the numeric columns, the missing-data analysis
+from the null mask, and the unique and value-count analyses from a hash
+table of each column's values. A `Plan` exposes these intermediates by
+name. Each is computed on first request, along with the intermediates
+it depends on, and memoised in a shared, memory-budgeted cache under
+the dataset's content hash, so a sequence of analyses on the same
+dataset version scans it about once.
+
+Analyses opt in through `compute_plan`. Plans are only used for
+datasets held in memory; uploads analysed out of core or in projection
+are unaffected.
+"""
+
+from typing import Any, Callable, Dict, Hashable, Optional, Tuple, Union
+
+import numpy as np
+import pandas as pd
+
+from .cache import ResultCache, make_key
+from .config import PLAN_CACHE_MB
+from .engines import choose_engine
+from .ingest import ChunkedFrame
+from .loader import UploadSource
+
+# Process-wide memo of intermediates; keys include the content hash.
+PLAN_CACHE: ResultCache[Any] = ResultCache(PLAN_CACHE_MB * 1024**2)
+
+
+def _numeric(plan: "Plan") -> pd.DataFrame:
+    """Numeric columns, as selected by the mean and describe analyses."""
+
+    return plan.frame.select_dtypes(include="number")
+
+
+def _null_mask(plan: "Plan") -> pd.DataFrame:
+    """Boolean frame marking missing values."""
+
+    return plan.frame.isna()
+
+
+def _null_counts(plan: "Plan") -> pd.Series:
+    """Number of missing values per column."""
+
+    return plan.get("null_mask").sum()
+
+
+def _hash_table(plan: "Plan", column: Hashable) -> Tuple[np.ndarray, pd.Index]:
+    """
+    Distinct non-null values of a column and each row's value code.
+
+    Codes are ``-1`` for missing values and use the smallest integer
+    type that holds them.
+    """
+
+    codes, uniques = pd.factorize(plan.frame[column], use_na_sentinel=True)
+    dtype = np.min_scalar_type(-max(len(uniques), 1))
+
+    return codes.astype(dtype, copy=False), pd.Index(uniques, name=column)
+
+
+def _distinct_counts(plan: "Plan") -> pd.Series:
+    """Number of distinct non-null values per column."""
+
+    return pd.Series(
+        {column: len(plan.get("hash_table", column)[1]) for column in plan.frame},
+        index=plan.frame.columns,
+        dtype="int64",
+    )
+
+
+# Intermediates by name. Each receives the plan, through which it
+# requests its own dependencies, and optional parameters.
+INTERMEDIATES: Dict[str, Callable[..., Any]] = {
+    "numeric": _numeric,
+    "null_mask": _null_mask,
+    "null_counts": _null_counts,
+    "hash_table": _hash_table,
+    "distinct_counts": _distinct_counts,
+}
+
+
+class Plan:
+    """
+    Lazily evaluated intermediates of one dataset version.
+
+    Plans are cheap to create; computed intermediates live in
+    ``PLAN_CACHE``, not in the plan. Concurrent plans over the same
+    version may compute an intermediate twice, but share it afterwards.
+
+    Attributes:
+        key: Content hash identifying the dataset version.
+    """
+
+    def __init__(self, key: str, load: Callable[[], pd.DataFrame]) -> None:
+        self.key = key
+        self._load = load
+        self._frame: Optional[pd.DataFrame] = None
+
+    @property
+    def frame(self) -> pd.DataFrame:
+        """The full dataset, loaded on first access."""
+
+        if self._frame is None:
+            self._frame = self._load()
+
+        return self._frame
+
+    def get(self, name: str, *params: Hashable) -> Any:
+        """
+        Return an intermediate, computing it and its dependencies if needed.
+
+        Args:
+            name: Name of the intermediate in ``INTERMEDIATES``.
+            *params: Parameters of the intermediate, e.g. a column label.
+
+        Returns:
+            The intermediate.
+
+        Raises:
+            KeyError: If the intermediate is unknown.
+        """
+
+        compute = INTERMEDIATES[name]
+        cache_key = make_key(self.key, f"plan:{name}", params)
+        value = PLAN_CACHE.get(cache_key)
+
+        if value is None:
+            value = compute(self, *params)
+            PLAN_CACHE.put(cache_key, value)
+
+        return value
+
+
+def plan_for(
+    data: Union[pd.DataFrame, ChunkedFrame, UploadSource], key: Optional[str]
+) -> Optional[Plan]:
+    """
+    Return a plan over a dataset if its intermediates can be shared.
+
+    Args:
+        data: Input DataFrame, lazily loaded upload or chunked CSV stream.
+        key: Content hash of ``data``, if known.
+
+    Returns:
+        A plan for versioned datasets that the pandas engine would
+        analyse in memory, otherwise ``None``.
+    """
+
+    if key is None or choose_engine(data).name != "pandas":
+        return None
+
+    if isinstance(data, pd.DataFrame):
+        return Plan(key, lambda: data)
+
+    if isinstance(data, UploadSource) and data.loaded:
+        return Plan(key, data.frame)
+
+    return None
@@ -0,0 +1,180 @@
+"""
+Process-wide registry of parsed datasets shared across sessions.
+
+Sessions that load the same upload share a single parsed frame keyed
+by the upload's content hash. Each session holds a lease with its own
+shallow view of the shared frame, whose fixed-width columns are marked
+read-only so that no session can modify another's data in place. The
+frame is dropped from the registry, and its memory released, when the
+last lease is released or garbage collected with its session.
+"""
+
+import threading
+import weakref
+from dataclasses import dataclass
+from typing import Callable, Dict
+
+import numpy as np
+import pandas as pd
+
+from .cache import result_nbytes
+
+
+def read_only(df: pd.DataFrame) -> pd.DataFrame:
+    """
+    Return a frame sharing ``df``'s data with fixed-width columns read-only.
+
+    In-place writes to numeric, boolean and datetime columns raise
+    ``ValueError``. Object columns are shared as they are, since pandas
+    cannot measure read-only object arrays, and so are extension columns
+    such as categoricals.
+
+    Args:
+        df: Parsed dataset.
+
+    Returns:
+        A new DataFrame over the same column data.
+    """
+
+    columns = {}
+
+    for position, dtype in enumerate(df.dtypes):
+        column = df.iloc[:, position]
+
+        if isinstance(dtype, np.dtype) and dtype != object:
+            values = column.to_numpy()
+            values.flags.writeable = False
+            column = pd.Series(values, index=df.index, name=column.name, copy=False)
+
+        columns[position] = column
+
+    frozen = pd.DataFrame(columns, copy=False)
+    frozen.columns = df.columns
+    frozen.attrs = dict(df.attrs)
+
+    return frozen
+
+
+@dataclass
+class _Shared:
+    """A registered frame and the number of live leases on it."""
+
+    frame: pd.DataFrame
+    nbytes: int
+    refs: int = 0
+
+
+class DatasetLease:
+    """
+    A session's hold on a shared dataset.
+
+    Attributes:
+        key: Content hash of the dataset.
+        frame: Shallow, read-only view of the shared frame.
+    """
+
+    def __init__(
+        self, key: str, frame: pd.DataFrame, release: Callable[[str], None]
+    ) -> None:
+        self.key = key
+        self.frame = frame
+        self._finalizer = weakref.finalize(self, release, key)
+
+    @property
+    def active(self) -> bool:
+        """Whether the lease still holds its dataset."""
+
+        return self._finalizer.alive
+
+    def release(self) -> None:
+        """Release the dataset; later calls have no effect."""
+
+        self._finalizer()
+
+
+class DatasetRegistry:
+    """
+    Thread-safe, reference-counted map from content hash to frame.
+    """
+
+    def __init__(self) -> None:
+        self._entries: Dict[str, _Shared] = {}
+        self._loading: Dict[str, threading.Lock] = {}
+        self._lock = threading.Lock()
+
+    def __contains__(self, key: object) -> bool:
+        return key in self._entries
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    @property
+    def nbytes(self) -> int:
+        """Estimated total size of the registered frames in bytes."""
+
+        with self._lock:
+            return sum(entry.nbytes for entry in self._entries.values())
+
+    def refs(self, key: str) -> int:
+        """
+        Return the number of live leases on a dataset.
+
+        Args:
+            key: Content hash of the dataset.
+
+        Returns:
+            The lease count, 0 if the dataset is not registered.
+        """
+
+        with self._lock:
+            entry = self._entries.get(key)
+            return entry.refs if entry is not None else 0
+
+    def acquire(self, key: str, load: Callable[[], pd.DataFrame]) -> DatasetLease:
+        """
+        Lease a dataset, loading it if no session holds it yet.
+
+        Concurrent first requests for the same key load it only once.
+
+        Args:
+            key: Content hash of the dataset.
+            load: Callable that parses the dataset.
+
+        Returns:
+            A lease whose ``frame`` is a read-only view of the dataset.
+        """
+
+        with self._lock:
+            loading = self._loading.setdefault(key, threading.Lock())
+
+        with loading:
+            with self._lock:
+                entry = self._entries.get(key)
+
+            if entry is None:
+                frame = read_only(load())
+                entry = _Shared(frame=frame, nbytes=result_nbytes(frame))
+
+            with self._lock:
+                entry = self._entries.setdefault(key, entry)
+                entry.refs += 1
+                self._loading.pop(key, None)
+
+        return DatasetLease(key, entry.frame.copy(deep=False), self._release)
+
+    def _release(self, key: str) -> None:
+        """Drop one lease on a dataset, unregistering it at zero."""
+
+        with self._lock:
+            entry = self._entries.get(key)
+
+            if entry is None:
+                return
+
+            entry.refs -= 1
+
+            if entry.refs <= 0:
+                del self._entries[key]
+
+
+DATASETS = DatasetRegistry()
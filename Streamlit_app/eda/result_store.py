@@ -0,0 +1,282 @@
+"""
+Memory-budgeted storage of a session's analysis results.
+
+This module keeps the results shown in a session under a memory budget.
+When the budget is exceeded, the least recently used result frames are
+spilled to compressed Arrow IPC files in a per-session directory and
+reloaded on access. Every store reports its in-memory and on-disk
+footprint, and the process-wide total is available for capacity
+planning.
+"""
+
+import logging
+import shutil
+import tempfile
+import threading
+import weakref
+from collections import OrderedDict
+from pathlib import Path
+from typing import Dict, Iterator, List, Optional
+
+import pyarrow as pa  # type: ignore[import-not-found]
+
+from .cache import result_nbytes
+from .config import RESULT_SPILL_DIR, RESULT_STORE_MB
+from .types import AnalysisMetrics, ResultInfo, ResultItem
+
+logger = logging.getLogger(__name__)
+
+SPILL_COMPRESSION = "zstd"
+
+_STORES: "weakref.WeakSet[ResultStore]" = weakref.WeakSet()
+
+
+def total_nbytes() -> int:
+    """
+    Return the in-memory size of the results of every live session.
+
+    Returns:
+        The sum of `ResultStore.nbytes` over all stores in the process.
+    """
+
+    return sum(store.nbytes for store in list(_STORES))
+
+
+class ResultStore:
+    """
+    Ordered collection of results under a per-session memory budget.
+
+    Results are addressed by id. Metadata stays in memory, while result
+    frames beyond the budget are spilled to disk least-recently-used
+    first. Text results are small and never spilled.
+
+    Attributes:
+        max_bytes: Memory budget for resident result frames.
+        spill_dir: Directory holding spilled results, created lazily.
+    """
+
+    def __init__(
+        self,
+        max_bytes: int = RESULT_STORE_MB * 1024**2,
+        spill_root: Optional[str] = RESULT_SPILL_DIR,
+    ) -> None:
+        self.max_bytes = max_bytes
+        self.spill_dir: Optional[Path] = None
+        self._spill_root = spill_root
+        self._info: "OrderedDict[str, ResultInfo]" = OrderedDict()
+        self._resident: "OrderedDict[str, ResultItem]" = OrderedDict()
+        self._nbytes = 0
+        self._lock = threading.RLock()
+
+        _STORES.add(self)
+
+    @property
+    def nbytes(self) -> int:
+        """Estimated size of the resident results in bytes."""
+
+        return self._nbytes
+
+    @property
+    def disk_bytes(self) -> int:
+        """Size of the spill files, including reloaded results, in bytes."""
+
+        if self.spill_dir is None:
+            return 0
+
+        return sum(path.stat().st_size for path in self.spill_dir.iterdir())
+
+    def __len__(self) -> int:
+        return len(self._info)
+
+    def __iter__(self) -> Iterator[ResultInfo]:
+        """Yield result metadata in insertion order without loading data."""
+
+        with self._lock:
+            return iter([info.copy() for info in self._info.values()])
+
+    def __contains__(self, result_id: object) -> bool:
+        return result_id in self._info
+
+    def _path(self, result_id: str) -> Path:
+        """Return the spill file of a result, creating the directory."""
+
+        if self.spill_dir is None:
+            self.spill_dir = Path(
+                tempfile.mkdtemp(prefix="eda-results-", dir=self._spill_root)
+            )
+            weakref.finalize(self, shutil.rmtree, self.spill_dir, ignore_errors=True)
+
+        return self.spill_dir / f"{result_id}.arrow"
+
+    def _spill(self, result_id: str) -> bool:
+        """
+        Write a resident result frame to disk and drop it from memory.
+
+        The file is kept after the result is reloaded, so a result that
+        is spilled again is not rewritten.
+
+        Args:
+            result_id: Identifier of a resident result.
+
+        Returns:
+            ``True`` if the result was spilled, ``False`` if it cannot be
+            stored as Arrow and was kept in memory.
+        """
+
+        item = self._resident[result_id]
+        df = item["df"]
+
+        if isinstance(df, str):
+            return False
+
+        path = self._path(result_id)
+
+        try:
+            if not path.exists():
+                table = pa.Table.from_pandas(df, preserve_index=True)
+                options = pa.ipc.IpcWriteOptions(compression=SPILL_COMPRESSION)
+
+                with pa.OSFile(str(path), "wb") as sink:
+                    with pa.ipc.new_file(sink, table.schema, options=options) as out:
+                        out.write_table(table)
+        except (pa.ArrowException, TypeError, ValueError) as error:
+            logger.warning("Keeping result %s in memory: %s", result_id, error)
+            path.unlink(missing_ok=True)
+            return False
+
+        del self._resident[result_id]
+        self._nbytes -= self._info[result_id]["nbytes"]
+        self._info[result_id]["spilled"] = True
+
+        return True
+
+    def _fit(self, keep: Optional[str] = None) -> None:
+        """Spill least recently used frames until within the budget."""
+
+        for result_id in list(self._resident):
+            if self._nbytes <= self.max_bytes:
+                return
+
+            if result_id != keep:
+                self._spill(result_id)
+
+    def append(
+        self, item: ResultItem, metrics: Optional[AnalysisMetrics] = None
+    ) -> None:
+        """
+        Add a result, spilling older ones if the budget is exceeded.
+
+        Args:
+            item: Result to store; its id must be unique in the store.
+            metrics: Resource usage of the call that produced the result.
+        """
+
+        with self._lock:
+            size = result_nbytes(item["df"])
+
+            self._info[item["id"]] = {
+                "id": item["id"],
+                "title": item["title"],
+                "nbytes": size,
+                "spilled": False,
+                "metrics": metrics,
+            }
+            self._resident[item["id"]] = item
+            self._nbytes += size
+
+            self._fit(keep=item["id"])
+
+    def get(self, result_id: str) -> ResultItem:
+        """
+        Return a result, reloading it from disk if it was spilled.
+
+        Args:
+            result_id: Identifier of the result.
+
+        Returns:
+            The stored result.
+
+        Raises:
+            KeyError: If no result has the given id.
+        """
+
+        with self._lock:
+            info = self._info[result_id]
+
+            if result_id in self._resident:
+                self._resident.move_to_end(result_id)
+                return self._resident[result_id]
+
+            with pa.memory_map(str(self._path(result_id)), "r") as source:
+                df = pa.ipc.open_file(source).read_all().to_pandas()
+
+            item: ResultItem = {"id": result_id, "title": info["title"], "df": df}
+
+            self._resident[result_id] = item
+            self._nbytes += info["nbytes"]
+            info["spilled"] = False
+
+            self._fit(keep=result_id)
+
+            return item
+
+    def items(self, result_ids: List[str]) -> List[ResultItem]:
+        """
+        Return several results, in the given order.
+
+        Args:
+            result_ids: Identifiers of the results.
+
+        Returns:
+            The stored results.
+        """
+
+        return [self.get(result_id) for result_id in result_ids]
+
+    def remove(self, result_id: str) -> None:
+        """
+        Delete a result from memory and disk.
+
+        Args:
+            result_id: Identifier of the result.
+        """
+
+        with self._lock:
+            info = self._info.pop(result_id, None)
+
+            if info is None:
+                return
+
+            if self._resident.pop(result_id, None) is not None:
+                self._nbytes -= info["nbytes"]
+
+            if self.spill_dir is not None:
+                self._path(result_id).unlink(missing_ok=True)
+
+    def clear(self) -> None:
+        """Delete all results."""
+
+        with self._lock:
+            for result_id in list(self._info):
+                self.remove(result_id)
+
+    def stats(self) -> Dict[str, int]:
+        """
+        Return memory accounting figures for the store.
+
+        Returns:
+            A mapping with the result count, resident and spilled result
+            counts, resident bytes, on-disk bytes and the budget.
+        """
+
+        with self._lock:
+            resident = len(self._resident)
+
+            return {
+                "results": len(self._info),
+                "resident": resident,
+                "spilled": len(self._info) - resident,
+                "memory_bytes": self._nbytes,
+                "disk_bytes": self.disk_bytes,
+                "max_bytes": self.max_bytes,
+            }
@@ -0,0 +1,262 @@
+"""
+Row sampling and confidence intervals for quick EDA estimates.
+
+This module draws a bounded random sample from any supported dataset in
+time independent of its size, so analyses can report estimates within a
+second while exact results are computed in the background:
+
+- In-memory frames and cached uploads are sampled uniformly by row.
+- CSV text is sampled by seeking: the file is split into equal byte
+  strata and the first row starting after a random offset in each
+  stratum is read. Rows are therefore spread evenly over the file, with
+  a slight bias towards rows that follow long lines.
+
+Helpers for normal and Wilson score intervals with a finite population
+correction are provided for analyses that report confidence bounds.
+"""
+
+import io
+import math
+import os
+from dataclasses import dataclass
+from statistics import NormalDist
+from typing import Any, List, Optional, Tuple, Union
+
+import numpy as np
+import pandas as pd
+import pyarrow as pa  # type: ignore[import-not-found]
+
+from .config import SAMPLE_CONFIDENCE, SAMPLE_ROWS
+from .dataset_cache import DATASET_CACHE
+from .ingest import ChunkedFrame, reopen
+from .loader import UploadSource
+
+
+@dataclass
+class Sample:
+    """
+    Rows sampled from a dataset.
+
+    Attributes:
+        frame: The sampled rows.
+        population_rows: Number of rows in the dataset, estimated from the
+            mean sampled line length for CSV text.
+        exact: Whether ``frame`` holds every row of the dataset.
+    """
+
+    frame: pd.DataFrame
+    population_rows: int
+    exact: bool
+
+
+def z_score(confidence: float = SAMPLE_CONFIDENCE) -> float:
+    """Return the two-sided standard normal quantile for a confidence level."""
+
+    return NormalDist().inv_cdf((1 + confidence) / 2)
+
+
+def fpc(sample_rows: int, population_rows: int) -> float:
+    """
+    Return the finite population correction factor for a standard error.
+
+    Args:
+        sample_rows: Number of sampled rows.
+        population_rows: Number of rows in the dataset.
+
+    Returns:
+        A factor in ``[0, 1]`` that is 0 when every row was sampled.
+    """
+
+    if population_rows <= 1:
+        return 0.0
+
+    return math.sqrt(max(population_rows - sample_rows, 0) / (population_rows - 1))
+
+
+def wilson_interval(
+    proportion: pd.Series,
+    sample_rows: int,
+    population_rows: int,
+    confidence: float = SAMPLE_CONFIDENCE,
+) -> Tuple[pd.Series, pd.Series]:
+    """
+    Return Wilson score intervals for sampled proportions.
+
+    The finite population correction is applied through the effective
+    sample size, so the interval vanishes when the sample is the whole
+    dataset.
+
+    Args:
+        proportion: Observed proportions, one per column.
+        sample_rows: Number of sampled rows.
+        population_rows: Number of rows in the dataset.
+        confidence: Confidence level of the interval.
+
+    Returns:
+        The lower and upper bounds, clipped to ``[0, 1]`` and always
+        containing the observed proportion.
+    """
+
+    if sample_rows == 0:
+        return proportion * 0, proportion * 0 + 1
+
+    correction = fpc(sample_rows, population_rows)
+
+    if correction == 0:
+        return proportion, proportion
+
+    z = z_score(confidence)
+    n = sample_rows / correction**2
+    centre = (proportion + z**2 / (2 * n)) / (1 + z**2 / n)
+    spread = z * np.sqrt(proportion * (1 - proportion) / n + z**2 / (4 * n**2))
+    spread = spread / (1 + z**2 / n)
+
+    low = np.minimum(centre - spread, proportion).clip(0, 1)
+    high = np.maximum(centre + spread, proportion).clip(0, 1)
+
+    return low, high
+
+
+def _take(frame_rows: int, rows: int, rng: np.random.Generator) -> np.ndarray:
+    """Return sorted, distinct row positions for a uniform sample."""
+
+    return np.sort(rng.choice(frame_rows, size=rows, replace=False))
+
+
+def sample_frame(df: pd.DataFrame, rows: int, rng: np.random.Generator) -> Sample:
+    """
+    Sample rows of an in-memory DataFrame uniformly.
+
+    Args:
+        df: Input DataFrame.
+        rows: Maximum number of rows to draw.
+        rng: Random number generator.
+
+    Returns:
+        The sample, in row order.
+    """
+
+    if len(df) <= rows:
+        return Sample(frame=df, population_rows=len(df), exact=True)
+
+    frame = df.iloc[_take(len(df), rows, rng)]
+
+    return Sample(frame=frame, population_rows=len(df), exact=False)
+
+
+def sample_cached(key: str, rows: int, rng: np.random.Generator) -> Optional[Sample]:
+    """
+    Sample rows of a cached upload uniformly through a memory map.
+
+    Args:
+        key: Content hash of the upload.
+        rows: Maximum number of rows to draw.
+        rng: Random number generator.
+
+    Returns:
+        The sample, or ``None`` if the upload is not cached.
+    """
+
+    try:
+        with pa.memory_map(str(DATASET_CACHE.path(key)), "r") as source:
+            table = pa.ipc.open_file(source).read_all()
+    except (OSError, pa.ArrowException):
+        return None
+
+    if table.num_rows <= rows:
+        return Sample(table.to_pandas(), population_rows=table.num_rows, exact=True)
+
+    frame = table.take(_take(table.num_rows, rows, rng)).to_pandas()
+
+    return Sample(frame=frame, population_rows=table.num_rows, exact=False)
+
+
+def sample_csv(source: Any, rows: int, rng: np.random.Generator) -> Sample:
+    """
+    Sample rows of CSV text by seeking to random offsets.
+
+    Files with at most ``rows`` data rows are read whole. Quoted fields
+    spanning several lines may be split by a seek; rows that then fail
+    to parse are skipped.
+
+    Args:
+        source: File path or seekable binary file-like object.
+        rows: Number of rows to draw.
+        rng: Random number generator.
+
+    Returns:
+        The sample, in file order.
+    """
+
+    if isinstance(source, (str, os.PathLike)):
+        with open(source, "rb") as handle:
+            return sample_csv(handle, rows, rng)
+
+    size = source.seek(0, io.SEEK_END)
+
+    source.seek(0)
+    header = source.readline()
+    start = source.tell()
+
+    lines: List[bytes] = []
+
+    for line in iter(source.readline, b""):
+        lines.append(line)
+        if len(lines) > rows:
+            break
+    else:
+        frame = pd.read_csv(io.BytesIO(header + b"".join(lines)))
+        return Sample(frame=frame, population_rows=len(frame), exact=True)
+
+    width = (size - start) / rows
+    offsets = start + (np.arange(rows) + rng.random(rows)) * width
+    lines = []
+
+    for offset in offsets.astype(np.int64):
+        source.seek(int(offset) - 1)
+        source.readline()
+        line = source.readline()
+        if line:
+            lines.append(line if line.endswith(b"\n") else line + b"\n")
+
+    frame = pd.read_csv(io.BytesIO(header + b"".join(lines)), on_bad_lines="skip")
+    line_bytes = sum(map(len, lines)) / max(len(lines), 1)
+    population = max(int(round((size - start) / line_bytes)), len(frame))
+
+    return Sample(frame=frame, population_rows=population, exact=False)
+
+
+def draw_sample(
+    data: Union[pd.DataFrame, ChunkedFrame, UploadSource],
+    rows: int = SAMPLE_ROWS,
+    seed: Optional[int] = None,
+) -> Sample:
+    """
+    Draw a bounded random sample from a dataset without scanning it.
+
+    Args:
+        data: Input DataFrame, lazily loaded upload or chunked CSV stream.
+        rows: Maximum number of rows to draw.
+        seed: Optional seed for reproducible samples.
+
+    Returns:
+        The sampled rows and the dataset's row count.
+    """
+
+    rng = np.random.default_rng(seed)
+
+    if isinstance(data, pd.DataFrame):
+        return sample_frame(data, rows, rng)
+
+    if isinstance(data, ChunkedFrame):
+        return sample_csv(reopen(data.source), rows, rng)
+
+    if data.loaded:
+        return sample_frame(data.frame(), rows, rng)
+
+    sample = sample_cached(data.key, rows, rng)
+
+    if sample is None:
+        sample = sample_csv(reopen(data.uploaded_file), rows, rng)
+
+    return sample
@@ -2,37 +2,41 @@
 Streamlit utilities for exporting EDA analysis results.
 
 This module provides a helper function to render a save dialog
-and export selected EDA analysis results as a PDF file.
+and export selected EDA analysis results as a PDF report or in one of
+the registered tabular formats.
 """
 
 from types import ModuleType
-from typing import Optional, Sequence
-
-from eda.types import ResultItem
+from typing import List, Optional
 
 from .downloader import generate_pdf
+from .exporters import EXPORTERS, export_results
+from .result_store import ResultStore
+
+PDF_FORMAT = "pdf"
 
 
 def saver(
     st: ModuleType,
-    results: Optional[Sequence[ResultItem]] | None = None,
+    results: Optional[ResultStore] = None,
 ) -> None:
     """
     Render a dialog for exporting selected EDA analysis results.
 
     Args:
         st: Streamlit module instance used to render UI components.
-        results: Optional list of analysis result dictionaries. Each dictionary
-            must contain at least ``"id"`` and ``"title"`` keys.
+        results: Optional result store of the session. Only the selected
+            results are loaded, when the export is confirmed.
 
     Side Effects:
         - Initializes and mutates entries in ``st.session_state``.
         - Displays a modal dialog for selecting and exporting results.
-        - Triggers PDF generation and download when confirmed.
+        - Triggers PDF generation or a tabular export and its download
+          when confirmed.
     """
 
     if results is None:
-        results = []
+        results = ResultStore()
 
     if "open_save" not in st.session_state:
         st.session_state["open_save"] = False
@@ -55,18 +59,32 @@ def saver(
 
         st.write("Select results to export:")
 
-        selected_results = []
-        for item in results:
-            if st.checkbox(item["title"], key=f"chk_{item['id']}"):
-                selected_results.append(item)  # type: ignore[arg-type]
+        selected_ids: List[str] = []
+        for info in results:
+            if st.checkbox(info["title"], key=f"chk_{info['id']}"):
+                selected_ids.append(info["id"])
 
-        st.session_state.selected = selected_results
+        st.session_state.selected = selected_ids
+
+        formats = {PDF_FORMAT: "PDF report"}
+        formats.update(
+            {name: cls.label for name, cls in EXPORTERS.items() if cls.available()}
+        )
 
-        st.session_state.protect = st.checkbox(
-            "Protect PDF with password",
-            value=st.session_state.protect,
+        export_format = st.selectbox(
+            "Format",
+            options=list(formats),
+            format_func=formats.__getitem__,
         )
 
+        if export_format == PDF_FORMAT:
+            st.session_state.protect = st.checkbox(
+                "Protect PDF with password",
+                value=st.session_state.protect,
+            )
+        else:
+            st.session_state.protect = False
+
         if st.session_state.protect:
             st.session_state.password = st.text_input("Password", type="password")
             st.session_state.confirm_password = st.text_input(
@@ -76,7 +94,7 @@ def saver(
             st.session_state.password = ""
             st.session_state.confirm_password = ""
 
-        if st.button("Generate PDF"):
+        if st.button("Export"):
             if not st.session_state.selected:  # type: ignore
                 st.error("Select at least one result")
                 return
@@ -88,12 +106,21 @@ def saver(
                 st.error("Passwords do not match")
                 return
 
-            generate_pdf(
-                results=st.session_state.selected,  # type: ignore[arg-type]
-                password=str(st.session_state.password),
-                protect=st.session_state.protect,
-                st=st,
-            )
+            selected = results.items(st.session_state.selected)
+
+            if export_format == PDF_FORMAT:
+                generate_pdf(
+                    results=selected,  # type: ignore[arg-type]
+                    password=str(st.session_state.password),
+                    protect=st.session_state.protect,
+                    st=st,
+                )
+            else:
+                export_results(
+                    results=selected,  # type: ignore[arg-type]
+                    exporter=export_format,
+                    st=st,
+                )
 
             st.session_state.open_save = False
 
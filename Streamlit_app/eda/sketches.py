@@ -0,0 +1,434 @@
+"""
+Mergeable probabilistic sketches for approximate EDA statistics.
+
+This module provides fixed-memory summaries that can be updated chunk
+by chunk and merged across partitions:
+
+- ``HyperLogLog`` estimates the number of distinct values.
+- ``SpaceSaving`` tracks the most frequent values with per-item bounds.
+- ``KLLSketch`` estimates quantiles within a bounded rank error.
+"""
+
+import math
+from typing import List, Optional, Sequence
+
+import numpy as np
+import pandas as pd
+
+from .config import HLL_PRECISION, TOPK_CAPACITY
+
+
+def hash_values(values: pd.Series) -> np.ndarray:
+    """
+    Hash the non-null values of a Series to 64-bit integers.
+
+    Numeric values are hashed as ``float64`` so that a column parsed as
+    integers in one chunk and as floats in another hashes consistently.
+
+    Args:
+        values: Input Series.
+
+    Returns:
+        A ``uint64`` array with one hash per non-null value.
+    """
+
+    values = values.dropna()
+
+    if pd.api.types.is_numeric_dtype(values) and not pd.api.types.is_bool_dtype(values):
+        array = values.to_numpy(dtype="float64")
+    else:
+        array = values.to_numpy(dtype="object")
+
+    return pd.util.hash_array(array)
+
+
+def bit_length(x: np.ndarray) -> np.ndarray:
+    """
+    Return the bit length of each element of a ``uint64`` array.
+
+    Args:
+        x: Array of unsigned 64-bit integers.
+
+    Returns:
+        An ``int64`` array where 0 maps to 0 and ``2**k`` to ``k + 1``.
+    """
+
+    x = x.astype(np.uint64, copy=True)
+    length = np.zeros(x.shape, dtype=np.int64)
+
+    for shift in (32, 16, 8, 4, 2, 1):
+        high = x >= np.uint64(1 << shift)
+        length[high] += shift
+        x[high] >>= np.uint64(shift)
+
+    return length + (x > 0)
+
+
+class HyperLogLog:
+    """
+    HyperLogLog distinct-count sketch.
+
+    Uses ``2 ** precision`` one-byte registers regardless of the number
+    of values added. The relative standard error of the estimate is
+    ``1.04 / sqrt(2 ** precision)``.
+
+    Attributes:
+        precision: Number of hash bits used to select a register.
+        registers: Maximum observed rank per register.
+    """
+
+    def __init__(self, precision: int = HLL_PRECISION) -> None:
+        if not 4 <= precision <= 18:
+            raise ValueError("precision must be between 4 and 18")
+
+        self.precision = precision
+        self.registers = np.zeros(1 << precision, dtype=np.uint8)
+
+    @property
+    def relative_error(self) -> float:
+        """Relative standard error of `estimate`."""
+
+        return 1.04 / np.sqrt(len(self.registers))
+
+    def add_hashes(self, hashes: np.ndarray) -> None:
+        """
+        Add pre-computed 64-bit hashes to the sketch.
+
+        Args:
+            hashes: ``uint64`` hash values.
+        """
+
+        if not len(hashes):
+            return
+
+        suffix_bits = 64 - self.precision
+        index = (hashes >> np.uint64(suffix_bits)).astype(np.intp)
+        suffix = hashes & np.uint64((1 << suffix_bits) - 1)
+        rank = (suffix_bits - bit_length(suffix) + 1).astype(np.uint8)
+
+        np.maximum.at(self.registers, index, rank)
+
+    def update(self, values: pd.Series) -> None:
+        """
+        Add the non-null values of a Series to the sketch.
+
+        Args:
+            values: Input Series.
+        """
+
+        self.add_hashes(hash_values(values))
+
+    def merge(self, other: "HyperLogLog") -> "HyperLogLog":
+        """
+        Return a sketch covering the values of both sketches.
+
+        Args:
+            other: Sketch with the same precision.
+
+        Returns:
+            A new merged sketch.
+
+        Raises:
+            ValueError: If the precisions differ.
+        """
+
+        if other.precision != self.precision:
+            raise ValueError("cannot merge sketches with different precision")
+
+        merged = HyperLogLog(self.precision)
+        merged.registers = np.maximum(self.registers, other.registers)
+
+        return merged
+
+    def estimate(self) -> float:
+        """
+        Estimate the number of distinct values added.
+
+        Returns:
+            The cardinality estimate, using linear counting for small
+            cardinalities.
+        """
+
+        m = len(self.registers)
+        alpha = 0.7213 / (1 + 1.079 / m)
+        raw = alpha * m * m / np.sum(np.ldexp(1.0, -self.registers.astype(np.int64)))
+        zeros = int(np.count_nonzero(self.registers == 0))
+
+        if raw <= 2.5 * m and zeros:
+            return m * np.log(m / zeros)
+
+        return float(raw)
+
+
+class SpaceSaving:
+    """
+    Mergeable Space-Saving heavy-hitter summary.
+
+    Keeps at most ``capacity`` counters. Every reported count is an
+    upper bound on the true frequency that overestimates it by at most
+    the item's ``error``. Any value that is not tracked occurs at most
+    ``floor`` times, and no error exceeds ``floor``.
+
+    Attributes:
+        capacity: Maximum number of tracked values.
+        counts: Estimated frequency per tracked value.
+        errors: Maximum overestimate per tracked value.
+        floor: Upper bound on the frequency of untracked values.
+        total: Number of values summarised.
+    """
+
+    def __init__(self, capacity: int = TOPK_CAPACITY) -> None:
+        if capacity < 1:
+            raise ValueError("capacity must be a positive integer")
+
+        self.capacity = capacity
+        self.counts = pd.Series(dtype="int64")
+        self.errors = pd.Series(dtype="int64")
+        self.floor = 0
+        self.total = 0
+
+    @property
+    def error_bound(self) -> int:
+        """Worst-case overestimate of any reported count."""
+
+        return self.floor
+
+    @classmethod
+    def from_counts(
+        cls, counts: pd.Series, capacity: int = TOPK_CAPACITY
+    ) -> "SpaceSaving":
+        """
+        Build a summary from exact counts, keeping the largest ones.
+
+        Args:
+            counts: Exact frequency per value.
+            capacity: Maximum number of tracked values.
+
+        Returns:
+            A summary of ``counts``.
+        """
+
+        summary = cls(capacity)
+        ordered = counts.astype("int64").sort_values(ascending=False, kind="stable")
+
+        summary.counts = ordered.iloc[:capacity]
+        summary.errors = pd.Series(0, index=summary.counts.index, dtype="int64")
+        summary.floor = int(ordered.iloc[capacity]) if len(ordered) > capacity else 0
+        summary.total = int(ordered.sum())
+
+        return summary
+
+    def update(self, values: pd.Series) -> None:
+        """
+        Add the non-null values of a Series to the summary.
+
+        The batch is counted exactly and then merged, so temporary memory
+        is bounded by the batch rather than the whole dataset.
+
+        Args:
+            values: Input Series.
+        """
+
+        batch = SpaceSaving.from_counts(values.value_counts(), self.capacity)
+        merged = self.merge(batch)
+
+        self.counts, self.errors = merged.counts, merged.errors
+        self.floor, self.total = merged.floor, merged.total
+
+    def merge(self, other: "SpaceSaving") -> "SpaceSaving":
+        """
+        Return a summary covering the values of both summaries.
+
+        Args:
+            other: Summary to merge with.
+
+        Returns:
+            A new merged summary with the smaller of the two capacities.
+        """
+
+        index = self.counts.index.append(
+            other.counts.index.difference(self.counts.index, sort=False)
+        )
+
+        left_counts = self.counts.reindex(index, fill_value=self.floor)
+        right_counts = other.counts.reindex(index, fill_value=other.floor)
+        left_errors = self.errors.reindex(index, fill_value=self.floor)
+        right_errors = other.errors.reindex(index, fill_value=other.floor)
+
+        counts = left_counts + right_counts
+        errors = left_errors + right_errors
+
+        capacity = min(self.capacity, other.capacity)
+        ordered = counts.sort_values(ascending=False, kind="stable")
+        kept = ordered.index[:capacity]
+        dropped = int(ordered.iloc[capacity]) if len(ordered) > capacity else 0
+
+        merged = SpaceSaving(capacity)
+        merged.counts = counts.loc[kept].astype("int64")
+        merged.errors = errors.loc[kept].astype("int64")
+        merged.floor = max(self.floor + other.floor, dropped)
+        merged.total = self.total + other.total
+
+        return merged
+
+
+def kll_k_for_error(rank_error: float) -> int:
+    """
+    Return the KLL accuracy parameter for a target normalised rank error.
+
+    Uses the empirical relation ``rank_error ~ 3.3 / k`` at roughly 99%
+    confidence reported for KLL sketches.
+
+    Args:
+        rank_error: Target rank error as a fraction of the item count.
+
+    Returns:
+        The accuracy parameter ``k``.
+
+    Raises:
+        ValueError: If ``rank_error`` is not in ``(0, 1)``.
+    """
+
+    if not 0 < rank_error < 1:
+        raise ValueError("rank_error must be between 0 and 1")
+
+    return max(8, math.ceil(3.3 / rank_error))
+
+
+class KLLSketch:
+    """
+    Mergeable KLL quantile sketch.
+
+    Values are kept in a hierarchy of compactors where an item at level
+    ``h`` stands for ``2 ** h`` input values. Compactor capacities shrink
+    geometrically with depth, so memory is ``O(k)`` regardless of the
+    number of values, and quantiles are exact while fewer than ``k``
+    values have been added.
+
+    Attributes:
+        k: Accuracy parameter; the top compactor holds ``k`` items.
+        n: Number of values summarised.
+        levels: Compactor buffers, from weight 1 upwards.
+    """
+
+    DECAY = 2 / 3
+
+    def __init__(self, k: int = 200, seed: Optional[int] = 0) -> None:
+        if k < 2:
+            raise ValueError("k must be at least 2")
+
+        self.k = k
+        self.n = 0
+        self.levels: List[np.ndarray] = [np.empty(0)]
+        self._rng = np.random.default_rng(seed)
+
+    @property
+    def size(self) -> int:
+        """Number of items currently retained."""
+
+        return sum(len(level) for level in self.levels)
+
+    def _capacity(self, level: int) -> int:
+        depth = len(self.levels) - level - 1
+        return max(2, math.ceil(self.k * self.DECAY**depth))
+
+    def _compress(self) -> None:
+        """Compact over-full levels, promoting half their items upwards."""
+
+        level = 0
+        while level < len(self.levels):
+            buffer = self.levels[level]
+
+            if len(buffer) > self._capacity(level):
+                if level + 1 == len(self.levels):
+                    self.levels.append(np.empty(0))
+
+                buffer = np.sort(buffer)
+                keep = buffer[-1:] if len(buffer) % 2 else buffer[:0]
+                pairs = buffer[: len(buffer) - len(keep)]
+                promoted = pairs[self._rng.integers(2) :: 2]
+
+                self.levels[level] = keep
+                self.levels[level + 1] = np.concatenate(
+                    [self.levels[level + 1], promoted]
+                )
+                level = 0
+                continue
+
+            level += 1
+
+    def update(self, values: np.ndarray) -> None:
+        """
+        Add a batch of values, ignoring NaNs.
+
+        Args:
+            values: One-dimensional numeric array.
+        """
+
+        values = np.asarray(values, dtype="float64")
+        values = values[~np.isnan(values)]
+
+        if not len(values):
+            return
+
+        self.levels[0] = np.concatenate([self.levels[0], values])
+        self.n += len(values)
+        self._compress()
+
+    def merge(self, other: "KLLSketch") -> "KLLSketch":
+        """
+        Return a sketch covering the values of both sketches.
+
+        Args:
+            other: Sketch to merge with.
+
+        Returns:
+            A new merged sketch using the larger of the two ``k`` values.
+        """
+
+        merged = KLLSketch(max(self.k, other.k))
+        depth = max(len(self.levels), len(other.levels))
+
+        merged.levels = [
+            np.concatenate(
+                [
+                    self.levels[h] if h < len(self.levels) else np.empty(0),
+                    other.levels[h] if h < len(other.levels) else np.empty(0),
+                ]
+            )
+            for h in range(depth)
+        ]
+        merged.n = self.n + other.n
+        merged._compress()
+
+        return merged
+
+    def quantiles(self, qs: Sequence[float]) -> np.ndarray:
+        """
+        Estimate quantiles of the summarised values.
+
+        Args:
+            qs: Quantile fractions between 0 and 1.
+
+        Returns:
+            An array of estimates, NaN if the sketch is empty. While the
+            sketch is still exact this matches linear interpolation.
+        """
+
+        if not self.n:
+            return np.full(len(qs), np.nan)
+
+        if len(self.levels) == 1:
+            return np.percentile(self.levels[0], [100 * q for q in qs])
+
+        items = np.concatenate(self.levels)
+        weights = np.concatenate(
+            [np.full(len(level), 2**h) for h, level in enumerate(self.levels)]
+        )
+        order = np.argsort(items, kind="stable")
+        items, cumulative = items[order], np.cumsum(weights[order])
+
+        ranks = np.asarray(qs, dtype="float64") * cumulative[-1]
+        positions = np.searchsorted(cumulative, ranks, side="left")
+
+        return items[np.minimum(positions, len(items) - 1)]
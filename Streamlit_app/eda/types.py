@@ -6,7 +6,7 @@ to standardize how analysis results are represented and passed between
 components.
 """
 
-from typing import TypedDict, Union
+from typing import Optional, TypedDict, Union
 
 import pandas as pd
 
@@ -25,3 +25,53 @@ class ResultItem(TypedDict):
     id: str
     title: str
     df: Union[pd.DataFrame, str]
+
+
+class AnalysisMetrics(TypedDict):
+    """
+    Resource usage of a single analysis call.
+
+    Attributes:
+        analysis: Identifier of the analysis.
+        dataset: Content hash of the input, if known.
+        source: How the result was produced: ``"cache"``,
+            ``"incremental"``, ``"profile"``, ``"plan"`` or the name of
+            the engine that computed it.
+        rows: Number of input rows, if known without a scan.
+        columns: Number of input columns, if known.
+        wall_s: Elapsed time in seconds.
+        cpu_s: CPU time of the calling thread in seconds.
+        peak_bytes: Peak memory growth during the call, or ``None`` when
+            memory profiling is disabled or unsupported.
+        error: Error message if the call failed, else ``None``.
+    """
+
+    analysis: str
+    dataset: Optional[str]
+    source: Optional[str]
+    rows: Optional[int]
+    columns: Optional[int]
+    wall_s: float
+    cpu_s: float
+    peak_bytes: Optional[int]
+    error: Optional[str]
+
+
+class ResultInfo(TypedDict):
+    """
+    Metadata of a stored EDA result, available without loading it.
+
+    Attributes:
+        id: Unique identifier for the result.
+        title: Human-readable title describing the result.
+        nbytes: Estimated in-memory size of the result.
+        spilled: Whether the result currently lives on disk.
+        metrics: Resource usage of the call that produced the result, if
+            recorded.
+    """
+
+    id: str
+    title: str
+    nbytes: int
+    spilled: bool
+    metrics: Optional[AnalysisMetrics]
@@ -0,0 +1,6 @@
+"""
+Tests for the EDA package.
+
+Run them with ``python -m pytest`` from the ``Streamlit_app`` directory,
+so that the ``eda`` package is importable.
+"""
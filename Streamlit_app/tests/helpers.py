@@ -0,0 +1,147 @@
+"""
+Shared data and assertions for the EDA tests.
+
+The sample dataset mixes integer, float, string and boolean columns with
+missing values, and is read back from CSV so that in-memory frames have
+the same dtypes as streamed chunks of the same text.
+"""
+
+import io
+from typing import Any, List
+
+import numpy as np
+import pandas as pd
+
+from eda.analysis_base import AnalysisResult
+from eda.ingest import ChunkedFrame
+
+ROWS = 1000
+CHUNK_ROWS = 137
+
+
+def sample_csv(rows: int = ROWS, seed: int = 0) -> bytes:
+    """
+    Generate the CSV text of the sample dataset.
+
+    Args:
+        rows: Number of data rows.
+        seed: Seed of the random generator.
+
+    Returns:
+        UTF-8 encoded CSV text with a header row.
+    """
+
+    rng = np.random.default_rng(seed)
+    data = pd.DataFrame(
+        {
+            "id": np.arange(rows),
+            "x": rng.normal(size=rows),
+            "k": rng.integers(0, 7, rows),
+            "g": rng.choice(list("abc"), rows),
+            "flag": rng.random(rows) < 0.3,
+        }
+    )
+    data.loc[rng.random(rows) < 0.1, "x"] = np.nan
+    data.loc[rng.random(rows) < 0.05, "g"] = None
+
+    return data.to_csv(index=False).encode()
+
+
+def read_frame(csv: bytes) -> pd.DataFrame:
+    """Parse CSV text into an in-memory frame."""
+
+    return pd.read_csv(io.BytesIO(csv))
+
+
+def stream(csv: bytes, chunk_rows: int = CHUNK_ROWS) -> ChunkedFrame:
+    """Return a chunked view over CSV text."""
+
+    return ChunkedFrame(io.BytesIO(csv), chunk_rows=chunk_rows)
+
+
+def split(data: pd.DataFrame, *bounds: int) -> List[pd.DataFrame]:
+    """
+    Split a frame into consecutive row partitions.
+
+    Args:
+        data: Input pandas DataFrame.
+        *bounds: Row positions at which a new partition starts.
+
+    Returns:
+        The partitions in row order.
+    """
+
+    edges = [0, *bounds, len(data)]
+
+    return [data.iloc[start:stop] for start, stop in zip(edges, edges[1:])]
+
+
+def assert_same_result(expected: AnalysisResult, actual: Any) -> None:
+    """
+    Assert that two analysis results agree up to float rounding.
+
+    Args:
+        expected: Reference result.
+        actual: Result of the path under test.
+
+    Raises:
+        AssertionError: If the results differ.
+    """
+
+    if isinstance(expected, pd.DataFrame):
+        assert isinstance(actual, pd.DataFrame)
+        pd.testing.assert_frame_equal(actual, expected, check_dtype=False, rtol=1e-9)
+    else:
+        assert actual == expected
+
+
+def assert_quartiles_within(
+    result: pd.DataFrame, data: pd.DataFrame, rank_error: float
+) -> None:
+    """
+    Assert that sketched quartiles are within a rank error of the truth.
+
+    Args:
+        result: Describe table with ``25%``, ``50%`` and ``75%`` rows.
+        data: Dataset the table describes.
+        rank_error: Allowed normalised rank error.
+
+    Raises:
+        AssertionError: If a quartile's rank is further off than allowed.
+    """
+
+    for column in result.columns:
+        values = np.sort(data[column].dropna().to_numpy(dtype="float64"))
+
+        for label, q in (("25%", 0.25), ("50%", 0.5), ("75%", 0.75)):
+            estimate = result.loc[label, column]
+            low = np.searchsorted(values, estimate, side="left") / len(values)
+            high = np.searchsorted(values, estimate, side="right") / len(values)
+
+            assert low - rank_error <= q <= high + rank_error, (column, label)
+
+
+def assert_same_describe(
+    expected: pd.DataFrame,
+    actual: pd.DataFrame,
+    data: pd.DataFrame,
+    rank_error: float,
+) -> None:
+    """
+    Assert that a sketched describe table matches an exact one.
+
+    Every row but the quartiles must agree up to float rounding.
+
+    Args:
+        expected: Exact describe table.
+        actual: Describe table with sketched quartiles.
+        data: Dataset both tables describe.
+        rank_error: Allowed normalised rank error of the quartiles.
+
+    Raises:
+        AssertionError: If the tables differ.
+    """
+
+    quartiles = ["25%", "50%", "75%"]
+    assert_same_result(expected.drop(quartiles), actual.drop(quartiles))
+    assert_quartiles_within(actual, data, rank_error)
@@ -0,0 +1,43 @@
+"""Tests of the memory-budgeted result cache."""
+
+import pandas as pd
+
+from eda.cache import ResultCache, make_key, result_nbytes
+
+
+def test_keys_distinguish_parameter_types():
+    assert make_key("hash", "value_counts", "1") != make_key("hash", "value_counts", 1)
+
+
+def test_least_recently_used_results_are_evicted():
+    frame = pd.DataFrame({"a": range(100)})
+    cache: ResultCache[pd.DataFrame] = ResultCache(max_bytes=2 * result_nbytes(frame))
+    first, second, third = (make_key(str(i), "head", 5) for i in range(3))
+
+    cache.put(first, frame)
+    cache.put(second, frame)
+    assert cache.get(first) is frame
+
+    cache.put(third, frame)
+
+    assert cache.get(second) is None
+    assert cache.get(first) is frame
+    assert cache.nbytes == 2 * result_nbytes(frame)
+
+
+def test_results_over_budget_are_not_cached():
+    cache: ResultCache[str] = ResultCache(max_bytes=10)
+    cache.put(make_key("hash", "shape", None), "The shape of the DataFrame is (1, 1)")
+
+    assert len(cache) == 0
+    assert cache.nbytes == 0
+
+
+def test_custom_sizes_bound_other_values():
+    cache: ResultCache[bytes] = ResultCache(max_bytes=10, sizeof=len)
+    cache.put(make_key("a", "pdf", None), b"12345")
+    cache.put(make_key("b", "pdf", None), b"123456")
+
+    assert cache.get(make_key("a", "pdf", None)) is None
+    assert cache.get(make_key("b", "pdf", None)) == b"123456"
+    assert cache.nbytes == 6
@@ -0,0 +1,88 @@
+"""Tests of the blocked Pearson and Spearman correlation analyses."""
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from eda.analysis.correlation import PearsonCorrelation, SpearmanCorrelation
+
+from .helpers import assert_same_result, split
+
+ROWS = 2000
+
+
+def wide_frame(columns: int = 11, seed: int = 0) -> pd.DataFrame:
+    """Correlated numeric columns with scattered nulls, plus a text column."""
+
+    rng = np.random.default_rng(seed)
+    base = rng.normal(size=(ROWS, 1))
+    values = base * rng.uniform(-1, 1, columns) + rng.normal(size=(ROWS, columns))
+    values[rng.random(values.shape) < 0.05] = np.nan
+
+    data = pd.DataFrame(values, columns=[f"c{i}" for i in range(columns)])
+    data["label"] = rng.choice(list("xyz"), ROWS)
+
+    return data
+
+
+FRAME = wide_frame()
+NUMERIC = FRAME.drop(columns="label")
+
+
+@pytest.fixture
+def small_blocks(monkeypatch):
+    """Force several column blocks and row slices on the test frame."""
+
+    monkeypatch.setattr("eda.analysis.correlation.CORRELATION_BLOCK_COLUMNS", 3)
+    monkeypatch.setattr("eda.analysis.correlation.SLICE_VALUES", 64)
+
+
+def strongest_pairs(matrix: pd.DataFrame, n: int) -> set:
+    """Return the ``n`` pairs with the largest absolute correlation."""
+
+    stacked = matrix.where(np.triu(np.ones(matrix.shape, dtype=bool), k=1)).stack()
+    top = stacked.abs().sort_values(ascending=False).index[:n]
+
+    return set(top)
+
+
+@pytest.mark.usefixtures("small_blocks")
+def test_blocked_pearson_matches_pandas():
+    assert_same_result(NUMERIC.corr(), PearsonCorrelation.compute(FRAME))
+
+
+@pytest.mark.usefixtures("small_blocks")
+def test_spearman_matches_pandas_without_nulls():
+    complete = FRAME.dropna()
+
+    assert_same_result(
+        complete.drop(columns="label").corr(method="spearman"),
+        SpearmanCorrelation.compute(complete),
+    )
+
+
+@pytest.mark.usefixtures("small_blocks")
+def test_spearman_correlates_ranks_of_whole_columns():
+    assert_same_result(NUMERIC.rank().corr(), SpearmanCorrelation.compute(FRAME))
+
+
+@pytest.mark.usefixtures("small_blocks")
+def test_top_pairs_match_the_full_matrix():
+    pairs = PearsonCorrelation.compute(FRAME, 5)
+    matrix = NUMERIC.corr()
+
+    assert set(zip(pairs["Column 1"], pairs["Column 2"])) == strongest_pairs(matrix, 5)
+    for _, row in pairs.iterrows():
+        first, second = row["Column 1"], row["Column 2"]
+        assert row["Correlation"] == pytest.approx(matrix.loc[first, second])
+        assert row["Observations"] == NUMERIC[[first, second]].notna().all(1).sum()
+
+
+@pytest.mark.parametrize("n", [None, 5])
+def test_streamed_pearson_matches_compute(n):
+    chunks = split(FRAME, 150, 700, 1300)
+
+    assert_same_result(
+        PearsonCorrelation.compute(FRAME, n),
+        PearsonCorrelation.compute_chunks(chunks, n),
+    )
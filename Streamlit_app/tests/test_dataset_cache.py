@@ -0,0 +1,59 @@
+"""Tests of the columnar on-disk cache of parsed uploads."""
+
+import numpy as np
+import pandas as pd
+
+from eda.dataset_cache import DatasetCache
+
+from .helpers import read_frame, sample_csv
+
+FRAME = read_frame(sample_csv())
+
+
+def with_nan_nulls(data: pd.DataFrame) -> pd.DataFrame:
+    """Replace the ``None`` nulls Arrow returns in text columns with NaN."""
+
+    return data.where(data.notna(), np.nan)
+
+
+def test_round_trip_preserves_frame_and_attrs(tmp_path):
+    cache = DatasetCache(str(tmp_path))
+    frame = FRAME.copy()
+    frame.attrs["memory_before"] = {"id": 8000}
+
+    assert cache.write("key", frame)
+    assert "key" in cache
+
+    loaded = cache.read("key")
+    pd.testing.assert_frame_equal(with_nan_nulls(loaded), frame)
+    assert loaded.attrs == frame.attrs
+    pd.testing.assert_series_equal(cache.dtypes("key"), frame.dtypes)
+
+
+def test_read_selects_columns_in_file_order(tmp_path):
+    cache = DatasetCache(str(tmp_path))
+    cache.write("key", FRAME)
+
+    pd.testing.assert_frame_equal(
+        with_nan_nulls(cache.read("key", ["g", "x"])), FRAME[["x", "g"]]
+    )
+
+
+def test_missing_and_unreadable_files_read_as_none(tmp_path):
+    cache = DatasetCache(str(tmp_path))
+    cache.path("broken").write_bytes(b"not arrow")
+
+    assert cache.read("absent") is None
+    assert cache.read("broken") is None
+    assert "broken" not in cache
+
+
+def test_evict_keeps_the_newest_file_within_budget(tmp_path):
+    cache = DatasetCache(str(tmp_path))
+    cache.write("old", FRAME)
+    cache.max_bytes = cache.path("old").stat().st_size
+
+    cache.write("new", FRAME)
+
+    assert "old" not in cache
+    assert "new" in cache
@@ -0,0 +1,89 @@
+"""Tests that every execution engine gives the in-memory result."""
+
+import pytest
+
+from eda.analysis.data_types import DataTypes
+from eda.analysis.head import Head
+from eda.analysis.mean import Mean
+from eda.analysis.missing import Missing
+from eda.analysis.shape import Shape
+from eda.analysis.unique import Unique
+from eda.analysis.value_counts import ValueCounts
+from eda.analysis_base import sql_identifier
+from eda.engines import ChunkedEngine, DuckDBEngine, PandasEngine, choose_engine
+
+from .helpers import assert_same_result, read_frame, sample_csv, stream
+
+CSV = sample_csv()
+FRAME = read_frame(CSV)
+
+ANALYSES = [
+    (Head, 5),
+    (Shape, None),
+    (Mean, None),
+    (Missing, None),
+    (Unique, None),
+    (ValueCounts, "g"),
+    (ValueCounts, "k"),
+]
+
+# Analyses with a SQL form pushed down to DuckDB.
+PUSHED_DOWN = [
+    (Shape, None),
+    (Mean, None),
+    (Missing, None),
+    (ValueCounts, "g"),
+    (ValueCounts, "k"),
+]
+
+requires_duckdb = pytest.mark.skipif(
+    not DuckDBEngine.available(), reason="DuckDB is not installed"
+)
+
+
+@pytest.mark.parametrize("engine", [PandasEngine, ChunkedEngine])
+@pytest.mark.parametrize("analysis_cls, n", ANALYSES)
+def test_pandas_engines_match_compute(engine, analysis_cls, n):
+    expected = analysis_cls.compute(FRAME, n)
+
+    assert_same_result(expected, engine.run(analysis_cls, FRAME, n))
+    assert_same_result(expected, engine.run(analysis_cls, stream(CSV), n))
+
+
+@requires_duckdb
+@pytest.mark.parametrize("analysis_cls, n", PUSHED_DOWN)
+def test_compute_relation_matches_compute(analysis_cls, n):
+    import duckdb  # type: ignore[import-not-found]
+
+    columns = analysis_cls.required_columns(FRAME.dtypes, n)
+
+    with duckdb.connect() as connection:
+        relation = connection.from_df(FRAME)
+        if columns:
+            relation = relation.project(", ".join(map(sql_identifier, columns)))
+        result = analysis_cls.compute_relation(relation, n)
+
+    assert result is not None
+    assert_same_result(analysis_cls.compute(FRAME, n), result)
+
+
+@requires_duckdb
+@pytest.mark.parametrize("analysis_cls, n", ANALYSES)
+def test_duckdb_engine_matches_compute_on_csv(analysis_cls, n):
+    expected = analysis_cls.compute(FRAME, n)
+
+    assert_same_result(expected, DuckDBEngine.run(analysis_cls, stream(CSV), n))
+
+
+def test_choose_engine_streams_chunks_and_keeps_frames_in_pandas(monkeypatch):
+    monkeypatch.setattr("eda.engines.ENGINE", "auto")
+
+    assert choose_engine(stream(CSV)) is ChunkedEngine
+    assert choose_engine(FRAME) is PandasEngine
+
+
+@requires_duckdb
+def test_duckdb_engine_falls_back_for_analyses_without_sql_form():
+    expected = DataTypes.compute(FRAME)
+
+    assert_same_result(expected, DuckDBEngine.run(DataTypes, FRAME, None))
@@ -0,0 +1,61 @@
+"""Tests that exported result tables read back unchanged."""
+
+import gzip
+import io
+import zipfile
+
+import pandas as pd
+
+from eda.analysis.describe import Describe
+from eda.analysis.value_counts import ValueCounts
+from eda.exporters import CsvGzExporter, ParquetExporter, batches
+
+from .helpers import read_frame, sample_csv
+
+FRAME = read_frame(sample_csv())
+COUNTS = ValueCounts.compute(FRAME, "g")
+STATS = Describe.compute(FRAME)
+
+
+def export(exporter, results) -> bytes:
+    """Write results with an exporter and return the file contents."""
+
+    output = io.BytesIO()
+    exporter.write(results, output)
+
+    return output.getvalue()
+
+
+def test_batches_cover_the_table_once():
+    parts = list(batches(FRAME, rows=137))
+
+    assert all(len(part) <= 137 for part in parts)
+    pd.testing.assert_frame_equal(pd.concat(parts, ignore_index=True), FRAME)
+
+
+def test_parquet_round_trip():
+    data = export(ParquetExporter, [{"title": "Counts", "df": COUNTS}])
+    loaded = pd.read_parquet(io.BytesIO(data))
+
+    pd.testing.assert_frame_equal(loaded, COUNTS, check_dtype=False)
+
+
+def test_csv_round_trip_keeps_label_index():
+    data = export(CsvGzExporter, [{"title": "Describe", "df": STATS}])
+    loaded = pd.read_csv(io.BytesIO(gzip.decompress(data)), index_col="index")
+
+    pd.testing.assert_frame_equal(loaded.rename_axis(None), STATS)
+
+
+def test_several_results_are_zipped_one_member_each():
+    results = [
+        {"title": "Counts", "df": COUNTS},
+        {"title": "Shape", "df": "The shape of the DataFrame is (1000, 5)"},
+    ]
+
+    with zipfile.ZipFile(io.BytesIO(export(ParquetExporter, results))) as archive:
+        names = archive.namelist()
+        shape = pd.read_parquet(io.BytesIO(archive.read(names[1])))
+
+    assert names == ["01_Counts.parquet", "02_Shape.parquet"]
+    assert shape["Result"].tolist() == [results[1]["df"]]
@@ -0,0 +1,112 @@
+"""Tests of the group-by analysis and its spilling aggregation."""
+
+import pandas as pd
+import pytest
+
+from eda.analysis.group_by import GroupBy, GroupBySpec
+from eda.engines import DuckDBEngine
+
+from .helpers import assert_same_result, read_frame, sample_csv, split
+
+FRAME = read_frame(sample_csv(rows=5000))
+
+SPEC = GroupBySpec(
+    keys=("g", "flag"),
+    aggregations=(
+        ("x", "count"),
+        ("x", "mean"),
+        ("k", "sum"),
+        ("x", "min"),
+        ("x", "max"),
+    ),
+)
+
+# One group per row, to force spilling with a small group budget.
+WIDE_SPEC = GroupBySpec(keys=("id",), aggregations=(("x", "sum"), ("k", "max")))
+
+
+def pandas_group_by(data: pd.DataFrame, spec: GroupBySpec) -> pd.DataFrame:
+    """Aggregate with pandas, keeping missing keys as groups."""
+
+    groups = data.groupby(list(spec.keys), dropna=False)
+    result = {"size": groups.size()}
+
+    for column, function in spec.aggregations:
+        result[f"{function}({column})"] = groups[column].agg(function)
+
+    return pd.DataFrame(result).reset_index()
+
+
+@pytest.fixture
+def spilling(monkeypatch):
+    """Spill once a partial aggregate holds more than 100 groups."""
+
+    monkeypatch.setattr("eda.analysis.group_by.GROUP_BY_MAX_GROUPS", 100)
+
+
+@pytest.mark.parametrize("spec", [SPEC, WIDE_SPEC])
+def test_compute_matches_pandas(spec):
+    assert_same_result(pandas_group_by(FRAME, spec), GroupBy.compute(FRAME, spec))
+
+
+@pytest.mark.parametrize("spec", [SPEC, WIDE_SPEC])
+def test_streamed_group_by_matches_compute(spec):
+    chunks = split(FRAME, 700, 2100, 4000)
+
+    assert_same_result(
+        GroupBy.compute(FRAME, spec), GroupBy.compute_chunks(chunks, spec)
+    )
+
+
+@pytest.mark.usefixtures("spilling")
+def test_spilled_group_by_matches_compute():
+    chunks = split(FRAME, 700, 2100, 4000)
+    state = GroupBy.init(WIDE_SPEC)
+
+    for chunk in chunks:
+        state = GroupBy.update(state, chunk, WIDE_SPEC)
+
+    assert state.spill is not None
+    assert_same_result(
+        GroupBy.compute(FRAME, WIDE_SPEC), GroupBy.finalize(state, WIDE_SPEC)
+    )
+
+
+@pytest.mark.usefixtures("spilling")
+def test_spilled_merge_is_associative():
+    expected = GroupBy.compute(FRAME, WIDE_SPEC)
+
+    def states():
+        return [
+            GroupBy.update(GroupBy.init(), part, WIDE_SPEC)
+            for part in split(FRAME, 1500, 3000)
+        ]
+
+    a, b, c = states()
+    left = GroupBy.merge(GroupBy.merge(a, b, WIDE_SPEC), c, WIDE_SPEC)
+    a, b, c = states()
+    right = GroupBy.merge(a, GroupBy.merge(b, c, WIDE_SPEC), WIDE_SPEC)
+
+    assert_same_result(expected, GroupBy.finalize(left, WIDE_SPEC))
+    assert_same_result(expected, GroupBy.finalize(right, WIDE_SPEC))
+
+
+@pytest.mark.skipif(not DuckDBEngine.available(), reason="DuckDB is not installed")
+def test_compute_relation_matches_compute():
+    import duckdb  # type: ignore[import-not-found]
+
+    spec = GroupBySpec(keys=("k", "flag"), aggregations=SPEC.aggregations)
+
+    with duckdb.connect() as connection:
+        result = GroupBy.compute_relation(connection.from_df(FRAME), spec)
+
+    assert_same_result(GroupBy.compute(FRAME, spec), result)
+
+
+def test_spec_validation():
+    with pytest.raises(ValueError):
+        GroupBySpec(keys=())
+    with pytest.raises(ValueError):
+        GroupBySpec(keys=("g",), aggregations=(("x", "median"),))
+    with pytest.raises(TypeError):
+        GroupBy.compute(FRAME, None)
@@ -0,0 +1,56 @@
+"""Tests of the single-pass histogram analysis."""
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from eda.analysis.histogram import HISTOGRAM_COLUMNS, Histogram
+
+from .helpers import assert_same_result, read_frame, sample_csv, split
+
+FRAME = read_frame(sample_csv(rows=20_000))
+
+
+@pytest.mark.parametrize("bins", [4, 10, 50])
+def test_bins_partition_each_column_range(bins):
+    result = Histogram.compute(FRAME, bins)
+
+    assert list(result.columns) == HISTOGRAM_COLUMNS
+    assert list(result["Column"].unique()) == ["id", "x", "k"]
+
+    for column, table in result.groupby("Column", sort=False):
+        values = FRAME[column].dropna().to_numpy(dtype="float64")
+        lower, upper = table["Lower"].to_numpy(), table["Upper"].to_numpy()
+
+        assert len(table) <= bins
+        assert lower[0] == values.min() and upper[-1] == values.max()
+        np.testing.assert_array_equal(upper[:-1], lower[1:])
+
+        inside = (values[:, None] >= lower) & (values[:, None] < upper)
+        inside[:, -1] |= values == upper[-1]
+        np.testing.assert_array_equal(table["Count"], inside.sum(axis=0))
+
+
+def test_missing_and_infinite_values_are_not_counted():
+    data = pd.DataFrame({"v": [1.0, np.nan, np.inf, -np.inf, 3.0], "empty": np.nan})
+    result = Histogram.compute(data, 2)
+
+    assert set(result["Column"]) == {"v"}
+    assert result["Count"].sum() == 2
+
+
+@pytest.mark.parametrize("bins", [None, 7])
+def test_streamed_histogram_matches_compute(bins):
+    chunks = split(FRAME, 10, 5000, 12_000)
+
+    assert_same_result(
+        Histogram.compute(FRAME, bins), Histogram.compute_chunks(chunks, bins)
+    )
+
+
+def test_estimate_scales_counts_to_the_population():
+    sample = FRAME.iloc[::4]
+    estimate = Histogram.estimate(sample, len(FRAME), 5)
+    exact = Histogram.compute(sample, 5)
+
+    np.testing.assert_array_equal(estimate["Count"], exact["Count"] * 4)
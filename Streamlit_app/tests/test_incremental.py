@@ -0,0 +1,82 @@
+"""Tests of incremental refresh for uploads with appended rows."""
+
+import io
+
+import pytest
+
+from eda import incremental
+from eda.analysis.mean import Mean
+from eda.analysis.missing import Missing
+from eda.analysis.shape import Shape
+from eda.analysis.unique import Unique
+from eda.analysis.value_counts import ValueCounts
+from eda.incremental import STATE_CACHE, refresh
+from eda.ingest import ChunkedFrame, content_hash
+
+from .helpers import assert_same_result, read_frame, sample_csv
+
+CSV = sample_csv()
+LINES = CSV.splitlines(keepends=True)
+EARLIER = b"".join(LINES[:601])
+
+REFRESHED = [
+    (Mean, None),
+    (Missing, None),
+    (Shape, None),
+    (Unique, None),
+    (ValueCounts, "g"),
+]
+
+
+@pytest.fixture(autouse=True)
+def forget_versions():
+    """Start every test without kept partial aggregates."""
+
+    def clear():
+        STATE_CACHE.clear()
+        incremental._versions.clear()
+        incremental._prefixes.clear()
+
+    clear()
+    yield
+    clear()
+
+
+def run(analysis_cls, csv, n):
+    """Refresh an analysis over CSV text, keyed by its content hash."""
+
+    source = io.BytesIO(csv)
+
+    return refresh(analysis_cls, ChunkedFrame(source), n, content_hash(source))
+
+
+@pytest.mark.parametrize("analysis_cls, n", REFRESHED)
+def test_appended_rows_refresh_to_the_full_result(analysis_cls, n):
+    _, origin = run(analysis_cls, EARLIER, n)
+    result, refreshed = run(analysis_cls, CSV, n)
+
+    assert origin == "chunked"
+    assert refreshed == "incremental"
+    assert_same_result(analysis_cls.compute(read_frame(CSV), n), result)
+
+
+def test_unrelated_uploads_are_aggregated_whole():
+    run(Mean, EARLIER, None)
+    changed = LINES[0] + b"".join(reversed(LINES[1:]))
+
+    result, origin = run(Mean, changed, None)
+
+    assert origin == "chunked"
+    assert_same_result(Mean.compute(read_frame(changed)), result)
+
+
+def test_prefix_must_end_at_a_line_break():
+    run(Missing, EARLIER[:-5], None)
+
+    _, origin = run(Missing, CSV, None)
+
+    assert origin == "chunked"
+
+
+def test_in_memory_frames_are_not_refreshed():
+    assert refresh(Mean, read_frame(CSV), None, "key") is None
@@ -0,0 +1,102 @@
+"""Tests of the partial-aggregate contract of mergeable analyses."""
+
+import pytest
+
+from eda.analysis.correlation import PearsonCorrelation
+from eda.analysis.data_types import DataTypes
+from eda.analysis.describe import ApproxDescribe, Describe
+from eda.analysis.group_by import GroupBy, GroupBySpec
+from eda.analysis.head import Head
+from eda.analysis.histogram import Histogram
+from eda.analysis.mean import Mean
+from eda.analysis.missing import Missing
+from eda.analysis.shape import Shape
+from eda.analysis.unique import ApproxUnique, Unique
+from eda.analysis.value_counts import ApproxValueCounts, ValueCounts
+from eda.config import QUANTILE_RANK_ERROR
+
+from .helpers import (
+    assert_same_describe,
+    assert_same_result,
+    read_frame,
+    sample_csv,
+    split,
+)
+
+FRAME = read_frame(sample_csv())
+
+MERGEABLE = [
+    (Head, (5,)),
+    (Shape, ()),
+    (Mean, ()),
+    (Missing, ()),
+    (DataTypes, ()),
+    (Unique, ()),
+    (ValueCounts, ("g",)),
+    (ApproxUnique, ()),
+    (ApproxValueCounts, ("g",)),
+    (PearsonCorrelation, (None,)),
+    (PearsonCorrelation, (2,)),
+    (Histogram, (None,)),
+    (Histogram, (5,)),
+    (GroupBy, (GroupBySpec(("g",), (("x", "mean"), ("k", "sum"))),)),
+]
+
+# Analyses whose quartiles come from sketches, which merge within their
+# rank error rather than exactly.
+SKETCHED = [
+    (Describe, (), QUANTILE_RANK_ERROR),
+    (ApproxDescribe, (0.05,), 0.05),
+]
+
+
+def partial_states(analysis_cls, args):
+    """Fold three partitions of the sample into separate states."""
+
+    return [
+        analysis_cls.update(analysis_cls.init(*args), part, *args)
+        for part in split(FRAME, 300, 650)
+    ]
+
+
+def groupings(analysis_cls, args):
+    """Finalize ``(a + b) + c`` and ``a + (b + c)`` of the same states."""
+
+    a, b, c = partial_states(analysis_cls, args)
+    merge = analysis_cls.merge
+    left = merge(merge(a, b, *args), c, *args)
+    right = merge(a, merge(b, c, *args), *args)
+
+    return analysis_cls.finalize(left, *args), analysis_cls.finalize(right, *args)
+
+
+@pytest.mark.parametrize("analysis_cls, args", MERGEABLE)
+def test_merge_is_associative(analysis_cls, args):
+    left, right = groupings(analysis_cls, args)
+
+    assert_same_result(left, right)
+    assert_same_result(analysis_cls.compute_chunks([FRAME], *args), left)
+
+
+@pytest.mark.parametrize("analysis_cls, args", MERGEABLE)
+def test_empty_state_is_the_merge_identity(analysis_cls, args):
+    state = partial_states(analysis_cls, args)[0]
+    expected = analysis_cls.finalize(state, *args)
+    empty = analysis_cls.init(*args)
+
+    merge, finalize = analysis_cls.merge, analysis_cls.finalize
+
+    assert_same_result(expected, finalize(merge(empty, state, *args), *args))
+    assert_same_result(expected, finalize(merge(state, empty, *args), *args))
+
+
+@pytest.mark.parametrize("analysis_cls, args, rank_error", SKETCHED)
+def test_sketched_merge_is_associative_within_rank_error(
+    analysis_cls, args, rank_error
+):
+    left, right = groupings(analysis_cls, args)
+    exact = Describe.compute(FRAME)
+
+    for result in (left, right):
+        result = result.drop(index="rank error", errors="ignore")
+        assert_same_describe(exact, result, FRAME, rank_error)
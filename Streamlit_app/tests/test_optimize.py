@@ -0,0 +1,61 @@
+"""Tests of load-time dtype optimisation."""
+
+import io
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from eda.analysis.data_types import DataTypes
+from eda.analysis.describe import Describe
+from eda.analysis.mean import Mean
+from eda.analysis.missing import Missing
+from eda.analysis.unique import Unique
+from eda.analysis.value_counts import ValueCounts
+from eda.optimize import MEMORY_BEFORE_ATTR, read_optimized
+
+from .helpers import assert_same_result, read_frame, sample_csv
+
+CSV = sample_csv()
+
+
+def optimized(csv: bytes) -> pd.DataFrame:
+    """Parse CSV text with compact dtypes."""
+
+    return read_optimized(io.BytesIO(csv))
+
+
+def test_optimized_frame_holds_the_same_values():
+    default, compact = read_frame(CSV), optimized(CSV)
+
+    assert compact["g"].dtype == "category"
+    assert compact["k"].dtype == np.int8
+    assert compact["x"].dtype == np.float64
+    pd.testing.assert_frame_equal(compact.astype(default.dtypes.to_dict()), default)
+
+
+def test_dates_are_parsed_with_the_inferred_format():
+    csv = b"day,value\n2024-01-31,1\n2024-02-29,2\n,3\n"
+    compact = optimized(csv)
+
+    assert pd.api.types.is_datetime64_dtype(compact["day"])
+    assert compact["day"].iloc[1] == pd.Timestamp("2024-02-29")
+    assert compact["day"].isna().iloc[2]
+
+
+def test_memory_before_optimisation_is_reported():
+    compact = optimized(CSV)
+    types = DataTypes.compute(compact).set_index("index")
+
+    assert set(compact.attrs[MEMORY_BEFORE_ATTR]) == set(compact.columns)
+    assert types.loc["Total", "Saved (bytes)"] > 0
+
+
+@pytest.mark.parametrize(
+    "analysis_cls, args",
+    [(Mean, ()), (Describe, ()), (Missing, ()), (Unique, ()), (ValueCounts, ("k",))],
+)
+def test_analyses_match_on_optimized_frames(analysis_cls, args):
+    expected = analysis_cls.compute(read_frame(CSV), *args)
+
+    assert_same_result(expected, analysis_cls.compute(optimized(CSV), *args))
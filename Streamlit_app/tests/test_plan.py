@@ -0,0 +1,78 @@
+"""Tests of the lazy plan of shared intermediates."""
+
+import pytest
+
+from eda.analysis.describe import Describe
+from eda.analysis.mean import Mean
+from eda.analysis.missing import Missing
+from eda.analysis.unique import Unique
+from eda.analysis.value_counts import ValueCounts
+from eda.plan import PLAN_CACHE, Plan, plan_for
+
+from .helpers import assert_same_result, read_frame, sample_csv, stream
+
+CSV = sample_csv()
+FRAME = read_frame(CSV)
+
+
+@pytest.fixture(autouse=True)
+def empty_plan_cache():
+    """Start every test without memoised intermediates."""
+
+    PLAN_CACHE.clear()
+    yield
+    PLAN_CACHE.clear()
+
+
+@pytest.mark.parametrize(
+    "analysis_cls, n",
+    [
+        (Mean, None),
+        (Describe, None),
+        (Missing, None),
+        (Unique, None),
+        (ValueCounts, "g"),
+        (ValueCounts, "k"),
+    ],
+)
+def test_compute_plan_matches_compute(analysis_cls, n):
+    plan = Plan("key", lambda: FRAME)
+
+    assert_same_result(
+        analysis_cls.compute(FRAME, n), analysis_cls.compute_plan(plan, n)
+    )
+
+
+def test_intermediates_are_shared_between_plans():
+    loads = []
+
+    def load():
+        loads.append(1)
+        return FRAME
+
+    Missing.compute_plan(Plan("key", load), None)
+    Unique.compute_plan(Plan("key", load), None)
+    cached = len(PLAN_CACHE)
+
+    Missing.compute_plan(Plan("key", load), None)
+    Unique.compute_plan(Plan("key", load), None)
+
+    assert len(PLAN_CACHE) == cached
+    assert len(loads) == 2
+
+
+def test_versions_do_not_share_intermediates():
+    other = FRAME.iloc[:10]
+
+    Missing.compute_plan(Plan("old", lambda: FRAME), None)
+    result = Missing.compute_plan(Plan("new", lambda: other), None)
+
+    assert_same_result(Missing.compute(other), result)
+
+
+def test_plans_only_cover_versioned_in_memory_data(monkeypatch):
+    monkeypatch.setattr("eda.engines.ENGINE", "auto")
+
+    assert plan_for(FRAME, None) is None
+    assert plan_for(stream(CSV), "key") is None
+    assert plan_for(FRAME, "key").frame is FRAME
@@ -0,0 +1,66 @@
+"""Tests of the fused column profile and the analyses derived from it."""
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from eda.analysis.describe import Describe
+from eda.analysis.mean import Mean
+from eda.analysis.missing import Missing
+from eda.analysis.profile import FLOAT_EXACT_INTEGER, Profile
+from eda.analysis.unique import Unique
+from eda.config import QUANTILE_RANK_ERROR
+
+from .helpers import (
+    assert_quartiles_within,
+    assert_same_result,
+    read_frame,
+    sample_csv,
+    split,
+    stream,
+)
+
+CSV = sample_csv()
+FRAME = read_frame(CSV)
+QUARTILES = ["25%", "50%", "75%"]
+
+
+def assert_same_profile(expected: pd.DataFrame, actual: pd.DataFrame) -> None:
+    """Compare profiles exactly, except for quartiles read off sketches."""
+
+    assert_same_result(expected.drop(columns=QUARTILES), actual.drop(columns=QUARTILES))
+
+    numeric = actual[actual["Numeric"]].set_index("Column")[QUARTILES].T
+    assert_quartiles_within(numeric, FRAME, QUANTILE_RANK_ERROR)
+
+
+@pytest.mark.parametrize("analysis_cls", [Mean, Describe, Missing, Unique])
+def test_from_profile_matches_compute(analysis_cls):
+    profile = Profile.compute(FRAME)
+
+    assert_same_result(
+        analysis_cls.compute(FRAME, None), analysis_cls.from_profile(profile, None)
+    )
+
+
+def test_streamed_profile_matches_compute():
+    assert_same_profile(Profile.compute(FRAME), Profile.compute_chunks(stream(CSV)))
+
+
+def test_profile_merge_is_associative():
+    a, b, c = (Profile.update(Profile.init(), part) for part in split(FRAME, 300, 650))
+    expected = Profile.compute(FRAME)
+
+    assert_same_profile(
+        expected, Profile.finalize(Profile.merge(Profile.merge(a, b), c))
+    )
+    assert_same_profile(
+        expected, Profile.finalize(Profile.merge(a, Profile.merge(b, c)))
+    )
+
+
+def test_large_integers_are_counted_exactly():
+    data = pd.DataFrame({"big": FLOAT_EXACT_INTEGER + np.arange(4, dtype="int64")})
+
+    assert Profile.compute(data).loc[0, "Unique"] == 4
+    assert_same_result(Unique.compute(data), Unique.from_profile(Profile.compute(data)))
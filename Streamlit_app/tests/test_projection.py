@@ -0,0 +1,50 @@
+"""Tests that analyses read only the columns they declare."""
+
+import pytest
+
+from eda.analysis.correlation import PearsonCorrelation, SpearmanCorrelation
+from eda.analysis.describe import ApproxDescribe, Describe
+from eda.analysis.group_by import GroupBy, GroupBySpec
+from eda.analysis.histogram import Histogram
+from eda.analysis.mean import Mean
+from eda.analysis.value_counts import ApproxValueCounts, ValueCounts
+
+from .helpers import assert_same_result, read_frame, sample_csv, stream
+
+CSV = sample_csv()
+FRAME = read_frame(CSV)
+
+PROJECTED = [
+    (Mean, (None,)),
+    (Describe, (None,)),
+    (ValueCounts, ("g",)),
+    (ApproxValueCounts, ("g",)),
+    (ApproxDescribe, (None,)),
+    (PearsonCorrelation, (None,)),
+    (SpearmanCorrelation, (None,)),
+    (Histogram, (None,)),
+    (GroupBy, (GroupBySpec(("g",), (("x", "sum"),)),)),
+]
+
+
+@pytest.mark.parametrize("analysis_cls, args", PROJECTED)
+def test_projected_frame_gives_the_same_result(analysis_cls, args):
+    columns = analysis_cls.required_columns(FRAME.dtypes, *args)
+
+    assert columns is not None
+    assert set(columns) < set(FRAME.columns)
+    assert_same_result(
+        analysis_cls.compute(FRAME, *args),
+        analysis_cls.compute(FRAME[columns], *args),
+    )
+
+
+@pytest.mark.parametrize("analysis_cls, args", PROJECTED)
+def test_projected_stream_gives_the_same_result(analysis_cls, args):
+    frame = stream(CSV)
+    columns = analysis_cls.required_columns(frame.dtypes, *args)
+
+    assert_same_result(
+        analysis_cls.compute_chunks(frame, *args),
+        analysis_cls.compute_chunks(frame.project(columns), *args),
+    )
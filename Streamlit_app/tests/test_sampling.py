@@ -0,0 +1,76 @@
+"""Tests of sampled estimates and their confidence intervals."""
+
+import numpy as np
+import pytest
+
+from eda.analysis.describe import Describe
+from eda.analysis.mean import Mean
+from eda.analysis.missing import Missing
+from eda.analysis.value_counts import ValueCounts
+from eda.sampling import sample_frame
+
+from .helpers import assert_same_result, read_frame, sample_csv
+
+FRAME = read_frame(sample_csv(rows=20_000))
+
+
+def half_sample(seed: int = 0):
+    """Draw a uniform sample of half the rows."""
+
+    return sample_frame(FRAME, len(FRAME) // 2, np.random.default_rng(seed))
+
+
+@pytest.mark.parametrize(
+    "analysis_cls, n", [(Mean, None), (Missing, None), (Describe, None)]
+)
+def test_estimate_from_every_row_is_exact(analysis_cls, n):
+    expected = analysis_cls.compute(FRAME, n)
+    estimate = analysis_cls.estimate(FRAME, len(FRAME), n)
+
+    assert_same_result(expected, estimate[expected.columns])
+
+
+def test_value_counts_estimate_from_every_row_is_exact():
+    expected = ValueCounts.compute(FRAME, "g")
+
+    assert_same_result(expected, ValueCounts.estimate(FRAME, len(FRAME), "g"))
+
+
+def test_confidence_intervals_collapse_for_every_row():
+    estimate = Mean.estimate(FRAME, len(FRAME), None)
+
+    assert (estimate["CI low"] == estimate["Mean"]).all()
+    assert (estimate["CI high"] == estimate["Mean"]).all()
+
+
+def test_sample_frame_keeps_small_frames_whole():
+    sample = sample_frame(FRAME, len(FRAME), np.random.default_rng(0))
+
+    assert sample.exact
+    assert sample.frame is FRAME
+
+
+def test_counts_scale_to_the_population():
+    sample = half_sample()
+    counts = ValueCounts.estimate(sample.frame, sample.population_rows, "g")
+    scale = sample.population_rows / len(sample.frame)
+
+    assert not sample.exact
+    assert counts["Count"].sum() == pytest.approx(
+        sample.frame["g"].count() * scale, abs=len(counts)
+    )
+
+
+def test_intervals_cover_the_population_values():
+    sample = half_sample()
+    means = Mean.estimate(sample.frame, sample.population_rows, None)
+    missing = Missing.estimate(sample.frame, sample.population_rows, None)
+    missing = missing.set_index("index")
+
+    exact_means = Mean.compute(FRAME)["Mean"]
+    exact_rates = Missing.compute(FRAME).set_index("index")["Missing"] / len(FRAME)
+
+    assert (means["CI low"] <= exact_means).all()
+    assert (exact_means <= means["CI high"]).all()
+    assert (missing["CI low %"] <= 100 * exact_rates).all()
+    assert (100 * exact_rates <= missing["CI high %"]).all()
@@ -0,0 +1,142 @@
+"""Tests of the mergeable sketches and the approximate analyses."""
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from eda.analysis.describe import ApproxDescribe, Describe
+from eda.analysis.unique import ApproxUnique, Unique
+from eda.analysis.value_counts import ApproxValueCounts, ValueCounts
+from eda.sketches import HyperLogLog, KLLSketch, SpaceSaving, kll_k_for_error
+
+from .helpers import (
+    assert_same_describe,
+    assert_same_result,
+    read_frame,
+    sample_csv,
+    stream,
+)
+
+CSV = sample_csv()
+FRAME = read_frame(CSV)
+QUANTILES = [0.01, 0.25, 0.5, 0.75, 0.99]
+
+
+def test_hyperloglog_estimate_is_within_three_standard_errors():
+    sketch = HyperLogLog()
+    sketch.update(pd.Series(np.arange(50_000)))
+
+    assert abs(sketch.estimate() / 50_000 - 1) <= 3 * sketch.relative_error
+
+
+def test_hyperloglog_merge_equals_sketch_of_the_union():
+    left, right, union = HyperLogLog(), HyperLogLog(), HyperLogLog()
+    left.update(pd.Series(np.arange(0, 6000)))
+    right.update(pd.Series(np.arange(4000, 10_000)))
+    union.update(pd.Series(np.arange(0, 10_000)))
+
+    np.testing.assert_array_equal(left.merge(right).registers, union.registers)
+
+
+def test_space_saving_bounds_every_count():
+    rng = np.random.default_rng(0)
+    values = pd.Series(rng.zipf(1.5, 20_000) % 500)
+    exact = values.value_counts()
+
+    summary = SpaceSaving(capacity=32)
+    for start in range(0, len(values), 1000):
+        summary.update(values.iloc[start : start + 1000])
+
+    tracked = exact.reindex(summary.counts.index)
+    assert (summary.counts >= tracked).all()
+    assert (summary.counts - summary.errors <= tracked).all()
+    assert (exact.drop(summary.counts.index) <= summary.floor).all()
+
+
+def test_approx_unique_is_close_to_unique():
+    exact = Unique.compute(FRAME).set_index("index")["Value"]
+    approx = ApproxUnique.compute(FRAME).set_index("index")
+
+    error = (approx["Value"] / exact - 1).abs()
+    assert (error <= 3 * approx["Relative error"]).all()
+
+
+def test_approx_value_counts_are_exact_below_capacity():
+    exact = ValueCounts.compute(FRAME, "k").sort_values("k", ignore_index=True)
+    approx = ApproxValueCounts.compute(FRAME, "k")
+
+    assert (approx["Max overcount"] == 0).all()
+    assert_same_result(
+        exact,
+        approx.drop(columns="Max overcount").sort_values("k", ignore_index=True),
+    )
+
+
+def rank_errors(values: np.ndarray, estimates: np.ndarray) -> np.ndarray:
+    """Distance of each estimate's rank range from its target quantile."""
+
+    ordered = np.sort(values)
+    low = np.searchsorted(ordered, estimates, side="left") / len(values)
+    high = np.searchsorted(ordered, estimates, side="right") / len(values)
+    targets = np.array(QUANTILES)
+
+    return np.maximum(low - targets, targets - high).clip(min=0)
+
+
+def test_kll_is_exact_below_its_capacity():
+    values = np.random.default_rng(0).normal(size=150)
+    sketch = KLLSketch(k=200)
+    sketch.update(values)
+
+    np.testing.assert_allclose(
+        sketch.quantiles(QUANTILES), np.quantile(values, QUANTILES)
+    )
+
+
+@pytest.mark.parametrize("rank_error", [0.05, 0.01])
+def test_kll_quantiles_are_within_rank_error(rank_error):
+    values = np.random.default_rng(1).lognormal(size=100_000)
+    sketch = KLLSketch(kll_k_for_error(rank_error))
+
+    for start in range(0, len(values), 7_000):
+        sketch.update(values[start : start + 7_000])
+
+    assert sketch.n == len(values)
+    assert sketch.size < len(values) // 10
+    assert (rank_errors(values, sketch.quantiles(QUANTILES)) <= rank_error).all()
+
+
+def test_kll_merge_is_within_rank_error():
+    values = np.random.default_rng(2).normal(size=60_000)
+    k = kll_k_for_error(0.01)
+    parts = [KLLSketch(k, seed=seed) for seed in range(3)]
+
+    for sketch, part in zip(parts, np.array_split(values, 3)):
+        sketch.update(part)
+
+    merged = parts[0].merge(parts[1]).merge(parts[2])
+
+    assert merged.n == len(values)
+    assert (rank_errors(values, merged.quantiles(QUANTILES)) <= 0.01).all()
+
+
+def test_kll_ignores_nan_and_rejects_bad_parameters():
+    sketch = KLLSketch()
+    sketch.update(np.array([np.nan, 1.0, np.nan]))
+
+    assert sketch.n == 1
+    with pytest.raises(ValueError):
+        kll_k_for_error(0)
+    with pytest.raises(ValueError):
+        KLLSketch(k=1)
+
+
+@pytest.mark.parametrize("rank_error", [None, 0.05])
+def test_approx_describe_matches_describe_within_rank_error(rank_error):
+    result = ApproxDescribe.compute_chunks(stream(CSV), rank_error)
+    bound = ApproxDescribe.rank_error(rank_error)
+
+    assert (result.loc["rank error"] == bound).all()
+    assert_same_describe(
+        Describe.compute(FRAME), result.drop(index="rank error"), FRAME, bound
+    )
@@ -0,0 +1,89 @@
+"""Tests that streamed analyses match their in-memory results."""
+
+import pandas as pd
+import pytest
+
+from eda.analysis.correlation import PearsonCorrelation, SpearmanCorrelation
+from eda.analysis.data_types import DataTypes
+from eda.analysis.describe import Describe
+from eda.analysis.group_by import GroupBy, GroupBySpec
+from eda.analysis.head import Head
+from eda.analysis.histogram import Histogram
+from eda.analysis.mean import Mean
+from eda.analysis.missing import Missing
+from eda.analysis.shape import Shape
+from eda.analysis.unique import ApproxUnique, Unique
+from eda.analysis.value_counts import ApproxValueCounts, ValueCounts
+from eda.config import QUANTILE_RANK_ERROR
+
+from .helpers import (
+    CHUNK_ROWS,
+    assert_same_describe,
+    assert_same_result,
+    read_frame,
+    sample_csv,
+    stream,
+)
+
+CSV = sample_csv()
+
+STREAMED = [
+    (Head, (5,)),
+    (Head, (CHUNK_ROWS + 3,)),
+    (Shape, ()),
+    (Mean, ()),
+    (Missing, ()),
+    (Unique, ()),
+    (ValueCounts, ("g",)),
+    (ValueCounts, ("k",)),
+    (ApproxUnique, ()),
+    (ApproxValueCounts, ("g",)),
+    (PearsonCorrelation, (None,)),
+    (SpearmanCorrelation, (2,)),
+    (Histogram, (None,)),
+    (GroupBy, (GroupBySpec(("g", "flag"), (("x", "max"),)),)),
+]
+
+
+def test_chunks_concatenate_to_the_parsed_frame():
+    chunks = list(stream(CSV))
+
+    assert all(len(chunk) <= CHUNK_ROWS for chunk in chunks)
+    pd.testing.assert_frame_equal(pd.concat(chunks, ignore_index=True), read_frame(CSV))
+
+
+def test_chunked_frame_is_reiterable():
+    frame = stream(CSV)
+
+    assert [len(chunk) for chunk in frame] == [len(chunk) for chunk in frame]
+
+
+def test_project_parses_only_the_given_columns():
+    frame = stream(CSV).project(["x", "g"])
+
+    assert all(list(chunk.columns) == ["x", "g"] for chunk in frame)
+
+
+@pytest.mark.parametrize("analysis_cls, args", STREAMED)
+def test_compute_chunks_matches_compute(analysis_cls, args):
+    expected = analysis_cls.compute(read_frame(CSV), *args)
+
+    assert_same_result(expected, analysis_cls.compute_chunks(stream(CSV), *args))
+
+
+def test_streamed_data_types_match_compute():
+    expected = DataTypes.compute(read_frame(CSV))
+    expected = expected[["index", "Value"]].iloc[:-1]
+
+    assert_same_result(expected, DataTypes.compute_chunks(stream(CSV)))
+
+
+def test_streamed_describe_matches_compute():
+    frame = read_frame(CSV)
+
+    assert_same_describe(
+        Describe.compute(frame),
+        Describe.compute_chunks(stream(CSV)),
+        frame,
+        QUANTILE_RANK_ERROR,
+    )